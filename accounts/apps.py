@@ -1,7 +1,28 @@
 # -*- coding: utf-8 -*-
 from django.apps import AppConfig
+from django.conf import settings
+from django.db.models.signals import post_migrate, post_save, pre_delete
 
 
 class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "accounts"
+
+    def ready(self):
+        # 🌟 원장 샤딩 (accounts/sharding.py): 새 사용자 배치, 삭제 시 샤드 정리,
+        # 마이그레이션 후 샤드별 id 시퀀스 구간 설정
+        from . import sharding
+
+        post_save.connect(
+            sharding.place_new_user,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid="ledger_shard_place",
+        )
+        pre_delete.connect(
+            sharding.purge_deleted_user,
+            sender=settings.AUTH_USER_MODEL,
+            dispatch_uid="ledger_shard_purge",
+        )
+        post_migrate.connect(
+            sharding.on_post_migrate, sender=self, dispatch_uid="ledger_shard_sequences"
+        )
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+특정 시점 잔액 조회
+
+각 Transaction의 post_transaction_amount가 그 시점의 잔액이므로,
+(account, transaction_timestamp) 인덱스 탐색 한 번으로 시점 잔액을 구합니다.
+거래 내역이 아카이빙되었거나 체크포인트 이후 거래가 없으면
+(account, as_of) 인덱스로 가장 가까운 BalanceCheckpoint를 사용합니다.
+여러 (계좌, 시점) 쌍도 LATERAL JOIN 한 문장으로 처리합니다.
+"""
+
+from collections import namedtuple
+
+from django.db import connection, connections, router
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from .models import Account, BalanceCheckpoint, Transaction
+
+BalanceQuery = namedtuple("BalanceQuery", ["account_id", "at"])
+
+_BALANCES_SQL = """
+SELECT q.idx,
+       a.balance,
+       t.transaction_timestamp, t.post_transaction_amount,
+       c.as_of, c.balance,
+       f.post_transaction_amount - CASE f.transaction_type
+           WHEN 'WITHDRAW' THEN -f.transaction_amount
+           ELSE f.transaction_amount
+       END
+  FROM (VALUES {values}) AS q (idx, account_id, at)
+  JOIN {accounts} a ON a.id = q.account_id {owner}
+  LEFT JOIN LATERAL (
+        SELECT transaction_timestamp, post_transaction_amount
+          FROM {history}
+         WHERE account_id = q.account_id AND transaction_timestamp <= q.at
+         ORDER BY transaction_timestamp DESC, id DESC
+         LIMIT 1
+  ) t ON TRUE
+  LEFT JOIN LATERAL (
+        SELECT as_of, balance
+          FROM {checkpoints}
+         WHERE account_id = q.account_id AND as_of <= q.at
+         ORDER BY as_of DESC
+         LIMIT 1
+  ) c ON TRUE
+  LEFT JOIN LATERAL (
+        SELECT transaction_type, transaction_amount, post_transaction_amount
+          FROM {history}
+         WHERE account_id = q.account_id
+         ORDER BY transaction_timestamp ASC, id ASC
+         LIMIT 1
+  ) f ON t.transaction_timestamp IS NULL AND c.as_of IS NULL
+"""
+
+
+def balances_at(queries, user=None):
+    """
+    BalanceQuery 목록에 대해 같은 순서로 시점 잔액(Decimal) 목록을 반환합니다.
+
+    user가 주어지면 해당 사용자의 활성 계좌만 조회하며,
+    존재하지 않거나 조회할 수 없는 계좌는 None입니다.
+    """
+    if not queries:
+        return []
+
+    quote = connection.ops.quote_name
+    sql = _BALANCES_SQL.format(
+        values=", ".join(["(%s::int, %s::bigint, %s::timestamptz)"] * len(queries)),
+        owner="AND a.user_id = %s AND NOT a.is_deleted" if user else "",
+        accounts=quote(Account._meta.db_table),
+        history=quote(Transaction._meta.db_table),
+        checkpoints=quote(BalanceCheckpoint._meta.db_table),
+    )
+    params = []
+    for index, query in enumerate(queries):
+        params.extend([index, query.account_id, query.at])
+    if user:
+        params.append(user.pk)
+
+    results = [None] * len(queries)
+    with connections[router.db_for_read(Account)].cursor() as cursor:
+        cursor.execute(sql, params)
+        for row in cursor.fetchall():
+            index, current, tx_at, tx_balance, cp_at, cp_balance, opening = row
+            results[index] = _pick_balance(
+                current, tx_at, tx_balance, cp_at, cp_balance, opening
+            )
+    return results
+
+
+def _pick_balance(current, tx_at, tx_balance, cp_at, cp_balance, opening):
+    # 시점 이전의 가장 최근 거래와 체크포인트 중 더 최근 값을 사용
+    if tx_at is not None and (cp_at is None or tx_at > cp_at):
+        return tx_balance
+    if cp_at is not None:
+        return cp_balance
+    # 시점 이전 기록이 없으면 첫 거래 직전 잔액, 거래가 아예 없으면 현재 잔액
+    return opening if opening is not None else current
+
+
+def balance_at(account_id, at=None, user=None):
+    """계좌 하나의 시점 잔액 (at이 없으면 현재 시각)"""
+    return balances_at([BalanceQuery(account_id, at or timezone.now())], user)[0]
+
+
+_CHECKPOINT_SQL = """
+INSERT INTO {checkpoints} (account_id, as_of, balance, created_at)
+SELECT a.id, t.transaction_timestamp, t.post_transaction_amount, %(now)s
+  FROM {accounts} a
+ CROSS JOIN LATERAL (
+        SELECT transaction_timestamp, post_transaction_amount
+          FROM {history}
+         WHERE account_id = a.id AND transaction_timestamp <= %(as_of)s
+         ORDER BY transaction_timestamp DESC, id DESC
+         LIMIT 1
+ ) t
+ WHERE a.id > %(after)s AND a.id <= %(until)s
+ON CONFLICT (account_id, as_of) DO UPDATE SET balance = EXCLUDED.balance
+"""
+
+
+def create_checkpoints(as_of=None, batch_size=1000):
+    """
+    모든 계좌에 대해 as_of 시점 직전 마지막 거래 기준 체크포인트를 기록합니다.
+
+    계좌 id 범위 단위로 나누어 실행하며, 계좌마다 인덱스 탐색 한 번으로 처리됩니다.
+    생성(또는 갱신)된 체크포인트 수를 반환합니다. 라우터가 고른 원장 샤드 하나
+    범위이므로 use_shard() 안에서 샤드마다 호출합니다.
+    """
+    as_of = as_of or timezone.now()
+    using = router.db_for_write(BalanceCheckpoint)
+    quote = connections[using].ops.quote_name
+    sql = _CHECKPOINT_SQL.format(
+        checkpoints=quote(BalanceCheckpoint._meta.db_table),
+        accounts=quote(Account._meta.db_table),
+        history=quote(Transaction._meta.db_table),
+    )
+    # 샤드의 id는 (순번 << 40)부터 시작하므로 0이 아니라 첫 계좌부터 나눕니다.
+    ids = Account.objects.using(using).aggregate(first=Min("pk"), last=Max("pk"))
+    last_id = ids["last"]
+    created = 0
+    after = (ids["first"] or 1) - 1
+    with connections[using].cursor() as cursor:
+        while last_id is not None and after < last_id:
+            until = after + batch_size
+            cursor.execute(
+                sql,
+                {"now": timezone.now(), "as_of": as_of, "after": after, "until": until},
+            )
+            created += cursor.rowcount
+            after = until
+    return created
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+선택지(은행 코드, 계좌 종류, 거래 타입/종류) 레지스트리
+
+선택지 상수와 함께 코드→이름 매핑(읽기 전용)과 유효성 검사용 frozenset을
+모듈 로드 시 한 번만 만들어 둡니다. get_FOO_display()는 호출할 때마다
+flatchoices로 dict를 새로 만들기 때문에, 목록 직렬화처럼 행마다 이름을
+조회하는 곳에서는 이 매핑을 사용합니다.
+"""
+
+import hashlib
+import json
+from types import MappingProxyType
+
+# =============================================================
+# ✨ 제공된 상수 목록 반영 ✨
+# =============================================================
+
+# 은행 코드 (BANK_CODES)
+BANK_CHOICES = (
+    ("000", "알수없음"),
+    ("001", "한국은행"),
+    ("002", "산업은행"),
+    ("003", "기업은행"),
+    ("004", "국민은행"),
+    ("005", "외환은행"),
+    ("007", "수협중앙회"),
+    ("008", "수출입은행"),
+    ("011", "농협은행"),
+    ("012", "지역농.축협"),
+    ("020", "우리은행"),
+    ("023", "SC은행"),
+    ("027", "한국씨티은행"),
+    ("031", "대구은행"),
+    ("032", "부산은행"),
+    ("034", "광주은행"),
+    ("035", "제주은행"),
+    ("037", "전북은행"),
+    ("039", "경남은행"),
+    ("045", "새마을금고중앙회"),
+    ("048", "신협중앙회"),
+    ("050", "상호저축은행"),
+    ("051", "중국은행"),
+    ("052", "모건스탠리은행"),
+    ("054", "HSBC은행"),
+    ("055", "도이치은행"),
+    ("056", "알비에스피엘씨은행"),
+    ("057", "제이피모간체이스은행"),
+    ("058", "미즈호은행"),
+    ("059", "미쓰비시도쿄UFJ은행"),
+    ("060", "BOA은행"),
+    ("061", "비엔피파리바은행"),
+    ("062", "중국공상은행"),
+    ("063", "중국은행"),
+    ("064", "산림조합중앙회"),
+    ("065", "대화은행"),
+    ("066", "교통은행"),
+    ("071", "우체국"),
+    ("076", "신용보증기금"),
+    ("077", "기술보증기금"),
+    ("081", "KEB하나은행"),
+    ("088", "신한은행"),
+    ("089", "케이뱅크"),
+    ("090", "카카오뱅크"),
+    ("092", "토스뱅크"),
+    ("093", "한국주택금융공사"),
+    ("094", "서울보증보험"),
+    ("095", "경찰청"),
+    ("096", "한국전자금융(주)"),
+    ("099", "금융결제원"),
+    ("102", "대신저축은행"),
+    ("103", "에스비아이저축은행"),
+    ("104", "에이치케이저축은행"),
+    ("105", "웰컴저축은행"),
+    ("106", "신한저축은행"),
+    ("209", "유안타증권"),
+    ("218", "현대증권"),
+    ("221", "골든브릿지투자증권"),
+    ("222", "한양증권"),
+    ("223", "리딩투자증권"),
+    ("224", "BNK투자증권"),
+    ("225", "IBK투자증권"),
+    ("226", "KB투자증권"),
+    ("227", "KTB투자증권"),
+    ("230", "미래에셋증권"),
+    ("238", "대우증권"),
+    ("240", "삼성증권"),
+    ("243", "한국투자증권"),
+    ("261", "교보증권"),
+    ("262", "하이투자증권"),
+    ("263", "HMC투자증권"),
+    ("264", "키움증권"),
+    ("265", "이베스트투자증권"),
+    ("266", "SK증권"),
+    ("267", "대신증권"),
+    ("269", "한화투자증권"),
+    ("270", "하나대투증권"),
+    ("278", "신한금융투자"),
+    ("279", "DB금융투자"),
+    ("280", "유진투자증권"),
+    ("287", "메리츠종합금융증권"),
+    ("289", "NH투자증권"),
+    ("290", "부국증권"),
+    ("291", "신영증권"),
+    ("292", "엘아이지투자증권"),
+    ("293", "한국증권금융"),
+    ("294", "펀드온라인코리아"),
+    ("295", "우리종합금융"),
+    ("296", "삼성선물"),
+    ("297", "외환선물"),
+    ("298", "현대선물"),
+)
+
+# 계좌 종류 (ACCOUNT_TYPE)
+ACCOUNT_TYPE_CHOICES = (
+    ("CHECKING", "입출금"),
+    ("SAVING", "적금"),
+    ("LOAN", "대출"),
+    ("PENSION", "연금"),
+    ("TRUST", "신탁"),
+    ("FOREIGN_CURRENCY", "외화"),
+    ("IRP", "퇴직연금"),
+    ("STOCK", "주식"),
+)
+
+# 거래 타입 (TRANSACTION_TYPE)
+TRANSACTION_TYPE_CHOICES = (
+    ("DEPOSIT", "입금"),
+    ("WITHDRAW", "출금"),
+)
+
+# 거래 종류 (TRANSACTION_METHOD)
+PAYMENT_METHOD_CHOICES = (  # 기존 모델 필드명(PAYMENT_METHOD)에 맞춤
+    ("ATM", "ATM 거래"),
+    ("TRANSFER", "계좌이체"),
+    ("AUTOMATIC_TRANSFER", "자동이체"),
+    ("CARD", "카드결제"),
+    ("INTEREST", "이자"),
+)
+
+# 분석(소비 집계) 기간 단위 (SpendingRollup.granularity)
+ROLLUP_GRANULARITY_CHOICES = (
+    ("DAY", "일별"),
+    ("WEEK", "주별"),
+    ("MONTH", "월별"),
+)
+
+# =============================================================
+
+
+# 🌟 코드 → 이름 매핑 (O(1) 조회, 읽기 전용)
+BANK_LABELS = MappingProxyType(dict(BANK_CHOICES))
+ACCOUNT_TYPE_LABELS = MappingProxyType(dict(ACCOUNT_TYPE_CHOICES))
+TRANSACTION_TYPE_LABELS = MappingProxyType(dict(TRANSACTION_TYPE_CHOICES))
+PAYMENT_METHOD_LABELS = MappingProxyType(dict(PAYMENT_METHOD_CHOICES))
+
+# 🌟 유효성 검사용 코드 집합
+BANK_CODES = frozenset(BANK_LABELS)
+ACCOUNT_TYPES = frozenset(ACCOUNT_TYPE_LABELS)
+TRANSACTION_TYPES = frozenset(TRANSACTION_TYPE_LABELS)
+PAYMENT_METHODS = frozenset(PAYMENT_METHOD_LABELS)
+ROLLUP_GRANULARITIES = frozenset(dict(ROLLUP_GRANULARITY_CHOICES))
+
+
+def _entries(choices):
+    return [{"code": code, "name": name} for code, name in choices]
+
+
+# 🌟 /banks/ 참조 데이터 응답 본문과 ETag (배포 단위로 불변이므로 미리 계산)
+REFERENCE_DATA_JSON = json.dumps(
+    {
+        "banks": _entries(BANK_CHOICES),
+        "account_types": _entries(ACCOUNT_TYPE_CHOICES),
+        "transaction_types": _entries(TRANSACTION_TYPE_CHOICES),
+        "transaction_methods": _entries(PAYMENT_METHOD_CHOICES),
+    },
+    ensure_ascii=False,
+    separators=(",", ":"),
+).encode("utf-8")
+REFERENCE_DATA_ETAG = f'"{hashlib.sha256(REFERENCE_DATA_JSON).hexdigest()[:32]}"'
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+거래 내역 스트리밍 내보내기 (CSV / NDJSON)
+
+모델 인스턴스를 만들지 않고 values_list() 튜플을 서버 측 커서로
+chunk_size 단위씩 읽어 바로 응답 스트림에 씁니다.
+행 수와 관계없이 메모리 사용량은 청크 하나 크기로 일정합니다.
+
+ASGI에서 StreamingHttpResponse는 동기 이터레이터를 sync_to_async(list)로 한 번에
+모아 보내므로, ASGI 요청에는 청크를 하나씩 sync_to_async로 읽는 비동기
+이터레이터를 넘깁니다. (export_response(asynchronous=True))
+"""
+
+import csv
+import json
+import zlib
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.http import StreamingHttpResponse
+
+from .choices import PAYMENT_METHOD_LABELS, TRANSACTION_TYPE_LABELS
+
+EXPORT_COLUMNS = [
+    ("id", "id"),
+    ("account_number", "account__account_number"),
+    ("transaction_timestamp", "transaction_timestamp"),
+    ("transaction_type", "transaction_type"),
+    ("transaction_method", "transaction_method"),
+    ("transaction_amount", "transaction_amount"),
+    ("post_transaction_amount", "post_transaction_amount"),
+    ("transaction_details", "transaction_details"),
+    ("created_at", "created_at"),
+]
+
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson; charset=utf-8",
+}
+
+# 응답에 쓰기 전에 모아 두는 바이트 수 (gzip 압축 단위이기도 함)
+FLUSH_BYTES = 64 * 1024
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 파일 흉내 객체"""
+
+    def write(self, value):
+        return value
+
+
+# 스프레드시트가 수식으로 실행하는 첫 글자 (CSV injection)
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_text(value):
+    """사용자가 입력한 문자열이 수식으로 열리지 않도록 앞에 '를 붙입니다."""
+    if value and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_lines(rows):
+    writer = csv.writer(_Echo())
+    # 엑셀에서 한글이 깨지지 않도록 BOM을 붙입니다.
+    yield "\ufeff" + writer.writerow(
+        [name for name, _ in EXPORT_COLUMNS]
+        + ["transaction_type_display", "transaction_method_display"]
+    )
+    for row in rows:
+        yield writer.writerow([
+            row[0],
+            _csv_text(row[1]),
+            row[2].isoformat(),
+            row[3],
+            row[4],
+            row[5],
+            row[6],
+            _csv_text(row[7]),
+            row[8].isoformat(),
+            TRANSACTION_TYPE_LABELS.get(row[3], row[3]),
+            PAYMENT_METHOD_LABELS.get(row[4], row[4]),
+        ])
+
+
+def _ndjson_lines(rows):
+    names = [name for name, _ in EXPORT_COLUMNS]
+    for row in rows:
+        record = dict(zip(names, row))
+        record["transaction_timestamp"] = row[2].isoformat()
+        record["created_at"] = row[8].isoformat()
+        record["transaction_amount"] = str(row[5])
+        record["post_transaction_amount"] = str(row[6])
+        record["transaction_type_display"] = TRANSACTION_TYPE_LABELS.get(row[3], row[3])
+        record["transaction_method_display"] = PAYMENT_METHOD_LABELS.get(row[4], row[4])
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def _stream_rows(queryset, chunk_size):
+    # 트랜잭션 안에서 읽어야 WITH HOLD가 아닌 일반 서버 측 커서가 사용되어
+    # 커밋 시 결과 전체가 DB 쪽에 물질화되지 않습니다.
+    with transaction.atomic(using=queryset.db):
+        yield from queryset.values_list(*[
+            lookup for _, lookup in EXPORT_COLUMNS
+        ]).iterator(chunk_size=chunk_size)
+
+
+def _buffered(lines, compress):
+    compressor = zlib.compressobj(wbits=31) if compress else None  # 31: gzip 헤더
+    buffer, size = [], 0
+    for line in lines:
+        data = line.encode("utf-8")
+        buffer.append(data)
+        size += len(data)
+        if size >= FLUSH_BYTES:
+            chunk = b"".join(buffer)
+            buffer, size = [], 0
+            chunk = compressor.compress(chunk) if compressor else chunk
+            if chunk:
+                yield chunk
+    chunk = b"".join(buffer)
+    if compressor:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
+
+
+async def _aiterate(chunks):
+    # 🌟 서버 측 커서와 트랜잭션이 한 연결에 있어야 하므로 모든 청크를 같은
+    # 동기 스레드(thread_sensitive)에서 읽습니다.
+    read = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (chunk := await read(chunks, None)) is not None:
+            yield chunk
+    finally:
+        # 클라이언트가 끊어도 커서와 트랜잭션을 닫습니다.
+        await sync_to_async(chunks.close, thread_sensitive=True)()
+
+
+def export_response(
+    queryset, file_format, compress=False, chunk_size=2000, asynchronous=False
+):
+    """
+    QuerySet을 CSV 또는 NDJSON으로 스트리밍하는 응답을 만듭니다.
+
+    ASGI 요청이면 asynchronous=True로 호출해야 응답 본문을 한 번에 메모리에
+    모으지 않습니다.
+    """
+    rows = _stream_rows(queryset, chunk_size)
+    lines = _csv_lines(rows) if file_format == "csv" else _ndjson_lines(rows)
+    chunks = _buffered(lines, compress)
+
+    response = StreamingHttpResponse(
+        _aiterate(chunks) if asynchronous else chunks,
+        content_type=CONTENT_TYPES[file_format],
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="transactions.{file_format}"'
+    )
+    if compress:
+        # 클라이언트(브라우저, curl --compressed)가 투명하게 압축을 풉니다.
+        response["Content-Encoding"] = "gzip"
+    return response
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+거래 내역 조회 조건
+
+쿼리 파라미터를 Serializer로 검증한 뒤 QuerySet 조건으로 변환합니다.
+(?start=2025-01-01T00:00:00Z&end=...&account=3&transaction_type=WITHDRAW
+ &transaction_method=CARD&min_amount=1000&max_amount=50000&q=스타벅스)
+
+각 조건은 인덱스로 처리됩니다.
+- 사용자 + 기간/정렬: tx_user_ts_idx, 계좌: tx_account_ts_idx
+- 거래 타입/종류: tx_user_type_ts_idx, tx_user_method_ts_idx
+- 금액 범위: tx_user_amount_idx
+- 거래 설명 부분 검색(q): pg_trgm GIN 인덱스 tx_details_trgm_idx
+정렬은 항상 키셋 페이지네이션의 (transaction_timestamp, id)를 따릅니다.
+"""
+
+from rest_framework import serializers
+
+from .choices import PAYMENT_METHODS, TRANSACTION_TYPES
+
+
+class TransactionFilterSerializer(serializers.Serializer):
+    """거래 내역 필터 파라미터 검증"""
+
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+    account = serializers.IntegerField(required=False, min_value=1)
+    transaction_type = serializers.ChoiceField(
+        choices=sorted(TRANSACTION_TYPES), required=False
+    )
+    transaction_method = serializers.ChoiceField(
+        choices=sorted(PAYMENT_METHODS), required=False
+    )
+    min_amount = serializers.DecimalField(
+        max_digits=18, decimal_places=2, required=False
+    )
+    max_amount = serializers.DecimalField(
+        max_digits=18, decimal_places=2, required=False
+    )
+    # 트라이그램 인덱스는 3글자 단위로 동작하지만 짧은 검색어도 정확히 처리됩니다.
+    q = serializers.CharField(required=False, max_length=100, trim_whitespace=True)
+
+    def validate(self, attrs):
+        if "start" in attrs and "end" in attrs and attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError({
+                "end": "종료 일시는 시작 일시보다 빠를 수 없습니다."
+            })
+        if (
+            "min_amount" in attrs
+            and "max_amount" in attrs
+            and attrs["min_amount"] > attrs["max_amount"]
+        ):
+            raise serializers.ValidationError({
+                "max_amount": "최대 금액은 최소 금액보다 작을 수 없습니다."
+            })
+        return attrs
+
+
+def filter_transactions(queryset, query_params):
+    """검증된 쿼리 파라미터로 거래 QuerySet을 필터링합니다. (잘못된 값은 400)"""
+    serializer = TransactionFilterSerializer(data=query_params)
+    serializer.is_valid(raise_exception=True)
+    params = serializer.validated_data
+
+    # 시작은 포함, 종료는 미포함 (start <= transaction_timestamp < end)
+    if "start" in params:
+        queryset = queryset.filter(transaction_timestamp__gte=params["start"])
+    if "end" in params:
+        queryset = queryset.filter(transaction_timestamp__lt=params["end"])
+    if "account" in params:
+        queryset = queryset.filter(account_id=params["account"])
+    if "transaction_type" in params:
+        queryset = queryset.filter(transaction_type=params["transaction_type"])
+    if "transaction_method" in params:
+        queryset = queryset.filter(transaction_method=params["transaction_method"])
+    if "min_amount" in params:
+        queryset = queryset.filter(transaction_amount__gte=params["min_amount"])
+    if "max_amount" in params:
+        queryset = queryset.filter(transaction_amount__lte=params["max_amount"])
+    if params.get("q"):
+        # PostgreSQL에서 UPPER(transaction_details::text) LIKE UPPER('%q%')로 변환되어
+        # 같은 식으로 만든 트라이그램 GIN 인덱스를 사용합니다.
+        queryset = queryset.filter(transaction_details__icontains=params["q"])
+    return queryset
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Idempotency-Key 헤더 처리 (POST 재시도 중복 방지)
+
+같은 사용자가 같은 키로 다시 보낸 요청은 처리하지 않고 처음 응답을 재생합니다.
+
+1. 캐시(settings.CACHES)에 응답이 있으면 DB를 거치지 않고 바로 재생합니다.
+2. 없으면 (user, key) 행을 INSERT ... ON CONFLICT로 선점하고, 같은 트랜잭션에서
+   요청을 처리한 뒤 응답을 저장합니다. 동시에 들어온 같은 키의 요청은 유니크
+   인덱스에서 첫 요청의 커밋을 기다렸다가 저장된 응답을 재생하므로
+   계좌 잔액을 두 번 건드리지 않습니다. 첫 요청이 실패(롤백)하면 키도 사라져
+   다음 재시도가 정상 처리됩니다.
+3. settings.IDEMPOTENCY["TTL"]이 지난 키는 같은 문장에서 새 요청으로 덮어씁니다.
+"""
+
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, connections, router, transaction
+from django.utils import timezone
+from rest_framework import serializers, status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+from .models import IdempotencyKey
+
+HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = IdempotencyKey._meta.get_field("key").max_length
+
+_CLAIM_SQL = """
+INSERT INTO {table} (user_id, key, request_hash, created_at)
+VALUES (%(user_id)s, %(key)s, %(request_hash)s, %(now)s)
+ON CONFLICT (user_id, key) DO UPDATE
+   SET request_hash = EXCLUDED.request_hash,
+       created_at = EXCLUDED.created_at,
+       status_code = NULL,
+       response_body = NULL
+ WHERE {table}.created_at < %(expired_before)s
+RETURNING id
+"""
+
+
+class IdempotencyKeyReused(APIException):
+    """같은 키가 다른 요청 본문으로 다시 사용된 경우"""
+
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = "같은 Idempotency-Key가 다른 요청에 이미 사용되었습니다."
+    default_code = "idempotency_key_reused"
+
+
+class IdempotencyKeyInProgress(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "같은 Idempotency-Key의 요청이 아직 처리 중입니다."
+    default_code = "idempotency_key_in_progress"
+
+
+def _fingerprint(request):
+    payload = json.dumps(
+        [request.method, request.path, request.data],
+        sort_keys=True,
+        cls=DjangoJSONEncoder,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cache_key(user_id, key):
+    # 캐시 백엔드가 허용하지 않는 문자/길이를 피하도록 키를 해시합니다.
+    return f"idempotency:{user_id}:{hashlib.sha256(key.encode('utf-8')).hexdigest()}"
+
+
+def _replay(entry, request_hash):
+    stored_hash, status_code, body = entry
+    if stored_hash != request_hash:
+        raise IdempotencyKeyReused()
+    if status_code is None:
+        raise IdempotencyKeyInProgress()
+    return Response(
+        json.loads(body), status=status_code, headers={REPLAYED_HEADER: "true"}
+    )
+
+
+def run(request, handler):
+    """
+    Idempotency-Key가 있으면 응답을 재생하거나, handler()를 한 번만 실행합니다.
+
+    handler는 DRF Response를 반환하는 호출 가능 객체입니다. 예외가 나면
+    키 선점도 함께 롤백되어 저장되지 않습니다.
+    """
+    key = request.headers.get(HEADER)
+    if key is None:
+        return handler()
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise serializers.ValidationError({
+            HEADER: f"1~{MAX_KEY_LENGTH}자의 문자열이어야 합니다."
+        })
+
+    user_id = request.user.pk
+    request_hash = _fingerprint(request)
+    cache_key = _cache_key(user_id, key)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return _replay(cached, request_hash)
+
+    now = timezone.now()
+    options = settings.IDEMPOTENCY
+    # 사용자의 원장 DB에서 키를 잡고 처리합니다. (accounts/sharding.py)
+    using = router.db_for_write(IdempotencyKey)
+    with transaction.atomic(using=using):
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                _CLAIM_SQL.format(
+                    table=connection.ops.quote_name(IdempotencyKey._meta.db_table)
+                ),
+                {
+                    "user_id": user_id,
+                    "key": key,
+                    "request_hash": request_hash,
+                    "now": now,
+                    "expired_before": now - timedelta(seconds=options["TTL"]),
+                },
+            )
+            claimed = cursor.fetchone()
+
+        if claimed is None:
+            # 첫 요청이 이미 커밋한 응답 (처리 중이었다면 INSERT가 커밋을 기다렸습니다)
+            entry = (
+                IdempotencyKey.objects.using(using)
+                .filter(user_id=user_id, key=key)
+                .values_list("request_hash", "status_code", "response_body")
+                .get()
+            )
+            if entry[1] is not None:
+                cache.set(cache_key, entry, options["CACHE_TTL"])
+            return _replay(entry, request_hash)
+
+        response = handler()
+        body = json.dumps(response.data, cls=DjangoJSONEncoder, ensure_ascii=False)
+        IdempotencyKey.objects.using(using).filter(pk=claimed[0]).update(
+            status_code=response.status_code, response_body=body
+        )
+        entry = (request_hash, response.status_code, body)
+        transaction.on_commit(
+            lambda: cache.set(cache_key, entry, options["CACHE_TTL"]), using=using
+        )
+    return response
+
+
+def purge_expired(batch_size=10_000):
+    """보관 기간이 지난 키를 batch_size개씩 지우고 지운 개수를 반환합니다."""
+    expired_before = timezone.now() - timedelta(seconds=settings.IDEMPOTENCY["TTL"])
+    deleted = 0
+    while True:
+        ids = list(
+            IdempotencyKey.objects.filter(created_at__lt=expired_before).values_list(
+                "pk", flat=True
+            )[:batch_size]
+        )
+        if not ids:
+            return deleted
+        deleted += IdempotencyKey.objects.filter(pk__in=ids).delete()[0]
@@ -0,0 +1,630 @@
+# -*- coding: utf-8 -*-
+"""
+거래 전기(posting) 엔진
+
+잔액 검사, 잔액 갱신, 거래 내역 INSERT를 PostgreSQL에서는 하나의 SQL 문
+(데이터 변경 CTE)으로 처리합니다. 조건부 UPDATE가 행 잠금을 잡는 순간에
+잔액을 다시 평가하므로 동시 출금이 서로의 결과를 덮어쓰지 않고,
+잠금은 단 한 번의 DB 왕복 동안만 유지됩니다.
+기간별 소비 집계(SpendingRollup)도 같은 문장 안에서 증감합니다.
+
+과거 일자 거래 삽입, 거래 수정/삭제로 post_transaction_amount 체인이 어긋나면
+rechain()이 영향을 받은 시점 이후 구간만 윈도 함수 UPDATE 한 번으로 다시
+누적하고 계좌 잔액을 마지막 값으로 맞춥니다.
+"""
+
+from collections import defaultdict
+from functools import reduce
+from operator import or_
+
+from django.db import connections, router, transaction
+from django.db.models import Case, F, Q, Subquery, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from . import listcache, rollups
+from .models import Account, BalanceCheckpoint, Transaction
+
+
+def ledger_connection():
+    """현재 요청 사용자의 원장 DB 연결 (샤딩, accounts/sharding.py)"""
+    return connections[router.db_for_write(Account)]
+
+
+class LedgerError(Exception):
+    """전기 엔진의 기본 예외"""
+
+
+class InsufficientBalance(LedgerError):
+    """출금 후 잔액이 음수가 되는 경우"""
+
+
+class AccountNotFound(LedgerError):
+    """전기 대상 계좌가 존재하지 않는 경우"""
+
+
+def signed_amount(transaction_type, amount):
+    """입금은 양수, 출금은 음수로 변환한 잔액 변화량을 반환합니다."""
+    if transaction_type == "DEPOSIT":
+        return amount
+    if transaction_type == "WITHDRAW":
+        return -amount
+    raise ValueError(f"유효하지 않은 거래 타입입니다: {transaction_type}")
+
+
+def _default_method():
+    return Transaction._meta.get_field("transaction_method").default
+
+
+# 🌟 잔액 조건 검사 + 잔액 갱신 + 거래 INSERT를 한 문장으로 처리
+_POST_SQL = """
+WITH updated AS (
+    UPDATE {accounts}
+       SET balance = balance + %(delta)s,
+           last_transaction_at = GREATEST(last_transaction_at, %(timestamp)s)
+     WHERE id = %(account_id)s
+       AND (%(delta)s >= 0 OR balance + %(delta)s >= 0)
+       -- 과거 일자 거래는 체인을 다시 누적해야 하므로 잠금 경로로 넘깁니다.
+       -- (잠금을 잡은 뒤 최신 행으로 다시 평가되는 조건이라 동시 전기에도 정확,
+       --  locked: 잠금 경로에서 이미 계좌를 잠그고 검사를 마친 경우)
+       AND (%(locked)s
+            OR last_transaction_at IS NULL
+            OR last_transaction_at <= %(timestamp)s)
+ RETURNING id, user_id, balance
+),
+stale_checkpoints AS (
+    -- 과거 일자 거래가 끼어들면 그 이후 체크포인트는 더 이상 유효하지 않음
+    DELETE FROM {checkpoints}
+     WHERE account_id = %(account_id)s
+       AND as_of >= %(timestamp)s
+       AND EXISTS (SELECT 1 FROM updated)
+),
+rollup AS (
+    -- 일/주/월 소비 집계 증감 (accounts.rollups)
+    INSERT INTO {rollups} (
+        user_id, account_id, granularity, period_start,
+        transaction_type, transaction_method, total_amount, transaction_count
+    )
+    SELECT updated.user_id, updated.id, p.granularity, p.period_start,
+           %(type)s, %(method)s, %(amount)s, 1
+      FROM updated
+     CROSS JOIN (VALUES ('DAY', %(day)s::date),
+                        ('WEEK', %(week)s::date),
+                        ('MONTH', %(month)s::date)) AS p (granularity, period_start)
+    {rollup_conflict}
+)
+INSERT INTO {history} (
+    account_id, user_id, transaction_amount, post_transaction_amount,
+    transaction_details, transaction_type, transaction_method,
+    transaction_timestamp, created_at
+)
+SELECT updated.id, updated.user_id, %(amount)s, updated.balance,
+       %(details)s, %(type)s, %(method)s,
+       %(timestamp)s, %(created_at)s
+  FROM updated
+RETURNING id, user_id, post_transaction_amount
+"""
+
+
+# 🌟 계좌별 (timestamp, pk) 이후 구간의 거래 후 잔액을 기준 잔액부터 다시 누적
+# base가 NULL인 구간은 체인에서 직전 거래 후 잔액(없으면 개설 잔액, 거래가 없으면
+# 현재 계좌 잔액)을 찾아 씁니다. (balance_before()와 같은 규칙)
+# since(구간 시작 일시 중 최솟값)는 중복 조건이지만 계획 시점 상수라서, 플래너가
+# 통계로 구간 크기를 추정해 인덱스 범위 탐색을 고르고 오래된 파티션을 제외합니다.
+# (exclude의 거래는 아직 체인에 반영되지 않은 새 거래라 기준에서 제외합니다.)
+_RECHAIN_SQL = """
+WITH segment AS (
+    SELECT s.account_id, s.ts, s.pk,
+           COALESCE(
+               s.base,
+               (SELECT p.post_transaction_amount FROM {history} AS p
+                 WHERE p.account_id = s.account_id
+                   AND (p.transaction_timestamp, p.id) < (s.ts, s.pk)
+                   AND p.id <> ALL(%(exclude)s)
+                 ORDER BY p.transaction_timestamp DESC, p.id DESC LIMIT 1),
+               (SELECT f.post_transaction_amount
+                       - CASE WHEN f.transaction_type = 'WITHDRAW'
+                              THEN -f.transaction_amount
+                              ELSE f.transaction_amount END
+                  FROM {history} AS f
+                 WHERE f.account_id = s.account_id
+                   AND f.id <> ALL(%(exclude)s)
+                 ORDER BY f.transaction_timestamp, f.id LIMIT 1),
+               (SELECT a.balance FROM {accounts} AS a WHERE a.id = s.account_id)
+           ) AS base
+      FROM unnest(%(account_ids)s::bigint[], %(timestamps)s::timestamptz[],
+                  %(pks)s::bigint[], %(bases)s::numeric[])
+           AS s (account_id, ts, pk, base)
+),
+suffix AS (
+    SELECT h.id, h.account_id, h.transaction_timestamp,
+           segment.base + SUM(CASE WHEN h.transaction_type = 'WITHDRAW'
+                                   THEN -h.transaction_amount
+                                   ELSE h.transaction_amount END)
+               OVER (PARTITION BY h.account_id
+                     ORDER BY h.transaction_timestamp, h.id) AS post,
+           ROW_NUMBER() OVER (PARTITION BY h.account_id
+                              ORDER BY h.transaction_timestamp DESC, h.id DESC)
+               AS from_end
+      FROM segment
+     CROSS JOIN LATERAL (
+            -- 구간마다 (account_id, transaction_timestamp, id) 인덱스 범위 탐색
+            SELECT * FROM {history}
+             WHERE account_id = segment.account_id
+               AND (transaction_timestamp, id) >= (segment.ts, segment.pk)
+               AND transaction_timestamp >= %(since)s
+           ) AS h
+),
+chained AS (
+    UPDATE {history} AS h
+       SET post_transaction_amount = suffix.post
+      FROM suffix
+     WHERE h.id = suffix.id
+       AND h.transaction_timestamp = suffix.transaction_timestamp
+       AND h.transaction_timestamp >= %(since)s
+       AND h.post_transaction_amount <> suffix.post
+ RETURNING h.id, h.post_transaction_amount
+),
+stale_checkpoints AS (
+    DELETE FROM {checkpoints} AS c
+     USING segment
+     WHERE c.account_id = segment.account_id
+       AND c.as_of >= segment.ts
+),
+balances AS (
+    UPDATE {accounts} AS a
+       SET balance = COALESCE(last.post, segment.base),
+           last_transaction_at = GREATEST(
+               a.last_transaction_at, last.transaction_timestamp
+           )
+      FROM segment
+      LEFT JOIN suffix AS last
+        ON last.account_id = segment.account_id AND last.from_end = 1
+     WHERE a.id = segment.account_id
+ RETURNING a.id, a.balance
+)
+SELECT 'account', id, balance FROM balances
+ UNION ALL
+SELECT 'transaction', id, post_transaction_amount FROM chained
+"""
+
+
+def post_transaction(
+    account,
+    transaction_type,
+    transaction_amount,
+    transaction_timestamp,
+    transaction_details="",
+    transaction_method=None,
+):
+    """
+    계좌에 거래 한 건을 전기하고 생성된 Transaction 인스턴스를 반환합니다.
+
+    출금으로 잔액이 음수가 되면 InsufficientBalance를 발생시킵니다.
+    전달된 account 인스턴스의 balance도 갱신된 값으로 맞춰 줍니다.
+    """
+    delta = signed_amount(transaction_type, transaction_amount)
+    fields = {
+        "transaction_amount": transaction_amount,
+        "transaction_details": transaction_details or "",
+        "transaction_type": transaction_type,
+        "transaction_method": transaction_method or _default_method(),
+        "transaction_timestamp": transaction_timestamp,
+        "created_at": timezone.now(),
+    }
+
+    connection = ledger_connection()
+    row = None
+    if connection.vendor == "postgresql":
+        row = _post_single_statement(connection, account.pk, delta, fields)
+    if row is None:
+        # 잔액 부족/계좌 없음/과거 일자 거래는 잠금 경로에서 다시 판별합니다.
+        row = _post_locked(connection, account.pk, delta, fields)
+    if isinstance(row, LedgerError):
+        raise row
+
+    pk, user_id, new_balance, post_amount = row
+    account.balance = new_balance
+    listcache.bump_ledger_version(user_id, using=connection.alias)
+    return Transaction(
+        pk=pk,
+        account=account,
+        user_id=user_id,
+        post_transaction_amount=post_amount,
+        **fields,
+    )
+
+
+def _post_single_statement(connection, account_id, delta, fields, locked=False):
+    sql = _POST_SQL.format(
+        accounts=connection.ops.quote_name(Account._meta.db_table),
+        history=connection.ops.quote_name(Transaction._meta.db_table),
+        checkpoints=connection.ops.quote_name(BalanceCheckpoint._meta.db_table),
+        rollups=rollups.rollups_table(),
+        rollup_conflict=rollups.conflict_clause(),
+    )
+    periods = rollups.period_starts(fields["transaction_timestamp"])
+    params = {
+        "delta": delta,
+        "account_id": account_id,
+        "amount": fields["transaction_amount"],
+        "details": fields["transaction_details"],
+        "type": fields["transaction_type"],
+        "method": fields["transaction_method"],
+        "timestamp": fields["transaction_timestamp"],
+        "created_at": fields["created_at"],
+        "day": periods["DAY"],
+        "week": periods["WEEK"],
+        "month": periods["MONTH"],
+        "locked": locked,
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+    return None if row is None else (*row, row[2])
+
+
+def _post_locked(connection, account_id, delta, fields):
+    """
+    계좌를 잠근 뒤 검사/갱신하는 전기 경로
+
+    데이터 변경 CTE를 지원하지 않는 DB와, 단일 문장 경로가 반영하지 못한 거래
+    (잔액 부족, 계좌 없음, 이후 거래를 다시 누적해야 하는 과거 일자 거래)에
+    사용합니다. 실패 사유는 예외를 던지지 않고 LedgerError 인스턴스로 돌려줘
+    세이브포인트 없이 바깥 트랜잭션에 합류할 수 있게 합니다.
+    """
+    with transaction.atomic(using=connection.alias, savepoint=False):
+        account = Account.objects.select_for_update().filter(pk=account_id).first()
+        if account is None:
+            return AccountNotFound(account_id)
+        new_balance = account.balance + delta
+        if delta < 0 and new_balance < 0:
+            return InsufficientBalance(account_id)
+        timestamp = fields["transaction_timestamp"]
+        backdated = (
+            account.last_transaction_at is not None
+            and account.last_transaction_at > timestamp
+        )
+        if connection.vendor == "postgresql":
+            pk, user_id, _, post_amount = _post_single_statement(
+                connection, account_id, delta, fields, locked=True
+            )
+        else:
+            pk, user_id, post_amount = _post_rows(account, new_balance, fields)
+        if backdated:
+            # 현재 잔액이 아니라 그 시점 잔액에 더한 값이 거래 후 잔액입니다.
+            _, posts = rechain([(account_id, timestamp, pk, None)], exclude=[pk])
+            post_amount = posts.get(pk, post_amount)
+        return pk, user_id, new_balance, post_amount
+
+
+def _post_rows(account, new_balance, fields):
+    """데이터 변경 CTE를 지원하지 않는 DB용: _POST_SQL과 같은 변경을 ORM으로"""
+    timestamp = fields["transaction_timestamp"]
+    if account.last_transaction_at is None or account.last_transaction_at < timestamp:
+        account.last_transaction_at = timestamp
+    account.balance = new_balance
+    account.save(update_fields=["balance", "last_transaction_at"])
+    BalanceCheckpoint.objects.filter(
+        account_id=account.pk, as_of__gte=timestamp
+    ).delete()
+    instance = Transaction.objects.create(
+        account_id=account.pk,
+        user_id=account.user_id,
+        post_transaction_amount=new_balance,
+        **fields,
+    )
+    rollups.add(instance)
+    return instance.pk, account.user_id, new_balance
+
+
+def balance_before(account_id, timestamp, pk, exclude=()):
+    """
+    계좌 거래 체인에서 (timestamp, pk) 위치 직전의 잔액을 반환합니다.
+
+    앞선 거래가 없으면 첫 거래의 거래 전 잔액(개설 잔액)을, 거래가 하나도
+    없으면 현재 계좌 잔액을 돌려줍니다. exclude의 거래는 아직 체인에
+    반영되지 않은 것으로 보고 건너뜁니다.
+    """
+    history = Transaction.objects.filter(account_id=account_id).exclude(pk__in=exclude)
+    previous = (
+        history.filter(
+            Q(transaction_timestamp__lt=timestamp)
+            | Q(transaction_timestamp=timestamp, pk__lt=pk)
+        )
+        .order_by("-transaction_timestamp", "-id")
+        .values("post_transaction_amount")[:1]
+    )
+    opening = (
+        history.order_by("transaction_timestamp", "id")
+        .annotate(
+            opening=F("post_transaction_amount")
+            - Case(
+                When(transaction_type="WITHDRAW", then=-F("transaction_amount")),
+                default=F("transaction_amount"),
+            )
+        )
+        .values("opening")[:1]
+    )
+    # 세 후보를 하위 쿼리로 묶어 한 번에 조회합니다.
+    return (
+        Account.objects.filter(pk=account_id)
+        .values_list(
+            Coalesce(Subquery(previous), Subquery(opening), F("balance")), flat=True
+        )
+        .get()
+    )
+
+
+def rechain(segments, exclude=()):
+    """
+    구간 [(account_id, timestamp, pk, base)]마다 (timestamp, pk) 이후(포함)
+    거래의 post_transaction_amount를 base부터 다시 누적하고, 계좌 잔액을
+    마지막 거래 후 잔액으로 맞춥니다. (계좌 하나당 구간 하나)
+
+    base가 None이면 exclude(방금 삽입한 거래 id)를 뺀 체인에서 직전 잔액을
+    찾습니다. 모든 구간을 문장 하나로 처리하며, 비용은 계좌 전체 내역이
+    아니라 다시 누적하는 구간 길이에 비례합니다.
+
+    호출자는 계좌를 잠근 트랜잭션 안에서 호출해야 합니다.
+    ({account_id: 잔액}, {거래 id: 바뀐 거래 후 잔액})을 반환하며,
+    잔액이 음수가 되는 계좌가 있으면 InsufficientBalance를 발생시킵니다.
+    """
+    connection = ledger_connection()
+    if connection.vendor == "postgresql":
+        balances, posts = _rechain_single_statement(connection, segments, list(exclude))
+    else:
+        balances, posts = {}, {}
+        for account_id, timestamp, pk, base in segments:
+            if base is None:
+                base = balance_before(account_id, timestamp, pk, exclude)
+            balances[account_id] = _rechain_rows(account_id, timestamp, pk, base, posts)
+    for account_id, balance in balances.items():
+        if balance < 0:
+            raise InsufficientBalance(account_id)
+    return balances, posts
+
+
+def _rechain_single_statement(connection, segments, exclude):
+    sql = _RECHAIN_SQL.format(
+        accounts=connection.ops.quote_name(Account._meta.db_table),
+        history=connection.ops.quote_name(Transaction._meta.db_table),
+        checkpoints=connection.ops.quote_name(BalanceCheckpoint._meta.db_table),
+    )
+    account_ids, timestamps, pks, bases = zip(*segments)
+    params = {
+        "account_ids": list(account_ids),
+        "timestamps": list(timestamps),
+        "pks": list(pks),
+        "bases": list(bases),
+        "since": min(timestamps),
+        "exclude": exclude,
+    }
+    balances, posts = {}, {}
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        for kind, pk, amount in cursor.fetchall():
+            (balances if kind == "account" else posts)[pk] = amount
+    return balances, posts
+
+
+def _rechain_rows(account_id, timestamp, pk, base, posts):
+    """윈도 함수 UPDATE를 쓸 수 없는 DB용: 구간을 읽어 bulk_update합니다."""
+    suffix = Transaction.objects.filter(
+        Q(transaction_timestamp__gt=timestamp)
+        | Q(transaction_timestamp=timestamp, pk__gte=pk),
+        account_id=account_id,
+    ).order_by("transaction_timestamp", "id")
+    balance, changed, last = base, [], None
+    for tx in suffix.only(
+        "transaction_type",
+        "transaction_amount",
+        "post_transaction_amount",
+        "transaction_timestamp",
+    ):
+        balance += signed_amount(tx.transaction_type, tx.transaction_amount)
+        last = tx.transaction_timestamp
+        if tx.post_transaction_amount != balance:
+            tx.post_transaction_amount = posts[tx.pk] = balance
+            changed.append(tx)
+    Transaction.objects.bulk_update(changed, ["post_transaction_amount"])
+    BalanceCheckpoint.objects.filter(
+        account_id=account_id, as_of__gte=timestamp
+    ).delete()
+    account = Account.objects.get(pk=account_id)
+    account.balance = balance
+    if last is not None and (
+        account.last_transaction_at is None or account.last_transaction_at < last
+    ):
+        account.last_transaction_at = last
+    account.save(update_fields=["balance", "last_transaction_at"])
+    return balance
+
+
+def _lock_accounts(account_ids):
+    # 교착 상태를 피하도록 항상 계좌 ID 순서로 잠급니다.
+    list(
+        Account.objects.select_for_update()
+        .filter(pk__in=account_ids)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+
+
+def plan_rechain(instance, account_id=None, timestamp=None):
+    """
+    거래 instance를 수정(account_id/timestamp로 이동 포함)하거나 삭제하기 전에
+    호출해, 관련 계좌를 계좌 ID 순서로 잠그고 다시 누적할 구간 목록
+    [(account_id, timestamp, pk, base)]을 반환합니다.
+
+    수정/삭제를 저장한 뒤 rechain(구간 목록, exclude=[instance.pk])을 호출합니다.
+    """
+    old_account, old_timestamp = instance.account_id, instance.transaction_timestamp
+    new_account = account_id or old_account
+    new_timestamp = timestamp or old_timestamp
+    _lock_accounts({old_account, new_account})
+
+    # 원래 위치의 거래 전 잔액은 체인이 이미 알고 있습니다.
+    before_old = instance.post_transaction_amount - signed_amount(
+        instance.transaction_type, instance.transaction_amount
+    )
+    if new_account != old_account:
+        # 옮겨 간 계좌의 기준 잔액은 rechain(exclude=[instance.pk])이 찾습니다.
+        return [
+            (old_account, old_timestamp, instance.pk, before_old),
+            (new_account, new_timestamp, instance.pk, None),
+        ]
+    if new_timestamp < old_timestamp:
+        # 앞으로 옮기면 새 위치 직전 잔액을 수정 전 체인에서 구합니다.
+        base = balance_before(old_account, new_timestamp, instance.pk)
+        return [(old_account, new_timestamp, instance.pk, base)]
+    return [(old_account, old_timestamp, instance.pk, before_old)]
+
+
+def post_batch(entries, user=None, all_or_nothing=False):
+    """
+    여러 거래를 한 트랜잭션으로 전기하고 입력 순서대로 결과 목록을 반환합니다.
+
+    entries는 account(계좌 ID)와 post_transaction()의 인자를 담은 dict 목록입니다.
+    각 결과는 생성된 Transaction 또는 그 행이 실패한 이유(LedgerError)입니다.
+
+    계좌별로 transaction_timestamp 순으로 정렬해 post_transaction_amount를
+    누적합으로 계산한 뒤, 대상 계좌 잠금 1회 + bulk_create 1회 +
+    잔액 갱신 1회(모든 계좌) + 체크포인트/집계 정리로 반영합니다.
+    잔액이 부족한 출금 행만 건너뛰며, all_or_nothing이면 한 행이라도
+    실패할 때 아무것도 반영하지 않습니다.
+    기존 거래보다 앞선 일시의 행이 있는 계좌는 그 지점부터 rechain()합니다.
+    """
+    results = [None] * len(entries)
+    by_account = defaultdict(list)
+    for index, entry in enumerate(entries):
+        by_account[entry["account"]].append(index)
+
+    now = timezone.now()
+    using = router.db_for_write(Account)
+    with transaction.atomic(using=using):
+        # 🌟 계좌 ID 순서로 잠가 동시 일괄 전기 사이의 교착 상태를 피합니다.
+        accounts = Account.objects.select_for_update().filter(
+            pk__in=by_account, is_deleted=False
+        )
+        if user is not None:
+            accounts = accounts.filter(user=user)
+        accounts = {account.pk: account for account in accounts.order_by("pk")}
+
+        created, changed, first, backdated = [], [], {}, []
+        for account_id, indexes in sorted(by_account.items()):
+            account = accounts.get(account_id)
+            if account is None:
+                for index in indexes:
+                    results[index] = AccountNotFound(account_id)
+                continue
+
+            # 같은 시각이면 입력 순서를 유지합니다. (안정 정렬)
+            indexes.sort(key=lambda index: entries[index]["transaction_timestamp"])
+            balance = account.balance
+            for index in indexes:
+                entry = entries[index]
+                delta = signed_amount(
+                    entry["transaction_type"], entry["transaction_amount"]
+                )
+                if delta < 0 and balance + delta < 0:
+                    results[index] = InsufficientBalance(account_id)
+                    continue
+                balance += delta
+                results[index] = Transaction(
+                    account=account,
+                    user_id=account.user_id,
+                    transaction_amount=entry["transaction_amount"],
+                    post_transaction_amount=balance,
+                    transaction_details=entry.get("transaction_details") or "",
+                    transaction_type=entry["transaction_type"],
+                    transaction_method=(
+                        entry.get("transaction_method") or _default_method()
+                    ),
+                    transaction_timestamp=entry["transaction_timestamp"],
+                    created_at=now,
+                )
+                created.append(results[index])
+                first.setdefault(account_id, results[index])
+            if account_id not in first:
+                continue
+            # 기존 거래보다 앞선 일시가 섞인 계좌는 그 지점부터 체인을 다시 누적합니다.
+            tx, latest = first[account_id], account.last_transaction_at
+            if latest is not None and latest > tx.transaction_timestamp:
+                backdated.append(account_id)
+            last = created[-1].transaction_timestamp
+            account.balance = balance
+            account.last_transaction_at = max(latest, last) if latest else last
+            changed.append(account)
+
+        failed = any(isinstance(result, LedgerError) for result in results)
+        if not created or (all_or_nothing and failed):
+            return results
+
+        Transaction.objects.bulk_create(created)
+        Account.objects.bulk_update(changed, ["balance", "last_transaction_at"])
+        for user_id in {account.user_id for account in changed}:
+            listcache.bump_ledger_version(user_id, using=using)
+        # 과거 일자 거래가 끼어든 계좌의 이후 체크포인트는 무효화합니다.
+        BalanceCheckpoint.objects.filter(
+            reduce(
+                or_,
+                (
+                    Q(account_id=account_id, as_of__gte=tx.transaction_timestamp)
+                    for account_id, tx in first.items()
+                ),
+            )
+        ).delete()
+        rollups.add(*created)
+
+        if backdated:
+            segments = [
+                (
+                    account_id,
+                    first[account_id].transaction_timestamp,
+                    first[account_id].pk,
+                    None,
+                )
+                for account_id in backdated
+            ]
+            _, posts = rechain(segments, exclude=[tx.pk for tx in created])
+            for tx in created:
+                tx.post_transaction_amount = posts.get(
+                    tx.pk, tx.post_transaction_amount
+                )
+    return results
+
+
+def transfer(
+    source_id,
+    target_id,
+    amount,
+    transaction_timestamp,
+    transaction_details="",
+    user=None,
+):
+    """
+    source 계좌에서 target 계좌로 amount를 이체하고 (출금, 입금) 거래를 반환합니다.
+
+    출금/입금 거래 두 건과 두 계좌의 잔액 갱신을 post_batch()로 한 트랜잭션에
+    반영합니다. 두 계좌는 항상 계좌 ID 순서로 잠기므로 A→B와 B→A 이체가
+    동시에 들어와도 교착 상태가 생기지 않습니다.
+    한쪽이라도 실패하면 아무것도 반영하지 않고 해당 LedgerError를 발생시킵니다.
+    """
+    if source_id == target_id:
+        raise ValueError("같은 계좌로는 이체할 수 없습니다.")
+    fields = {
+        "transaction_amount": amount,
+        "transaction_timestamp": transaction_timestamp,
+        "transaction_details": transaction_details,
+        "transaction_method": "TRANSFER",
+    }
+    legs = [
+        {"account": source_id, "transaction_type": "WITHDRAW", **fields},
+        {"account": target_id, "transaction_type": "DEPOSIT", **fields},
+    ]
+    withdraw, deposit = post_batch(legs, user=user, all_or_nothing=True)
+    for result in (withdraw, deposit):
+        if isinstance(result, LedgerError):
+            raise result
+    return withdraw, deposit
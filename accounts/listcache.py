@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+계좌/거래 목록 응답 캐시 (사용자별 원장 버전 + ETag)
+
+대시보드는 몇 초마다 목록을 다시 읽지만 대부분은 바뀐 것이 없습니다.
+사용자마다 기본 캐시(settings.CACHES["default"])에 원장 버전 값을 두고,
+계좌/거래 쓰기(Account/Transaction의 save/delete, ledger의 전기)가 커밋되면
+bump_ledger_version()이 버전을 올립니다.
+
+CachedListMixin은 목록 응답(JSON)을 (사용자, 원장 버전, URL) 키로
+settings.LIST_CACHE["CACHE"] 캐시에 저장하고 본문 해시를 강한 ETag로 붙입니다.
+캐시에 있으면 DB를 읽지 않고 응답하며, If-None-Match가 일치하면 304를 돌려줍니다.
+버전이 바뀐 뒤의 이전 항목은 더 읽히지 않고 캐시의 LRU(MAX_ENTRIES)와 TTL로
+밀려납니다.
+
+ORM/ledger를 거치지 않은 변경(수동 SQL 등)은 TTL이 지나야 반영됩니다.
+버전 값을 워커끼리 볼 수 있어야 하므로 기본 캐시가 공유 캐시(Redis,
+settings.SHARED_CACHE)일 때만 캐시합니다.
+"""
+
+import hashlib
+import time
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+
+
+def _version_key(user_id):
+    return f"accounts:ledger-version:{user_id}"
+
+
+def ledger_version(user_id):
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        # 키가 없거나 밀려난 경우 이전 값과 겹치지 않는 값에서 다시 시작합니다.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+async def aledger_version(user_id):
+    """ledger_version()의 비동기 버전 (비동기 뷰용)"""
+    key = _version_key(user_id)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns(), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+def bump_ledger_version(user_id, using=None):
+    """user_id의 목록 캐시를 무효화합니다. (using DB의 트랜잭션 안이면 커밋된 뒤에)"""
+    transaction.on_commit(partial(_bump, user_id), using=using)
+
+
+def _bump(user_id):
+    key = _version_key(user_id)
+    try:
+        cache.incr(key)
+    except ValueError:  # 키가 없거나 밀려난 경우
+        cache.add(key, time.time_ns(), timeout=None)
+
+
+class CachedListMixin:
+    """list()/alist() 응답을 원장 버전별로 캐시하고 ETag/조건부 GET을 처리합니다."""
+
+    def list(self, request, *args, **kwargs):
+        key = self.get_list_cache_key(request)
+        if key is None:
+            return super().list(request, *args, **kwargs)
+        options = settings.LIST_CACHE
+        entry = caches[options["CACHE"]].get(key)
+        response = None
+        if entry is None:
+            response = super().list(request, *args, **kwargs)
+            entry = self._render_list_response(response)
+            caches[options["CACHE"]].set(key, entry, options["TTL"])
+        return self._list_response(request, entry, response)
+
+    async def alist(self, request, *args, **kwargs):
+        # 버전/응답 캐시는 비동기 캐시 API로 읽어 이벤트 루프를 막지 않습니다.
+        key = await self.aget_list_cache_key(request)
+        if key is None:
+            return await super().alist(request, *args, **kwargs)
+        options = settings.LIST_CACHE
+        entry = await caches[options["CACHE"]].aget(key)
+        response = None
+        if entry is None:
+            response = await super().alist(request, *args, **kwargs)
+            entry = self._render_list_response(response)
+            await caches[options["CACHE"]].aset(key, entry, options["TTL"])
+        return self._list_response(request, entry, response)
+
+    def get_list_cache_key(self, request):
+        """캐시하지 않을 요청이면 None (비활성화, JSON 이외의 렌더러)"""
+        if not self._should_cache_list(request):
+            return None
+        # 버전은 DB를 읽기 전에 가져옵니다. 그 사이 커밋된 쓰기는 더 새로운
+        # 데이터가 이전 버전 키에 담길 뿐이고, 다음 요청은 새 버전으로 읽습니다.
+        return self._list_cache_key(request, ledger_version(request.user.pk))
+
+    async def aget_list_cache_key(self, request):
+        """get_list_cache_key()의 비동기 버전"""
+        if not self._should_cache_list(request):
+            return None
+        return self._list_cache_key(request, await aledger_version(request.user.pk))
+
+    def _should_cache_list(self, request):
+        # 워커별 로컬 캐시면 다른 워커의 버전 증가를 볼 수 없어 캐시하지 않습니다.
+        return (
+            settings.LIST_CACHE["ENABLED"]
+            and settings.SHARED_CACHE
+            and request.accepted_renderer.format == "json"
+        )
+
+    def _list_cache_key(self, request, version):
+        # 다음 페이지 링크가 호스트를 포함하므로 절대 URL로 구분합니다.
+        url = request.build_absolute_uri().encode()
+        digest = hashlib.blake2b(url, digest_size=16).hexdigest()
+        return f"accounts:list:{request.user.pk}:{version}:{digest}"
+
+    def _render_list_response(self, response):
+        renderer = self.request.accepted_renderer
+        media_type = self.request.accepted_media_type
+        body = renderer.render(response.data, media_type, self.get_renderer_context())
+        if renderer.charset:
+            media_type = f"{media_type}; charset={renderer.charset}"
+        # 렌더링한 본문을 응답에도 넣어 finalize 단계에서 다시 렌더링하지 않게 합니다.
+        response.content = body
+        response["Content-Type"] = media_type
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        return (etag, media_type, body)
+
+    def _list_response(self, request, entry, response=None):
+        """response가 없으면(캐시 적중) 저장된 본문으로 응답을 만듭니다."""
+        etag, content_type, body = entry
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            response = not_modified
+        elif response is None:
+            response = HttpResponse(body, content_type=content_type)
+        response["ETag"] = etag
+        # 사용자별 응답: 공유 캐시에 저장하지 않고 매번 ETag로 재검증합니다.
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ["Authorization"])
+        return response
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 부하 테스트 헬퍼 (명령어가 아닌 내부 모듈)
+
+bench_asgi, bench_db_pool이 같은 코드를 gunicorn(WSGI)/uvicorn(ASGI)으로 띄우고
+asyncio 클라이언트로 keep-alive 연결 여러 개에서 요청을 보낼 때 씁니다.
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import CommandError
+
+SERVERS = {
+    "wsgi": lambda port, options: [
+        *("gunicorn", "config.wsgi:application"),
+        *("--bind", f"127.0.0.1:{port}"),
+        *("--workers", str(options["workers"])),
+        *("--worker-class", "gthread", "--threads", str(options["threads"])),
+        *("--log-level", "warning"),
+    ],
+    "asgi": lambda port, options: [
+        *("uvicorn", "config.asgi:application"),
+        *("--host", "127.0.0.1", "--port", str(port)),
+        *("--workers", str(options["workers"])),
+        *("--no-access-log", "--log-level", "warning"),
+    ],
+}
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_ready(process, port, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise CommandError(
+                f"서버가 시작하지 못했습니다. (exit {process.returncode})"
+            )
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise CommandError(f"서버가 {timeout:.0f}초 안에 응답하지 않습니다.")
+
+
+async def _read_response(reader):
+    """HTTP/1.1 응답 하나를 읽고 상태 코드를 반환합니다. (Content-Length/chunked)"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError
+    length, chunked = 0, False
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.partition(b":")
+        name = name.strip().lower()
+        if name == b"content-length":
+            length = int(value)
+        elif name == b"transfer-encoding":
+            chunked = b"chunked" in value.lower()
+    if chunked:
+        while size := int((await reader.readline()).split(b";")[0], 16):
+            await reader.readexactly(size + 2)
+        await reader.readline()
+    else:
+        await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def _client(port, request, deadline, latencies, failures):
+    reader = writer = None
+    while time.perf_counter() < deadline:
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            started = time.perf_counter()
+            writer.write(request)
+            status = await _read_response(reader)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            # 서버가 keep-alive 연결을 닫으면 다시 연결합니다.
+            writer = None
+            failures.append(0)
+            continue
+        latencies.append(time.perf_counter() - started)
+        if status != 200:
+            failures.append(status)
+    if writer is not None:
+        writer.close()
+
+
+async def _load(port, request, concurrency, duration):
+    latencies, failures = [], []
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*[
+        _client(port, request, deadline, latencies, failures)
+        for _ in range(concurrency)
+    ])
+    return latencies, failures, time.perf_counter() - started
+
+
+def start_server(server, options, **env):
+    """server(wsgi/asgi)를 prod 설정으로 띄우고 (process, port)를 반환합니다."""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", *SERVERS[server](port, options)],
+        cwd=settings.BASE_DIR.parent,
+        env={
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": "config.settings.prod",
+            "DEBUG": "False",
+            **env,
+        },
+    )
+    try:
+        _wait_until_ready(process, port)
+    except CommandError:
+        stop_server(process)
+        raise
+    return process, port
+
+
+def stop_server(process):
+    process.terminate()
+    process.wait(timeout=30)
+
+
+def get_request(path, token):
+    return (
+        f"GET {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Authorization: Bearer {token}\r\n\r\n"
+    ).encode()
+
+
+def run_load(port, request, options):
+    """--warmup초 예열 후 --duration초 동안 보내고 (rps, p50, p99, 오류 수)를 반환"""
+    concurrency = options["concurrency"]
+    asyncio.run(_load(port, request, concurrency, options["warmup"]))
+    latencies, failures, elapsed = asyncio.run(
+        _load(port, request, concurrency, options["duration"])
+    )
+    if not latencies:
+        raise CommandError("응답이 없습니다.")
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    return len(latencies) / elapsed, p50, p99, len(failures)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 데이터 시드 헬퍼 (명령어가 아닌 내부 모듈)
+
+generate_series로 DB 안에서 거래 내역을 만들어 수천만 건도 빠르게 채웁니다.
+post_transaction_amount는 계좌별 누적합으로 계산되어 체인이 항상 일관됩니다.
+"""
+
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.utils import timezone
+
+from accounts.models import Account, Transaction
+
+DETAIL_WORDS = [
+    "스타벅스",
+    "이마트",
+    "월급",
+    "관리비",
+    "택시",
+    "편의점",
+    "쿠팡",
+    "이자",
+]
+
+_SEED_SQL = """
+INSERT INTO {history} (
+    account_id, user_id, transaction_amount, post_transaction_amount,
+    transaction_details, transaction_type, transaction_method,
+    transaction_timestamp, created_at
+)
+SELECT account_id, %(user_id)s, amount,
+       SUM(CASE WHEN kind = 'WITHDRAW' THEN -amount ELSE amount END)
+           OVER (PARTITION BY account_id ORDER BY n),
+       (%(words)s::text[])[1 + n %% %(word_count)s] || ' #' || n,
+       kind,
+       (ARRAY['ATM', 'TRANSFER', 'AUTOMATIC_TRANSFER', 'CARD', 'INTEREST'])[1 + n %% 5],
+       %(start)s::timestamptz + n * %(step)s::interval,
+       now()
+  FROM (
+        SELECT n,
+               (%(account_ids)s::bigint[])[1 + n %% %(account_count)s] AS account_id,
+               (n %% 97 + 1)::numeric(18, 2) AS amount,
+               CASE WHEN n %% 3 = 0 THEN 'WITHDRAW' ELSE 'DEPOSIT' END AS kind
+          FROM generate_series(0, %(rows)s - 1) AS n
+  ) s
+"""
+
+
+def create_bench_user(prefix="bench"):
+    token = uuid.uuid4().hex
+    return get_user_model().objects.create_user(
+        email=f"{prefix}-{token}@example.invalid",
+        password=None,
+        nickname=f"{prefix}-{token[:12]}",
+    )
+
+
+def create_bench_accounts(user, count):
+    return Account.objects.bulk_create([
+        Account(user=user, account_number=f"B{uuid.uuid4().hex[:19]}", bank_code="000")
+        for _ in range(count)
+    ])
+
+
+def seed_history(user, accounts, rows, span=timedelta(days=365), start=None):
+    """
+    accounts에 총 rows건의 거래를 시간순으로 고르게 나누어 넣고,
+    계좌 잔액을 마지막 거래 후 잔액으로 맞춥니다. (입금 2 : 출금 1 비율)
+    """
+    start = start or timezone.now() - span
+    history = connection.ops.quote_name(Transaction._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            _SEED_SQL.format(history=history),
+            {
+                "user_id": user.pk,
+                "account_ids": [account.pk for account in accounts],
+                "account_count": len(accounts),
+                "words": DETAIL_WORDS,
+                "word_count": len(DETAIL_WORDS),
+                "rows": rows,
+                "start": start,
+                "step": span / max(rows, 1),
+            },
+        )
+        cursor.execute(
+            f"""
+            UPDATE {connection.ops.quote_name(Account._meta.db_table)} a
+               SET balance = COALESCE((
+                       SELECT post_transaction_amount FROM {history} t
+                        WHERE t.account_id = a.id
+                        ORDER BY transaction_timestamp DESC, id DESC LIMIT 1
+                   ), 0)
+             WHERE a.user_id = %s
+            """,
+            [user.pk],
+        )
+        cursor.execute(f"ANALYZE {history}")
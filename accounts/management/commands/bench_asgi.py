@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+WSGI(gunicorn) / ASGI(uvicorn) 배포의 조회 API 부하 테스트 (req/s, p50/p99)
+
+    python manage.py bench_asgi --concurrency 256 --duration 15
+
+벤치마크 사용자와 거래 내역을 시드한 뒤 같은 코드를 두 서버로 띄웁니다.
+(DJANGO_SETTINGS_MODULE=config.settings.prod, DEBUG=False)
+
+- wsgi: gunicorn gthread 워커, 기존 동기 뷰 (ASYNC_API_VIEWS=False)
+- asgi: uvicorn 워커, async 조회 뷰 (ASYNC_API_VIEWS=True)
+
+부하는 asyncio 클라이언트가 --concurrency개의 keep-alive 연결로 엔드포인트마다
+--duration초 동안 보냅니다. 클라이언트도 같은 장비에서 CPU를 쓰므로 절대값보다
+두 배포의 상대 비교로 읽어야 합니다.
+"""
+
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import AccessToken
+
+from ._loadtest import SERVERS, get_request, run_load, start_server, stop_server
+from ._seed import create_bench_accounts, create_bench_user, seed_history
+
+
+class Command(BaseCommand):
+    help = "조회 API를 WSGI(gunicorn)와 ASGI(uvicorn)로 띄워 처리량과 p99를 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--accounts", type=int, default=5)
+        parser.add_argument("--concurrency", type=int, default=256)
+        parser.add_argument("--duration", type=float, default=15.0)
+        parser.add_argument("--warmup", type=float, default=2.0)
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument(
+            "--threads", type=int, default=8, help="gunicorn 워커당 스레드 수"
+        )
+        parser.add_argument(
+            "--servers", nargs="+", choices=sorted(SERVERS), default=["wsgi", "asgi"]
+        )
+        parser.add_argument(
+            "--keep", action="store_true", help="벤치마크 데이터를 삭제하지 않음"
+        )
+
+    def handle(self, *args, **options):
+        user = create_bench_user("asgi")
+        try:
+            accounts = create_bench_accounts(user, options["accounts"])
+            seed_history(user, accounts, options["rows"])
+            token = str(AccessToken.for_user(user))
+            prefix = settings.API_MIDDLEWARE["PATH_PREFIX"]
+            endpoints = {
+                "account-list": f"{prefix}accounts/accounts/",
+                "account-detail": f"{prefix}accounts/accounts/{accounts[0].pk}/",
+                "transaction-list": f"{prefix}accounts/transactions/?page_size=20",
+            }
+            for server in options["servers"]:
+                self._run(server, endpoints, token, options)
+        finally:
+            if not options["keep"]:
+                user.delete()
+
+    def _run(self, server, endpoints, token, options):
+        # 목록 캐시를 끄고 매 요청 DB를 읽는 경로를 비교합니다.
+        process, port = start_server(
+            server,
+            options,
+            ASYNC_API_VIEWS=str(server == "asgi"),
+            LIST_CACHE_ENABLED="False",
+        )
+        try:
+            for name, path in endpoints.items():
+                try:
+                    rps, p50, p99, errors = run_load(
+                        port, get_request(path, token), options
+                    )
+                except CommandError as error:
+                    raise CommandError(f"{server} {name}: {error}") from error
+                self.stdout.write(
+                    f"{server:<5} {name:<17} c={options['concurrency']} "
+                    f"rps={rps:,.0f} p50={p50:.1f}ms p99={p99:.1f}ms errors={errors}"
+                )
+        finally:
+            stop_server(process)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+단건 전기 API와 일괄 전기 API의 처리량 비교 벤치마크
+
+    python manage.py bench_bulk_ingest --rows 5000 --accounts 10 --batch 1000
+
+같은 거래 행을 ① POST /transactions/ 한 건씩 ② POST /transactions/bulk/
+NDJSON 배치로 전기하고 rows/sec와 최종 잔액 일치 여부를 출력합니다.
+"""
+
+import json
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.models import Account
+from accounts.views import TransactionBulkCreateView, TransactionListCreateView
+
+from ._seed import create_bench_accounts, create_bench_user
+
+
+def _rows(accounts, count, seed):
+    # 같은 seed면 두 경로의 계좌 순번/금액/일시가 같은 입력이 만들어집니다.
+    rng = random.Random(seed)
+    start = timezone.now() - timedelta(days=1)
+    return [
+        {
+            "account": rng.choice(accounts).pk,
+            "transaction_type": "DEPOSIT" if rng.random() < 0.6 else "WITHDRAW",
+            "transaction_amount": f"{rng.randint(1, 10000) / 100:.2f}",
+            "transaction_method": "TRANSFER",
+            "transaction_details": "bench feed",
+            "transaction_timestamp": (start + timedelta(seconds=index)).isoformat(),
+        }
+        for index in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    help = "단건 전기와 일괄 전기(NDJSON)의 처리량(rows/sec)을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5000)
+        parser.add_argument("--accounts", type=int, default=10)
+        parser.add_argument("--batch", type=int, default=1000, help="일괄 요청당 행 수")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        factory = APIRequestFactory()
+        balances = {}
+        for name in ("single", "bulk"):
+            user = create_bench_user(f"ingest-{name}")
+            try:
+                accounts = create_bench_accounts(user, options["accounts"])
+                Account.objects.filter(user=user).update(balance=100_000)
+                rows = _rows(accounts, options["rows"], options["seed"])
+                started = time.perf_counter()
+                getattr(self, f"_{name}")(factory, user, rows, options)
+                elapsed = time.perf_counter() - started
+                balances[name] = list(
+                    Account.objects.filter(user=user)
+                    .order_by("pk")
+                    .values_list("balance", flat=True)
+                )
+            finally:
+                user.delete()
+            self.stdout.write(
+                f"{name:<6} rows={options['rows']} elapsed={elapsed:.2f}s"
+                f" rows/sec={options['rows'] / elapsed:,.0f}"
+            )
+        if balances["single"] != balances["bulk"]:
+            raise CommandError("두 경로의 최종 잔액이 다릅니다.")
+        self.stdout.write(self.style.SUCCESS("최종 잔액 일치"))
+
+    def _single(self, factory, user, rows, options):
+        view = TransactionListCreateView.as_view()
+        for row in rows:
+            request = factory.post("/api/v1/transactions/", row, format="json")
+            force_authenticate(request, user=user)
+            response = view(request)
+            if response.status_code not in (201, 400):
+                raise CommandError(f"단건 전기 실패: HTTP {response.status_code}")
+
+    def _bulk(self, factory, user, rows, options):
+        view = TransactionBulkCreateView.as_view()
+        for offset in range(0, len(rows), options["batch"]):
+            body = "\n".join(
+                json.dumps(row) for row in rows[offset : offset + options["batch"]]
+            )
+            request = factory.post(
+                "/api/v1/transactions/bulk/",
+                body,
+                content_type="application/x-ndjson",
+            )
+            force_authenticate(request, user=user)
+            response = view(request)
+            if response.status_code not in (201, 207):
+                raise CommandError(f"일괄 전기 실패: HTTP {response.status_code}")
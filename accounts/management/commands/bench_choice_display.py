@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+선택지 이름(display) 직렬화 마이크로 벤치마크
+
+    python manage.py bench_choice_display --rows 10000
+
+get_FOO_display()를 사용하는 기존 방식과 accounts.choices의 미리 계산된
+매핑(ChoiceLabelField)을 사용하는 방식으로 같은 목록을 직렬화해
+행당 소요 시간을 비교합니다. DB를 사용하지 않습니다.
+"""
+
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework import serializers
+
+from accounts.choices import BANK_CHOICES
+from accounts.models import Account, Transaction
+from accounts.serializers import AccountSerializer, TransactionSerializer
+
+
+class LegacyAccountSerializer(AccountSerializer):
+    bank_name = serializers.CharField(source="get_bank_code_display", read_only=True)
+    account_type_display = serializers.CharField(
+        source="get_account_type_display", read_only=True
+    )
+
+
+class LegacyTransactionSerializer(TransactionSerializer):
+    transaction_type_display = serializers.CharField(
+        source="get_transaction_type_display", read_only=True
+    )
+    transaction_method_display = serializers.CharField(
+        source="get_transaction_method_display", read_only=True
+    )
+
+
+class Command(BaseCommand):
+    help = "get_FOO_display() 대비 미리 계산된 선택지 매핑의 직렬화 비용 비교"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        rows, now = options["rows"], timezone.now()
+        banks = [code for code, _ in BANK_CHOICES]
+        accounts = [
+            Account(
+                pk=i,
+                user_id=1,
+                account_number=f"{i:012d}",
+                bank_code=banks[i % len(banks)],
+                account_type="SAVING",
+                balance=Decimal("1000.00"),
+                created_at=now,
+            )
+            for i in range(rows)
+        ]
+        transactions = [
+            Transaction(
+                pk=i,
+                account=account,
+                user_id=1,
+                transaction_amount=Decimal("10.00"),
+                post_transaction_amount=Decimal("1010.00"),
+                transaction_type="DEPOSIT" if i % 2 else "WITHDRAW",
+                transaction_method="CARD",
+                transaction_timestamp=now,
+                created_at=now,
+            )
+            for i, account in enumerate(accounts)
+        ]
+
+        for label, legacy, current, objects in [
+            ("account", LegacyAccountSerializer, AccountSerializer, accounts),
+            (
+                "transaction",
+                LegacyTransactionSerializer,
+                TransactionSerializer,
+                transactions,
+            ),
+        ]:
+            before = self._best(legacy, objects, options["repeat"])
+            after = self._best(current, objects, options["repeat"])
+            saved = (before - after) / rows * 1e6
+            self.stdout.write(
+                f"{label:<12} rows={rows} get_FOO_display={before * 1000:.1f}ms "
+                f"registry={after * 1000:.1f}ms saved/row={saved:.2f}us "
+                f"({(1 - after / before) * 100:.1f}%)"
+            )
+
+    def _best(self, serializer_class, objects, repeat):
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            serializer_class(objects, many=True).data
+            best = min(best, time.perf_counter() - started)
+        return best
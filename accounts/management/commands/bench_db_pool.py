@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+DB 연결 재사용 방식별 조회 API 부하 테스트 (req/s, p50/p99, 연결 재사용률)
+
+    python manage.py bench_db_pool --concurrency 64 --duration 10
+
+config/settings/prod.py의 연결 설정을 환경 변수로 바꿔 가며 같은 코드를
+WSGI(gunicorn)/ASGI(uvicorn)로 띄웁니다. 목록 캐시는 끄고 매 요청 DB를 읽습니다.
+
+- fresh: 요청마다 새 연결 (DB_POOL=False, DB_CONN_MAX_AGE=0)
+- persistent: 스레드별 지속 연결 (DB_POOL=False, DB_CONN_MAX_AGE=60)
+- pool: psycopg 3 연결 풀 (DB_POOL=True)
+
+각 실행 뒤 /api/v1/users/db/metrics/에서 재사용률을 읽습니다. 지표는 응답한
+워커 프로세스 하나의 값이므로 --workers 1에서 가장 정확합니다.
+"""
+
+import json
+import os
+import urllib.request
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from ._loadtest import SERVERS, get_request, run_load, start_server, stop_server
+from ._seed import create_bench_accounts, create_bench_user, seed_history
+
+MODES = {
+    "fresh": {"DB_POOL": "False", "DB_CONN_MAX_AGE": "0"},
+    "persistent": {"DB_POOL": "False", "DB_CONN_MAX_AGE": "60"},
+    "pool": {"DB_POOL": "True"},
+}
+
+
+def _fetch_metrics(port, token):
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}{reverse('users:db-metrics')}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.load(response)
+
+
+class Command(BaseCommand):
+    help = "요청마다 연결 / 지속 연결 / 연결 풀의 처리량, p99, 재사용률을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument("--accounts", type=int, default=5)
+        parser.add_argument("--concurrency", type=int, default=64)
+        parser.add_argument("--duration", type=float, default=10.0)
+        parser.add_argument("--warmup", type=float, default=2.0)
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument(
+            "--threads", type=int, default=8, help="gunicorn 워커당 스레드 수"
+        )
+        parser.add_argument(
+            "--servers", nargs="+", choices=sorted(SERVERS), default=["wsgi", "asgi"]
+        )
+        parser.add_argument(
+            "--modes", nargs="+", choices=list(MODES), default=list(MODES)
+        )
+        parser.add_argument(
+            "--keep", action="store_true", help="벤치마크 데이터를 삭제하지 않음"
+        )
+
+    def handle(self, *args, **options):
+        user = create_bench_user("dbpool")
+        try:
+            # 지표 API(관리자 전용)를 같은 토큰으로 읽습니다.
+            user.is_staff = True
+            user.save(update_fields=["is_staff"])
+            accounts = create_bench_accounts(user, options["accounts"])
+            seed_history(user, accounts, options["rows"])
+            token = str(AccessToken.for_user(user))
+            prefix = settings.API_MIDDLEWARE["PATH_PREFIX"]
+            endpoints = {
+                "account-detail": f"{prefix}accounts/accounts/{accounts[0].pk}/",
+                "transaction-list": f"{prefix}accounts/transactions/?page_size=20",
+            }
+            for server in options["servers"]:
+                for mode in options["modes"]:
+                    self._run(server, mode, endpoints, token, options)
+        finally:
+            if not options["keep"]:
+                user.delete()
+
+    def _run(self, server, mode, endpoints, token, options):
+        process, port = start_server(
+            server,
+            options,
+            ASYNC_API_VIEWS=str(server == "asgi"),
+            LIST_CACHE_ENABLED="False",
+            **MODES[mode],
+        )
+        try:
+            for name, path in endpoints.items():
+                try:
+                    rps, p50, p99, errors = run_load(
+                        port, get_request(path, token), options
+                    )
+                except CommandError as error:
+                    raise CommandError(f"{server} {mode} {name}: {error}") from error
+                self.stdout.write(
+                    f"{server:<5} {mode:<10} {name:<17} c={options['concurrency']} "
+                    f"rps={rps:,.0f} p50={p50:.1f}ms p99={p99:.1f}ms errors={errors}"
+                )
+            metrics = _fetch_metrics(port, token)
+            self.stdout.write(
+                f"{server:<5} {mode:<10} reuse_ratio={metrics['reuse_ratio']} "
+                f"requests={metrics['requests']} connections={metrics['connections']}"
+                f" pools={metrics['pools']}"
+            )
+        finally:
+            stop_server(process)
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+미들웨어 체인의 요청당 비용 벤치마크 (기존 체인 / API 경로 경량 체인)
+
+    python manage.py bench_middleware --requests 5000
+
+URL 해석과 뷰 대신 고정 응답을 돌려주는 핸들러에 MIDDLEWARE를 올려
+미들웨어만의 요청당 비용을 잽니다. 기존 체인은 config.middleware의
+하위 클래스 대신 Django 기본 미들웨어를 사용합니다. DB를 사용하지 않습니다.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.handlers.base import BaseHandler
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.utils.module_loading import import_string
+
+from config.middleware import LoopSafeMixin, WebOnlyMixin
+
+
+class _StubViewHandler(BaseHandler):
+    """뷰 대신 고정 응답을 돌려주는 핸들러 (미들웨어 비용만 측정)"""
+
+    def _get_response(self, request):
+        return HttpResponse(b"{}", content_type="application/json")
+
+
+def _django_middleware():
+    # config.middleware 하위 클래스를 원래 Django 미들웨어로 되돌린 목록
+    paths = []
+    for path in settings.MIDDLEWARE:
+        middleware = import_string(path)
+        if issubclass(middleware, (LoopSafeMixin, WebOnlyMixin)):
+            base = middleware.__bases__[-1]
+            path = f"{base.__module__}.{base.__qualname__}"
+        paths.append(path)
+    return paths
+
+
+class Command(BaseCommand):
+    help = "API 요청의 미들웨어 비용을 기존 체인과 경량 체인으로 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=5000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        prefix = settings.API_MIDDLEWARE["PATH_PREFIX"]
+        cases = [
+            ("django", _django_middleware(), False),
+            ("lean", settings.MIDDLEWARE, True),
+        ]
+        results = {}
+        for label, middleware, lean in cases:
+            with override_settings(
+                MIDDLEWARE=middleware,
+                API_MIDDLEWARE={"LEAN": lean, "PATH_PREFIX": prefix},
+            ):
+                handler = _StubViewHandler()
+                handler.load_middleware()
+                for path in [f"{prefix}accounts/", "/admin/login/"]:
+                    results[label, path] = self._best(handler, path, options)
+
+        requests = options["requests"]
+        for (label, path), elapsed in results.items():
+            self.stdout.write(
+                f"{label:<7} {path:<20} per_request={elapsed / requests * 1e6:.1f}us"
+            )
+        api = f"{prefix}accounts/"
+        saved = results["django", api] - results["lean", api]
+        self.stdout.write(f"saved/api_request={saved / requests * 1e6:.1f}us")
+
+    def _best(self, handler, path, options):
+        factory = RequestFactory()
+        # 브라우저 클라이언트처럼 Refresh 토큰 쿠키를 함께 보냅니다.
+        factory.cookies[settings.SIMPLE_JWT["REFRESH_TOKEN_COOKIE_NAME"]] = "x" * 300
+        best = float("inf")
+        for _ in range(options["repeat"]):
+            requests = [factory.get(path) for _ in range(options["requests"])]
+            started = time.perf_counter()
+            for request in requests:
+                handler._middleware_chain(request)
+            best = min(best, time.perf_counter() - started)
+        return best
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+파티션/일반 테이블의 목록·집계 지연 시간 비교 벤치마크 (PostgreSQL 전용)
+
+    python manage.py bench_partitioning --rows 50000000 --months 24
+
+transaction_history와 같은 컬럼/인덱스를 가진 임시 테이블 두 개
+(bench_tx_plain: 일반, bench_tx_part: 월별 파티션)에 같은 데이터를 채우고,
+같은 쿼리를 반복 실행해 p50/p95 지연 시간을 출력합니다.
+실제 거래 테이블은 건드리지 않으며 끝나면 임시 테이블을 삭제합니다.
+"""
+
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from accounts import partitioning
+
+PLAIN, PARTITIONED = "bench_tx_plain", "bench_tx_part"
+
+_COLUMNS = """
+    id bigint NOT NULL,
+    user_id bigint NOT NULL,
+    account_id bigint NOT NULL,
+    transaction_amount numeric(18, 2) NOT NULL,
+    transaction_type varchar(10) NOT NULL,
+    transaction_timestamp timestamptz NOT NULL
+"""
+
+_FILL_SQL = f"""
+INSERT INTO {PLAIN}
+SELECT n, 1 + n %% %(users)s, 1 + n %% (%(users)s * 2), (n %% 97 + 1)::numeric,
+       CASE WHEN n %% 3 = 0 THEN 'WITHDRAW' ELSE 'DEPOSIT' END,
+       %(start)s::timestamptz + n * %(step)s::interval
+  FROM generate_series(0, %(rows)s - 1) AS n
+"""
+
+# {table}만 바꿔 두 테이블에 같은 쿼리를 실행합니다.
+QUERIES = {
+    # 목록 API: 사용자 + 기간(30일) 키셋 첫 페이지
+    "list(30일)": """
+        SELECT * FROM {table}
+         WHERE user_id = %(user)s
+           AND transaction_timestamp >= %(at)s - interval '30 days'
+           AND transaction_timestamp < %(at)s
+         ORDER BY transaction_timestamp DESC, id DESC LIMIT 20
+    """,
+    # 목록 API: 기간 조건 없는 최신 페이지
+    "list(최신)": """
+        SELECT * FROM {table}
+         WHERE user_id = %(user)s
+         ORDER BY transaction_timestamp DESC, id DESC LIMIT 20
+    """,
+    # 사용자 월간 합계
+    "aggregate(사용자 월)": """
+        SELECT transaction_type, SUM(transaction_amount), COUNT(*) FROM {table}
+         WHERE user_id = %(user)s
+           AND transaction_timestamp >= %(at)s - interval '1 month'
+           AND transaction_timestamp < %(at)s
+         GROUP BY transaction_type
+    """,
+    # 전체 월간 합계 (리포트/아카이빙 대상 산정)
+    "aggregate(전체 월)": """
+        SELECT SUM(transaction_amount), COUNT(*) FROM {table}
+         WHERE transaction_timestamp >= %(at)s - interval '1 month'
+           AND transaction_timestamp < %(at)s
+    """,
+}
+
+
+class Command(BaseCommand):
+    help = "월별 파티션 테이블과 일반 테이블의 목록/집계 지연 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=50_000_000)
+        parser.add_argument("--months", type=int, default=24)
+        parser.add_argument("--users", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=30)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--keep", action="store_true", help="벤치마크 테이블을 삭제하지 않음"
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError(
+                "파티셔닝 벤치마크는 PostgreSQL에서만 실행할 수 있습니다."
+            )
+
+        end = partitioning.add_months(partitioning.month_start(timezone.now()), 1)
+        start = partitioning.add_months(end, -options["months"])
+        try:
+            self._setup(start, end, options)
+            self._run(start, end, options)
+        finally:
+            if not options["keep"]:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"DROP TABLE IF EXISTS {PLAIN}, {PARTITIONED}")
+
+    def _setup(self, start, end, options):
+        started = time.perf_counter()
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {PLAIN}, {PARTITIONED}")
+            cursor.execute(f"CREATE TABLE {PLAIN} ({_COLUMNS})")
+            cursor.execute(
+                f"CREATE TABLE {PARTITIONED} ({_COLUMNS})"
+                " PARTITION BY RANGE (transaction_timestamp)"
+            )
+            for offset in range(options["months"]):
+                lower = partitioning.add_months(start, offset)
+                cursor.execute(
+                    f"CREATE TABLE {PARTITIONED}_p{lower:%Y%m} PARTITION OF"
+                    f" {PARTITIONED} FOR VALUES FROM (%s) TO (%s)",
+                    [lower, partitioning.add_months(start, offset + 1)],
+                )
+            cursor.execute(
+                _FILL_SQL,
+                {
+                    "users": options["users"],
+                    "rows": options["rows"],
+                    "start": start,
+                    "step": (end - start) / options["rows"],
+                },
+            )
+            cursor.execute(f"INSERT INTO {PARTITIONED} SELECT * FROM {PLAIN}")
+            for table in (PLAIN, PARTITIONED):
+                cursor.execute(
+                    f"ALTER TABLE {table} ADD PRIMARY KEY (id, transaction_timestamp)"
+                )
+                cursor.execute(
+                    f"CREATE INDEX ON {table}"
+                    " (user_id, transaction_timestamp DESC, id DESC)"
+                )
+                cursor.execute(f"ANALYZE {table}")
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"{options['rows']:,}건 x 2 테이블 준비: {elapsed:.1f}s")
+
+    def _run(self, start, end, options):
+        rng = random.Random(options["seed"])
+        span = (end - start).total_seconds()
+        with connection.cursor() as cursor:
+            for name, sql in QUERIES.items():
+                results = []
+                params = [
+                    {
+                        "user": rng.randint(1, options["users"]),
+                        "at": start + timedelta(seconds=rng.uniform(span / 12, span)),
+                    }
+                    for _ in range(options["repeat"])
+                ]
+                for table in (PLAIN, PARTITIONED):
+                    query = sql.format(table=table)
+                    cursor.execute(query, params[0])  # 캐시 예열
+                    cursor.fetchall()
+                    timings = []
+                    for param in params:
+                        started = time.perf_counter()
+                        cursor.execute(query, param)
+                        cursor.fetchall()
+                        timings.append((time.perf_counter() - started) * 1000)
+                    results.append((
+                        statistics.median(timings),
+                        statistics.quantiles(timings, n=20)[-1],
+                    ))
+                (plain_p50, plain_p95), (part_p50, part_p95) = results
+                self.stdout.write(
+                    f"{name:<18} plain p50={plain_p50:8.2f}ms p95={plain_p95:8.2f}ms"
+                    f" | partitioned p50={part_p50:8.2f}ms p95={part_p95:8.2f}ms"
+                )
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+단일 핫 계좌에 대한 동시 전기(posting) 스트레스 벤치마크
+
+    python manage.py bench_posting --threads 16 --posts 500
+
+여러 스레드가 같은 계좌에 입금/출금을 동시에 전기한 뒤
+최종 잔액과 post_transaction_amount 체인이 정확한지 검증하고
+초당 전기 건수를 출력합니다.
+"""
+
+import random
+import threading
+import time
+import uuid
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from accounts import ledger
+from accounts.models import Account, Transaction
+
+
+class Command(BaseCommand):
+    help = "단일 계좌 동시 전기 스트레스 벤치마크 (정합성 검증 + posts/sec)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--posts", type=int, default=200, help="스레드당 전기 수")
+        parser.add_argument("--initial", type=Decimal, default=Decimal("1000.00"))
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--keep", action="store_true", help="벤치마크 데이터를 삭제하지 않음"
+        )
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.create_user(
+            email=f"bench-{uuid.uuid4().hex}@example.invalid",
+            password=None,
+            nickname=f"bench-{uuid.uuid4().hex[:12]}",
+        )
+        account = Account.objects.create(
+            user=user,
+            account_number=f"B{uuid.uuid4().hex[:19]}",
+            bank_code="000",
+            balance=options["initial"],
+        )
+        try:
+            self._run(account, options)
+        finally:
+            if not options["keep"]:
+                user.delete()
+
+    def _run(self, account, options):
+        results = []
+        lock = threading.Lock()
+
+        def worker(index):
+            rng = random.Random(options["seed"] + index)
+            applied, rejected = Decimal("0"), 0
+            try:
+                for _ in range(options["posts"]):
+                    trans_type = rng.choice(["DEPOSIT", "WITHDRAW"])
+                    amount = Decimal(rng.randint(1, 10000)) / 100
+                    try:
+                        ledger.post_transaction(
+                            Account(pk=account.pk),
+                            trans_type,
+                            amount,
+                            timezone.now(),
+                            transaction_details="bench",
+                        )
+                    except ledger.InsufficientBalance:
+                        rejected += 1
+                    else:
+                        applied += ledger.signed_amount(trans_type, amount)
+            finally:
+                connection.close()
+            with lock:
+                results.append((applied, rejected))
+
+        threads = [
+            threading.Thread(target=worker, args=(i,))
+            for i in range(options["threads"])
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        expected = options["initial"] + sum(applied for applied, _ in results)
+        rejected = sum(count for _, count in results)
+        posted = options["threads"] * options["posts"] - rejected
+
+        account.refresh_from_db()
+        if account.balance != expected:
+            raise CommandError(
+                f"잔액 불일치: expected={expected} actual={account.balance}"
+            )
+
+        # 거래 일시 순(같으면 id 순)으로 post_transaction_amount 체인 검증
+        # (스레드 간 시각이 엇갈린 거래는 다시 누적되므로 전기 순서와 다를 수 있음)
+        running = options["initial"]
+        rows = (
+            Transaction.objects.filter(account=account)
+            .order_by("transaction_timestamp", "id")
+            .values_list(
+                "transaction_type", "transaction_amount", "post_transaction_amount"
+            )
+        )
+        count = 0
+        for trans_type, amount, post_amount in rows.iterator():
+            running += ledger.signed_amount(trans_type, amount)
+            if post_amount != running:
+                raise CommandError(
+                    f"체인 불일치: expected={running} actual={post_amount}"
+                )
+            count += 1
+        if count != posted:
+            raise CommandError(f"거래 건수 불일치: expected={posted} actual={count}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"threads={options['threads']} posted={posted} rejected={rejected} "
+                f"elapsed={elapsed:.3f}s posts/sec={posted / elapsed:.1f} "
+                f"balance={account.balance} (검증 통과)"
+            )
+        )
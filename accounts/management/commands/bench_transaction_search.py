@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+거래 내역 검색(필터 + 키셋 페이지네이션) 지연 시간 벤치마크
+
+    python manage.py bench_transaction_search --rows 10000000 --slo-ms 100
+
+벤치마크 사용자에게 rows건의 거래를 생성한 뒤 필터 조합마다
+목록 API 첫 페이지와 다음 페이지를 반복 요청해 p50/p95 지연 시간을 출력합니다.
+p95가 --slo-ms를 넘는 조합이 있으면 실패로 종료합니다.
+"""
+
+import statistics
+import time
+from datetime import timedelta
+from urllib.parse import parse_qs, urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.views import TransactionListCreateView
+
+from ._seed import create_bench_accounts, create_bench_user, seed_history
+
+
+def _scenarios(accounts, now):
+    month_ago = (now - timedelta(days=30)).isoformat()
+    return {
+        "전체": {},
+        "기간(30일)": {"start": month_ago},
+        "계좌": {"account": accounts[0].pk},
+        "출금": {"transaction_type": "WITHDRAW"},
+        "카드결제": {"transaction_method": "CARD"},
+        "금액 범위": {"min_amount": "90", "max_amount": "95"},
+        "설명 검색": {"q": "관리비"},
+        "설명 검색(희소)": {"q": "#4242"},
+        "복합": {
+            "start": month_ago,
+            "account": accounts[0].pk,
+            "transaction_type": "DEPOSIT",
+            "min_amount": "50",
+        },
+    }
+
+
+class Command(BaseCommand):
+    help = "거래 내역 필터 조합별 목록 API 지연 시간 벤치마크 (p50/p95)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000_000)
+        parser.add_argument("--accounts", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--slo-ms", type=float, default=100.0)
+        parser.add_argument(
+            "--keep", action="store_true", help="벤치마크 데이터를 삭제하지 않음"
+        )
+
+    def handle(self, *args, **options):
+        user = create_bench_user("search")
+        try:
+            accounts = create_bench_accounts(user, options["accounts"])
+            started = time.perf_counter()
+            seed_history(user, accounts, options["rows"])
+            elapsed = time.perf_counter() - started
+            self.stdout.write(f"seeded {options['rows']:,} rows in {elapsed:.1f}s")
+            failures = self._run(user, accounts, options)
+        finally:
+            if not options["keep"]:
+                user.delete()
+        if failures:
+            raise CommandError(f"SLO 초과: {', '.join(failures)}")
+
+    def _run(self, user, accounts, options):
+        factory = APIRequestFactory()
+        view = TransactionListCreateView.as_view()
+
+        def request(params):
+            req = factory.get("/api/v1/transactions/", params)
+            force_authenticate(req, user=user)
+            started = time.perf_counter()
+            response = view(req)
+            response.render()
+            elapsed = (time.perf_counter() - started) * 1000
+            if response.status_code != 200:
+                raise CommandError(f"{params}: HTTP {response.status_code}")
+            return elapsed, response.data
+
+        failures = []
+        for name, params in _scenarios(accounts, timezone.now()).items():
+            timings = []
+            for _ in range(options["repeat"]):
+                elapsed, data = request(params)
+                timings.append(elapsed)
+                # 두 번째 페이지는 커서 조건(seek)까지 포함한 경로를 측정합니다.
+                if data["next"]:
+                    cursor = parse_qs(urlsplit(data["next"]).query)["cursor"][0]
+                    timings.append(request({**params, "cursor": cursor})[0])
+            p50 = statistics.median(timings)
+            p95 = statistics.quantiles(timings, n=20)[-1]
+            status = "OK" if p95 <= options["slo_ms"] else "SLO 초과"
+            self.stdout.write(
+                f"{name:<16} p50={p50:8.2f}ms p95={p95:8.2f}ms "
+                f"rows={len(data['results']):3d} {status}"
+            )
+            if p95 > options["slo_ms"]:
+                failures.append(name)
+        return failures
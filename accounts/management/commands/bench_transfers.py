@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+계좌 링(ring) 동시 이체 스트레스 벤치마크
+
+    python manage.py bench_transfers --threads 16 --accounts 8 --transfers 200
+
+계좌 N개를 원형으로 놓고, 여러 스레드가 이웃 계좌 사이(i → i±1)로 동시에
+이체합니다. 양방향 이체가 섞이므로 잠금 순서가 어긋나면 교착 상태가 나는
+구성입니다. 끝난 뒤 교착 상태 횟수, 총 잔액 보존, 계좌별
+post_transaction_amount 체인을 검증하고 초당 이체 건수를 출력합니다.
+"""
+
+import random
+import threading
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection
+from django.utils import timezone
+
+from accounts import ledger
+from accounts.models import Account, Transaction
+
+from ._seed import create_bench_accounts, create_bench_user
+
+
+class Command(BaseCommand):
+    help = "계좌 링 동시 이체 스트레스 벤치마크 (교착 상태/정합성 검증 + transfers/sec)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--accounts", type=int, default=8)
+        parser.add_argument(
+            "--transfers", type=int, default=200, help="스레드당 이체 수"
+        )
+        parser.add_argument("--initial", type=Decimal, default=Decimal("1000.00"))
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--keep", action="store_true", help="벤치마크 데이터를 삭제하지 않음"
+        )
+
+    def handle(self, *args, **options):
+        if options["accounts"] < 2:
+            raise CommandError("--accounts는 2 이상이어야 합니다.")
+        user = create_bench_user("transfer")
+        try:
+            accounts = create_bench_accounts(user, options["accounts"])
+            Account.objects.filter(user=user).update(balance=options["initial"])
+            self._run(user, [account.pk for account in accounts], options)
+        finally:
+            if not options["keep"]:
+                user.delete()
+
+    def _run(self, user, ring, options):
+        counts = {"transferred": 0, "rejected": 0, "deadlocks": 0}
+        lock = threading.Lock()
+
+        def worker(index):
+            rng = random.Random(options["seed"] + index)
+            local = dict.fromkeys(counts, 0)
+            try:
+                for _ in range(options["transfers"]):
+                    position = rng.randrange(len(ring))
+                    neighbour = (position + rng.choice((1, -1))) % len(ring)
+                    try:
+                        ledger.transfer(
+                            ring[position],
+                            ring[neighbour],
+                            Decimal(rng.randint(1, 5000)) / 100,
+                            timezone.now(),
+                            transaction_details="bench ring",
+                            user=user,
+                        )
+                    except ledger.InsufficientBalance:
+                        local["rejected"] += 1
+                    except OperationalError as exc:
+                        if "deadlock" not in str(exc):
+                            raise
+                        local["deadlocks"] += 1
+                    else:
+                        local["transferred"] += 1
+            finally:
+                connection.close()
+            with lock:
+                for key, value in local.items():
+                    counts[key] += value
+
+        threads = [
+            threading.Thread(target=worker, args=(i,))
+            for i in range(options["threads"])
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        self._verify(ring, counts, options)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"threads={options['threads']} accounts={len(ring)}"
+                f" transferred={counts['transferred']} rejected={counts['rejected']}"
+                f" deadlocks={counts['deadlocks']} elapsed={elapsed:.3f}s"
+                f" transfers/sec={counts['transferred'] / elapsed:.1f} (검증 통과)"
+            )
+        )
+
+    def _verify(self, ring, counts, options):
+        if counts["deadlocks"]:
+            raise CommandError(f"교착 상태 {counts['deadlocks']}회 발생")
+
+        balances = dict(
+            Account.objects.filter(pk__in=ring).values_list("pk", "balance")
+        )
+        expected_total = options["initial"] * len(ring)
+        if sum(balances.values()) != expected_total:
+            raise CommandError(
+                f"총 잔액 불일치: expected={expected_total}"
+                f" actual={sum(balances.values())}"
+            )
+
+        # 계좌별 거래 일시 순(같으면 id 순)으로 post_transaction_amount 체인 검증
+        running = dict.fromkeys(ring, options["initial"])
+        rows = (
+            Transaction.objects.filter(account_id__in=ring)
+            .order_by("transaction_timestamp", "id")
+            .values_list(
+                "account_id",
+                "transaction_type",
+                "transaction_amount",
+                "post_transaction_amount",
+            )
+        )
+        legs = 0
+        for account_id, trans_type, amount, post_amount in rows.iterator():
+            running[account_id] += ledger.signed_amount(trans_type, amount)
+            if post_amount != running[account_id]:
+                raise CommandError(
+                    f"체인 불일치(계좌 {account_id}): expected={running[account_id]}"
+                    f" actual={post_amount}"
+                )
+            legs += 1
+        if legs != counts["transferred"] * 2 or running != balances:
+            raise CommandError(
+                f"거래 건수/잔액 불일치: legs={legs}"
+                f" transferred={counts['transferred']}"
+            )
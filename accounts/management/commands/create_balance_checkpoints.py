@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+잔액 체크포인트 생성 (주기 실행용: cron 등)
+
+    python manage.py create_balance_checkpoints
+    python manage.py create_balance_checkpoints --as-of 2025-01-01T00:00:00+09:00
+
+거래 내역을 아카이빙하기 전에 아카이빙 기준 시점으로 실행해 두면
+아카이빙 이후에도 시점 잔액 조회가 체크포인트로 응답합니다.
+원장 샤드(settings.LEDGER_SHARDS["ALIASES"])마다 실행합니다.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from accounts.balances import create_checkpoints
+from accounts.sharding import use_shard
+
+
+class Command(BaseCommand):
+    help = "계좌별 잔액 체크포인트를 기록합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--as-of", help="기준 시점 (ISO 8601, 기본값: 현재)")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        as_of = None
+        if options["as_of"]:
+            as_of = parse_datetime(options["as_of"])
+            if as_of is None or as_of.tzinfo is None:
+                raise CommandError(
+                    "--as-of는 시간대를 포함한 ISO 8601 형식이어야 합니다."
+                )
+
+        created = 0
+        for alias in settings.LEDGER_SHARDS["ALIASES"]:
+            with use_shard(alias):
+                created += create_checkpoints(as_of, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"체크포인트 {created}건 기록"))
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+사용자 한 명의 원장을 다른 샤드로 이동 (accounts/sharding.py)
+
+    python manage.py move_ledger_user 42 shard2
+    python manage.py move_ledger_user 42 default --grace 10
+
+이동하는 동안 그 사용자의 쓰기 요청만 503으로 거절됩니다. 대상 샤드는
+settings.LEDGER_SHARDS["ALIASES"]에 있어야 하고 migrate가 끝나 있어야 합니다.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.sharding import is_enabled, move_user
+
+
+class Command(BaseCommand):
+    help = "사용자의 계좌/거래/집계를 다른 원장 샤드로 옮깁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("user_id", type=int)
+        parser.add_argument("target", help="대상 샤드 별칭 (예: shard1)")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--grace",
+            type=float,
+            help="맵 변경 후 대기 시간(초, 기본값: LEDGER_SHARDS['MAP_TTL'])",
+        )
+
+    def handle(self, *args, **options):
+        if not is_enabled():
+            raise CommandError("LEDGER_SHARDS에 샤드가 하나뿐입니다.")
+        try:
+            counts = move_user(
+                options["user_id"],
+                options["target"],
+                batch_size=options["batch_size"],
+                grace=options["grace"],
+                log=self.stdout.write,
+            )
+        except ValueError as error:
+            raise CommandError(error) from error
+        if not counts:
+            self.stdout.write("이미 대상 샤드에 있습니다.")
+            return
+        total = sum(counts.values())
+        self.stdout.write(self.style.SUCCESS(f"{total}행 이동 완료"))
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+거래 내역 월별 파티션 관리 (PostgreSQL 전용, 주기 실행용: cron 등)
+
+    python manage.py partition_transactions                # 앞으로 쓸 파티션 생성
+    python manage.py partition_transactions --months-ahead 6
+    python manage.py partition_transactions --convert      # 최초 1회 변환 (잠김)
+    python manage.py partition_transactions --list
+
+--convert 없이 실행하면 이번 달부터 --months-ahead개월 뒤까지의 파티션이
+없을 때만 만듭니다. 월말 전에 다음 달 파티션이 준비되어 있어야 새 거래가
+기본 파티션(transaction_history_default)으로 들어가지 않습니다.
+원장 샤드(settings.LEDGER_SHARDS["ALIASES"])마다 실행합니다.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from accounts import partitioning
+from accounts.sharding import use_shard
+
+
+class Command(BaseCommand):
+    help = "transaction_history 월별 파티션을 만들거나 파티션 테이블로 변환합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=settings.TRANSACTION_PARTITIONING["MONTHS_AHEAD"],
+        )
+        parser.add_argument(
+            "--convert", action="store_true", help="일반 테이블을 파티션 테이블로 변환"
+        )
+        parser.add_argument(
+            "--keep-legacy",
+            action="store_true",
+            help="변환 후 기존 테이블을 transaction_history_legacy로 남김",
+        )
+        parser.add_argument("--list", action="store_true", help="파티션 목록 출력")
+
+    def handle(self, *args, **options):
+        aliases = settings.LEDGER_SHARDS["ALIASES"]
+        if any(connections[alias].vendor != "postgresql" for alias in aliases):
+            raise CommandError("파티셔닝은 PostgreSQL에서만 지원합니다.")
+
+        for alias in aliases:
+            with use_shard(alias):
+                self._handle_shard(alias, options)
+
+    def _handle_shard(self, alias, options):
+        if options["convert"]:
+            partitioning.convert(
+                months_ahead=options["months_ahead"],
+                keep_legacy=options["keep_legacy"],
+                log=lambda message: self.stdout.write(f"[{alias}] {message}"),
+                using=alias,
+            )
+        elif not partitioning.is_partitioned(using=alias):
+            raise CommandError(
+                f"[{alias}] {partitioning.TABLE}은(는) 파티션 테이블이 아닙니다."
+                " (--convert로 먼저 변환하세요)"
+            )
+        else:
+            created = partitioning.ensure_partitions(
+                options["months_ahead"], using=alias
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"[{alias}] 파티션 {len(created)}개 생성: {', '.join(created)}"
+                )
+            )
+
+        if options["list"]:
+            for name, bound in partitioning.partitions(using=alias):
+                self.stdout.write(f"[{alias}] {name:<40} {bound}")
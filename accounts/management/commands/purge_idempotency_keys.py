@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+보관 기간(settings.IDEMPOTENCY["TTL"])이 지난 Idempotency-Key 정리 (주기 실행용)
+
+    python manage.py purge_idempotency_keys --batch-size 10000
+
+만료된 키는 같은 키의 새 요청이 덮어쓰므로 정리는 테이블 크기 관리용입니다.
+원장 샤드(settings.LEDGER_SHARDS["ALIASES"])마다 실행합니다.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from accounts.idempotency import purge_expired
+from accounts.sharding import use_shard
+
+
+class Command(BaseCommand):
+    help = "만료된 Idempotency-Key 행을 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=10_000)
+
+    def handle(self, *args, **options):
+        deleted = 0
+        for alias in settings.LEDGER_SHARDS["ALIASES"]:
+            with use_shard(alias):
+                deleted += purge_expired(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"만료된 키 {deleted}건 삭제"))
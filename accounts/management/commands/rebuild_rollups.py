@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+소비 집계(SpendingRollup) 재계산 (백필/복구용)
+
+    python manage.py rebuild_rollups
+    python manage.py rebuild_rollups --user 42
+
+집계 테이블 도입 이전의 거래 내역이나 벌크 적재(COPY 등)로 들어온 거래는
+집계에 반영되어 있지 않으므로 한 번 실행해 채워 줍니다.
+사용자 단위 재계산은 해당 사용자의 집계 행만 지우고 다시 만듭니다.
+전체 재계산은 원장 샤드마다, 사용자 단위는 그 사용자의 샤드에서 실행합니다.
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.rollups import rebuild
+from accounts.sharding import shard_of, use_shard
+
+
+class Command(BaseCommand):
+    help = "거래 내역에서 일/주/월 소비 집계를 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user", type=int, help="재계산할 사용자 ID (기본값: 전체)"
+        )
+
+    def handle(self, *args, **options):
+        user, aliases = None, settings.LEDGER_SHARDS["ALIASES"]
+        if options["user"] is not None:
+            user = get_user_model().objects.filter(pk=options["user"]).first()
+            if user is None:
+                raise CommandError(f"사용자 {options['user']}을(를) 찾을 수 없습니다.")
+            aliases = [shard_of(user.pk)[0]]
+
+        created = 0
+        for alias in aliases:
+            with use_shard(alias):
+                created += rebuild(user)
+        self.stdout.write(self.style.SUCCESS(f"집계 {created}행 기록"))
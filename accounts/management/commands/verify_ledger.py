@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+원장 정합성 검증 (post_transaction_amount 체인 + 계좌 잔액)
+
+    python manage.py verify_ledger --workers 8
+    python manage.py verify_ledger --workers 8 --output mismatches.jsonl --repair
+
+불일치는 한 줄에 하나씩 JSON(JSON Lines)으로 출력합니다.
+
+    {"kind": "chain", "account_id": 3, "transaction_id": 41, "expected": "900.00",
+     "actual": "950.00", "rows": 2, "database": "default"}
+    {"kind": "balance", "account_id": 3, "expected": "950.00", "actual": "1000.00",
+     "database": "default"}
+
+원장 샤드(settings.LEDGER_SHARDS["ALIASES"])마다 차례로 검증합니다.
+
+요약은 stderr에 출력하며, 남은 불일치가 있으면 종료 코드가 0이 아닙니다.
+--repair는 검증이 끝난 뒤 불일치 계좌를 잠그고 다시 누적합니다.
+"""
+
+import json
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts import reconcile
+from accounts.sharding import use_shard
+
+
+class Command(BaseCommand):
+    help = "거래 후 잔액 체인과 계좌 잔액을 검증합니다. (--repair로 복구)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="검증 프로세스 수 (0이면 현재 프로세스에서 실행)",
+        )
+        parser.add_argument(
+            "--batch-accounts", type=int, default=1000, help="작업 하나의 계좌 수"
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=10_000, help="한 번에 읽는 거래 행 수"
+        )
+        parser.add_argument("--output", help="불일치 보고서 경로 (기본값: stdout)")
+        parser.add_argument(
+            "--repair", action="store_true", help="불일치 계좌를 다시 누적해 복구"
+        )
+
+    def handle(self, *args, **options):
+        output = open(options["output"], "w") if options["output"] else self.stdout
+        started = time.perf_counter()
+        rows, mismatches = 0, {}
+        try:
+            for alias in settings.LEDGER_SHARDS["ALIASES"]:
+                mismatches[alias] = []
+                with use_shard(alias):
+                    for checked, found in reconcile.verify(
+                        workers=options["workers"],
+                        batch_accounts=options["batch_accounts"],
+                        chunk_size=options["chunk_size"],
+                        using=alias,
+                    ):
+                        rows += checked
+                        for mismatch in found:
+                            record = {**mismatch, "database": alias}
+                            output.write(json.dumps(record) + "\n")
+                        mismatches[alias].extend(found)
+        finally:
+            if output is not self.stdout:
+                output.close()
+        elapsed = time.perf_counter() - started
+
+        accounts = {
+            (alias, mismatch["account_id"])
+            for alias, found in mismatches.items()
+            for mismatch in found
+        }
+        summary = (
+            f"rows={rows} elapsed={elapsed:.3f}s"
+            f" rows/sec={rows / max(elapsed, 1e-9):.0f}"
+            f" mismatches={sum(map(len, mismatches.values()))}"
+            f" accounts={len(accounts)}"
+        )
+        if options["repair"] and accounts:
+            repaired, failed = [], []
+            for alias, found in mismatches.items():
+                if not found:
+                    continue
+                with use_shard(alias):
+                    fixed, broken = reconcile.repair(found, using=alias)
+                repaired.extend(fixed)
+                failed.extend(broken)
+            summary += f" repaired={len(repaired)} failed={failed}"
+            accounts = set(failed)
+        if accounts:
+            raise CommandError(f"원장 불일치: {summary}")
+        self.stderr.write(f"원장 검증 완료: {summary}", style_func=self.style.SUCCESS)
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.7 on 2026-10-18 06:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_transaction_user(apps, schema_editor):
+    """기존 거래 내역의 소유자를 계좌 소유자로 한 번의 UPDATE로 채웁니다."""
+    Account = apps.get_model("accounts", "Account")
+    Transaction = apps.get_model("accounts", "Transaction")
+    Transaction.objects.using(schema_editor.connection.alias).update(
+        user_id=Subquery(
+            Account.objects.filter(pk=OuterRef("account_id")).values("user_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="transaction",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="transactions",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="소유자",
+            ),
+        ),
+        migrations.RunPython(populate_transaction_user, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="transaction",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="transactions",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="소유자",
+            ),
+        ),
+    ]
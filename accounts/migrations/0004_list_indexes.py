@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.7 on 2026-10-18 06:22
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 운영 중인 테이블을 잠그지 않도록 인덱스는 CONCURRENTLY로 생성합니다.
+    atomic = False
+
+    dependencies = [
+        ("accounts", "0003_transaction_user"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="account",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["user", "-created_at", "-id"],
+                name="account_user_active_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "-transaction_timestamp", "-id"],
+                name="tx_user_ts_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="transaction",
+            index=models.Index(
+                fields=["account", "-transaction_timestamp", "-id"],
+                name="tx_account_ts_idx",
+            ),
+        ),
+    ]
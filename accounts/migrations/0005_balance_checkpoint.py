@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.7 on 2026-10-18 06:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_list_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BalanceCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("as_of", models.DateTimeField(verbose_name="기준 일시")),
+                (
+                    "balance",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=18, verbose_name="기준 일시 잔액"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성 일시"),
+                ),
+                (
+                    "account",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="balance_checkpoints",
+                        to="accounts.account",
+                        verbose_name="계좌",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "잔액 체크포인트",
+                "verbose_name_plural": "잔액 체크포인트 목록",
+                "db_table": "balance_checkpoints",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("account", "as_of"),
+                        name="balance_checkpoint_account_as_of",
+                    )
+                ],
+            },
+        ),
+    ]
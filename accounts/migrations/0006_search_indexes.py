@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.7 on 2026-10-18 09:10
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+# icontains는 UPPER(transaction_details::text) LIKE UPPER(%s)로 변환되므로
+# 인덱스도 같은 식으로 만들어야 플래너가 사용합니다.
+TRGM_INDEX_SQL = """
+CREATE INDEX CONCURRENTLY IF NOT EXISTS tx_details_trgm_idx
+    ON transaction_history
+ USING gin (UPPER(transaction_details::text) gin_trgm_ops)
+"""
+
+
+def create_trgm_index(apps, schema_editor):
+    """pg_trgm 확장을 사용할 수 있는 PostgreSQL에서만 트라이그램 인덱스를 만듭니다."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+        )
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(TRGM_INDEX_SQL)
+
+
+def drop_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute("DROP INDEX CONCURRENTLY IF EXISTS tx_details_trgm_idx")
+
+
+class Migration(migrations.Migration):
+    # 운영 중인 테이블을 잠그지 않도록 인덱스는 CONCURRENTLY로 생성합니다.
+    atomic = False
+
+    dependencies = [
+        ("accounts", "0005_balance_checkpoint"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "transaction_type", "-transaction_timestamp", "-id"],
+                name="tx_user_type_ts_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "transaction_method", "-transaction_timestamp", "-id"],
+                name="tx_user_method_ts_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "transaction_amount"], name="tx_user_amount_idx"
+            ),
+        ),
+        migrations.RunPython(create_trgm_index, drop_trgm_index),
+    ]
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.7 on 2026-10-18 06:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0006_search_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SpendingRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("DAY", "일별"), ("WEEK", "주별"), ("MONTH", "월별")],
+                        max_length=5,
+                        verbose_name="기간 단위",
+                    ),
+                ),
+                ("period_start", models.DateField(verbose_name="기간 시작일")),
+                (
+                    "transaction_type",
+                    models.CharField(
+                        choices=[("DEPOSIT", "입금"), ("WITHDRAW", "출금")],
+                        max_length=10,
+                        verbose_name="입출금 타입",
+                    ),
+                ),
+                (
+                    "transaction_method",
+                    models.CharField(
+                        choices=[
+                            ("ATM", "ATM 거래"),
+                            ("TRANSFER", "계좌이체"),
+                            ("AUTOMATIC_TRANSFER", "자동이체"),
+                            ("CARD", "카드결제"),
+                            ("INTEREST", "이자"),
+                        ],
+                        max_length=20,
+                        verbose_name="거래 타입",
+                    ),
+                ),
+                (
+                    "total_amount",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=18,
+                        verbose_name="거래 금액 합계",
+                    ),
+                ),
+                (
+                    "transaction_count",
+                    models.IntegerField(default=0, verbose_name="거래 건수"),
+                ),
+                (
+                    "account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="spending_rollups",
+                        to="accounts.account",
+                        verbose_name="계좌",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="spending_rollups",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="소유자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "소비 집계",
+                "verbose_name_plural": "소비 집계 목록",
+                "db_table": "spending_rollups",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "user",
+                            "granularity",
+                            "period_start",
+                            "account",
+                            "transaction_type",
+                            "transaction_method",
+                        ),
+                        name="spending_rollup_bucket",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.7 on 2026-10-18 10:05
+
+from django.conf import settings
+from django.db import migrations
+
+
+def partition_transaction_history(apps, schema_editor):
+    """settings.TRANSACTION_PARTITIONING["ENABLED"]일 때만 파티션 테이블로 변환합니다."""
+    options = getattr(settings, "TRANSACTION_PARTITIONING", {})
+    if not options.get("ENABLED") or schema_editor.connection.vendor != "postgresql":
+        return
+    # 스키마(컬럼) 변경이 없으므로 현재 모델 기준 도구를 그대로 사용합니다.
+    from accounts import partitioning
+
+    # migrate --database로 지정한 DB(원장 샤드)를 변환합니다.
+    partitioning.convert(
+        months_ahead=options.get("MONTHS_AHEAD", 3),
+        using=schema_editor.connection.alias,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0007_spending_rollup"),
+    ]
+
+    operations = [
+        # 되돌리기는 지원하지 않습니다. (파티션 테이블도 모델과 호환되므로 noop)
+        migrations.RunPython(partition_transaction_history, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.7 on 2026-10-18 06:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_transaction_partitioning"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=255, verbose_name="멱등성 키")),
+                (
+                    "request_hash",
+                    models.CharField(max_length=64, verbose_name="요청 지문"),
+                ),
+                (
+                    "status_code",
+                    models.PositiveSmallIntegerField(
+                        null=True, verbose_name="응답 상태 코드"
+                    ),
+                ),
+                (
+                    "response_body",
+                    models.TextField(null=True, verbose_name="응답 본문(JSON)"),
+                ),
+                ("created_at", models.DateTimeField(verbose_name="생성 일시")),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="idempotency_keys",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="요청 사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "멱등성 키",
+                "verbose_name_plural": "멱등성 키 목록",
+                "db_table": "idempotency_keys",
+                "indexes": [
+                    models.Index(
+                        fields=["created_at"], name="idempotency_key_created_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "key"), name="idempotency_key_user_key"
+                    )
+                ],
+            },
+        ),
+    ]
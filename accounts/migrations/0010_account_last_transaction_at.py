@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.7 on 2026-10-18 07:05
+
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+
+
+def backfill_last_transaction_at(apps, schema_editor):
+    """기존 계좌의 마지막 거래 일시를 거래 내역에서 채웁니다. (UPDATE 한 문장)"""
+    Account = apps.get_model("accounts", "Account")
+    Transaction = apps.get_model("accounts", "Transaction")
+    latest = (
+        Transaction.objects.filter(account=OuterRef("pk"))
+        .values("account")
+        .annotate(latest=Max("transaction_timestamp"))
+        .values("latest")
+    )
+    Account.objects.update(last_transaction_at=Subquery(latest))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0009_idempotency_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="account",
+            name="last_transaction_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="마지막 거래 일시"
+            ),
+        ),
+        migrations.RunPython(backfill_last_transaction_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 5.2.7 on 2026-10-18 08:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0010_account_last_transaction_at"),
+        ("users", "0002_user_date_joined"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LedgerShard",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="ledger_shard",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+                ("alias", models.CharField(max_length=64, verbose_name="DB 별칭")),
+                (
+                    "moving",
+                    models.BooleanField(default=False, verbose_name="이동 중 여부"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="변경 일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "원장 샤드",
+                "verbose_name_plural": "원장 샤드 목록",
+                "db_table": "ledger_shards",
+            },
+        ),
+    ]
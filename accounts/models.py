@@ -2,134 +2,17 @@
 from django.conf import settings
 from django.db import models
 
-# =============================================================
-# ✨ 제공된 상수 목록 반영 ✨
-# =============================================================
-
-# 은행 코드 (BANK_CODES)
-BANK_CHOICES = [
-    ("000", "알수없음"),
-    ("001", "한국은행"),
-    ("002", "산업은행"),
-    ("003", "기업은행"),
-    ("004", "국민은행"),
-    ("005", "외환은행"),
-    ("007", "수협중앙회"),
-    ("008", "수출입은행"),
-    ("011", "농협은행"),
-    ("012", "지역농.축협"),
-    ("020", "우리은행"),
-    ("023", "SC은행"),
-    ("027", "한국씨티은행"),
-    ("031", "대구은행"),
-    ("032", "부산은행"),
-    ("034", "광주은행"),
-    ("035", "제주은행"),
-    ("037", "전북은행"),
-    ("039", "경남은행"),
-    ("045", "새마을금고중앙회"),
-    ("048", "신협중앙회"),
-    ("050", "상호저축은행"),
-    ("051", "중국은행"),
-    ("052", "모건스탠리은행"),
-    ("054", "HSBC은행"),
-    ("055", "도이치은행"),
-    ("056", "알비에스피엘씨은행"),
-    ("057", "제이피모간체이스은행"),
-    ("058", "미즈호은행"),
-    ("059", "미쓰비시도쿄UFJ은행"),
-    ("060", "BOA은행"),
-    ("061", "비엔피파리바은행"),
-    ("062", "중국공상은행"),
-    ("063", "중국은행"),
-    ("064", "산림조합중앙회"),
-    ("065", "대화은행"),
-    ("066", "교통은행"),
-    ("071", "우체국"),
-    ("076", "신용보증기금"),
-    ("077", "기술보증기금"),
-    ("081", "KEB하나은행"),
-    ("088", "신한은행"),
-    ("089", "케이뱅크"),
-    ("090", "카카오뱅크"),
-    ("092", "토스뱅크"),
-    ("093", "한국주택금융공사"),
-    ("094", "서울보증보험"),
-    ("095", "경찰청"),
-    ("096", "한국전자금융(주)"),
-    ("099", "금융결제원"),
-    ("102", "대신저축은행"),
-    ("103", "에스비아이저축은행"),
-    ("104", "에이치케이저축은행"),
-    ("105", "웰컴저축은행"),
-    ("106", "신한저축은행"),
-    ("209", "유안타증권"),
-    ("218", "현대증권"),
-    ("221", "골든브릿지투자증권"),
-    ("222", "한양증권"),
-    ("223", "리딩투자증권"),
-    ("224", "BNK투자증권"),
-    ("225", "IBK투자증권"),
-    ("226", "KB투자증권"),
-    ("227", "KTB투자증권"),
-    ("230", "미래에셋증권"),
-    ("238", "대우증권"),
-    ("240", "삼성증권"),
-    ("243", "한국투자증권"),
-    ("261", "교보증권"),
-    ("262", "하이투자증권"),
-    ("263", "HMC투자증권"),
-    ("264", "키움증권"),
-    ("265", "이베스트투자증권"),
-    ("266", "SK증권"),
-    ("267", "대신증권"),
-    ("269", "한화투자증권"),
-    ("270", "하나대투증권"),
-    ("278", "신한금융투자"),
-    ("279", "DB금융투자"),
-    ("280", "유진투자증권"),
-    ("287", "메리츠종합금융증권"),
-    ("289", "NH투자증권"),
-    ("290", "부국증권"),
-    ("291", "신영증권"),
-    ("292", "엘아이지투자증권"),
-    ("293", "한국증권금융"),
-    ("294", "펀드온라인코리아"),
-    ("295", "우리종합금융"),
-    ("296", "삼성선물"),
-    ("297", "외환선물"),
-    ("298", "현대선물"),
-]
-
-# 계좌 종류 (ACCOUNT_TYPE)
-ACCOUNT_TYPE_CHOICES = [
-    ("CHECKING", "입출금"),
-    ("SAVING", "적금"),
-    ("LOAN", "대출"),
-    ("PENSION", "연금"),
-    ("TRUST", "신탁"),
-    ("FOREIGN_CURRENCY", "외화"),
-    ("IRP", "퇴직연금"),
-    ("STOCK", "주식"),
-]
-
-# 거래 타입 (TRANSACTION_TYPE)
-TRANSACTION_TYPE_CHOICES = [
-    ("DEPOSIT", "입금"),
-    ("WITHDRAW", "출금"),
-]
-
-# 거래 종류 (TRANSACTION_METHOD)
-PAYMENT_METHOD_CHOICES = [  # 기존 모델 필드명(PAYMENT_METHOD)에 맞춤
-    ("ATM", "ATM 거래"),
-    ("TRANSFER", "계좌이체"),
-    ("AUTOMATIC_TRANSFER", "자동이체"),
-    ("CARD", "카드결제"),
-    ("INTEREST", "이자"),
-]
-
-# (도전 미션 관련 상수는 모델이 없으므로 일단 제외합니다. 필요시 Analysis 모델에 사용됩니다.)
-# =============================================================
+from . import listcache
+
+# 🌟 선택지 상수는 accounts/choices.py에서 한곳에 관리합니다.
+from .choices import (
+    ACCOUNT_TYPE_CHOICES,
+    BANK_CHOICES,
+    BANK_LABELS,
+    PAYMENT_METHOD_CHOICES,
+    ROLLUP_GRANULARITY_CHOICES,
+    TRANSACTION_TYPE_CHOICES,
+)
 
 
 class Account(models.Model):
@@ -161,6 +44,12 @@ class Account(models.Model):
         max_digits=18, decimal_places=2, default=0, verbose_name="현재 잔액"
     )
 
+    # 🌟 가장 늦은 거래 일시 (상한값, 전기 엔진이 잔액과 함께 갱신)
+    # 잔액 행 잠금을 잡은 뒤 이 값과 비교해 과거 일자 거래를 판별합니다.
+    last_transaction_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="마지막 거래 일시"
+    )
+
     is_deleted = models.BooleanField(default=False, verbose_name="삭제 여부")
 
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성 일시")
@@ -169,10 +58,30 @@ class Account(models.Model):
         db_table = "accounts"
         verbose_name = "계좌"
         verbose_name_plural = "계좌 목록"
+        indexes = [
+            # 🌟 활성 계좌 목록 (user, is_deleted=False ORDER BY created_at DESC)
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                condition=models.Q(is_deleted=False),
+                name="account_user_active_idx",
+            ),
+        ]
 
-    # get_bank_code_display() 메서드는 Django가 자동으로 생성해줍니다.
+    # 🌟 계좌 생성/수정/Soft Delete는 소유자의 목록 캐시를 무효화합니다.
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        listcache.bump_ledger_version(self.user_id, using=self._state.db)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        listcache.bump_ledger_version(self.user_id, using=self._state.db)
+        return result
+
+    # get_bank_code_display()와 같은 값을 미리 계산된 매핑에서 조회합니다.
     def __str__(self):
-        return f"[{self.get_bank_code_display()}] {self.account_number}"
+        return (
+            f"[{BANK_LABELS.get(self.bank_code, self.bank_code)}] {self.account_number}"
+        )
 
 
 class Transaction(models.Model):
@@ -183,6 +92,16 @@ class Transaction(models.Model):
         verbose_name="계좌",
     )
 
+    # 🌟 계좌 소유자 비정규화: 목록 조회를 JOIN 없이 인덱스 범위 스캔으로 처리
+    # (단독 인덱스 대신 아래 복합 인덱스의 선두 컬럼으로 사용)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="transactions",
+        db_index=False,
+        verbose_name="소유자",
+    )
+
     transaction_amount = models.DecimalField(
         max_digits=18, decimal_places=2, verbose_name="거래 금액"
     )
@@ -217,6 +136,232 @@ class Transaction(models.Model):
         verbose_name = "거래 내역"
         verbose_name_plural = "거래 내역 목록"
         ordering = ["-transaction_timestamp"]
+        indexes = [
+            # 🌟 사용자별 거래 목록 (user ORDER BY transaction_timestamp DESC, id DESC)
+            models.Index(
+                fields=["user", "-transaction_timestamp", "-id"],
+                name="tx_user_ts_idx",
+            ),
+            # 🌟 계좌별 거래 목록 및 특정 시점 잔액 조회
+            models.Index(
+                fields=["account", "-transaction_timestamp", "-id"],
+                name="tx_account_ts_idx",
+            ),
+            # 🌟 거래 타입/종류 필터 + 키셋 정렬
+            models.Index(
+                fields=["user", "transaction_type", "-transaction_timestamp", "-id"],
+                name="tx_user_type_ts_idx",
+            ),
+            models.Index(
+                fields=["user", "transaction_method", "-transaction_timestamp", "-id"],
+                name="tx_user_method_ts_idx",
+            ),
+            # 🌟 금액 범위 필터
+            models.Index(
+                fields=["user", "transaction_amount"], name="tx_user_amount_idx"
+            ),
+            # 거래 설명 부분 검색용 pg_trgm GIN 인덱스(tx_details_trgm_idx)는
+            # 확장 설치 여부에 따라 마이그레이션 0006에서 조건부로 생성합니다.
+        ]
+
+    def save(self, *args, **kwargs):
+        # 소유자는 항상 계좌 소유자와 같으므로 지정되지 않았으면 계좌에서 채웁니다.
+        if self.user_id is None and self.account_id is not None:
+            self.user_id = self.account.user_id
+        super().save(*args, **kwargs)
+        listcache.bump_ledger_version(self.user_id, using=self._state.db)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        listcache.bump_ledger_version(self.user_id, using=self._state.db)
+        return result
 
     def __str__(self):
         return f"{self.account.account_number} | {self.transaction_type} {self.transaction_amount}"
+
+
+class BalanceCheckpoint(models.Model):
+    """
+    특정 시점(as_of)까지의 모든 거래가 반영된 계좌 잔액 스냅샷
+
+    거래 내역이 아카이빙되거나 과거 일자 거래가 끼어들어도
+    (account, as_of) 인덱스 탐색 한 번으로 시점 잔액을 구할 수 있게 합니다.
+    """
+
+    account = models.ForeignKey(
+        "Account",
+        on_delete=models.CASCADE,
+        related_name="balance_checkpoints",
+        db_index=False,
+        verbose_name="계좌",
+    )
+
+    as_of = models.DateTimeField(verbose_name="기준 일시")
+
+    balance = models.DecimalField(
+        max_digits=18, decimal_places=2, verbose_name="기준 일시 잔액"
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성 일시")
+
+    class Meta:
+        db_table = "balance_checkpoints"
+        verbose_name = "잔액 체크포인트"
+        verbose_name_plural = "잔액 체크포인트 목록"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "as_of"], name="balance_checkpoint_account_as_of"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.account_id} @ {self.as_of:%Y-%m-%d %H:%M} = {self.balance}"
+
+
+class SpendingRollup(models.Model):
+    """
+    기간(일/주/월)별 거래 합계와 건수 (분석 API용 집계 테이블)
+
+    거래가 전기/수정/삭제될 때 같은 트랜잭션 안에서 증감(upsert)되므로
+    분석 조회는 거래 내역을 스캔하지 않고 기간 버킷당 몇 행만 읽습니다.
+    기간 시작일은 settings.TIME_ZONE 기준 날짜이며 주는 월요일에 시작합니다.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="spending_rollups",
+        db_index=False,
+        verbose_name="소유자",
+    )
+
+    account = models.ForeignKey(
+        "Account",
+        on_delete=models.CASCADE,
+        related_name="spending_rollups",
+        verbose_name="계좌",
+    )
+
+    granularity = models.CharField(
+        max_length=5, choices=ROLLUP_GRANULARITY_CHOICES, verbose_name="기간 단위"
+    )
+
+    period_start = models.DateField(verbose_name="기간 시작일")
+
+    transaction_type = models.CharField(
+        max_length=10, choices=TRANSACTION_TYPE_CHOICES, verbose_name="입출금 타입"
+    )
+
+    transaction_method = models.CharField(
+        max_length=20, choices=PAYMENT_METHOD_CHOICES, verbose_name="거래 타입"
+    )
+
+    total_amount = models.DecimalField(
+        max_digits=18, decimal_places=2, default=0, verbose_name="거래 금액 합계"
+    )
+
+    transaction_count = models.IntegerField(default=0, verbose_name="거래 건수")
+
+    class Meta:
+        db_table = "spending_rollups"
+        verbose_name = "소비 집계"
+        verbose_name_plural = "소비 집계 목록"
+        constraints = [
+            # 🌟 upsert 충돌 대상이자 (user, granularity, 기간 범위) 조회 인덱스
+            models.UniqueConstraint(
+                fields=[
+                    "user",
+                    "granularity",
+                    "period_start",
+                    "account",
+                    "transaction_type",
+                    "transaction_method",
+                ],
+                name="spending_rollup_bucket",
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.account_id} {self.granularity} {self.period_start} "
+            f"{self.transaction_type}/{self.transaction_method} = {self.total_amount}"
+        )
+
+
+class IdempotencyKey(models.Model):
+    """
+    Idempotency-Key 헤더로 처리한 POST 요청과 그 응답
+
+    (user, key) 유니크 행을 전기와 같은 트랜잭션에서 INSERT하므로, 같은 키의
+    동시 요청은 첫 요청이 커밋될 때까지 유니크 인덱스에서 기다렸다가 저장된
+    응답을 그대로 돌려받습니다. (accounts/idempotency.py)
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="idempotency_keys",
+        db_index=False,
+        verbose_name="요청 사용자",
+    )
+
+    key = models.CharField(max_length=255, verbose_name="멱등성 키")
+
+    request_hash = models.CharField(max_length=64, verbose_name="요청 지문")
+
+    status_code = models.PositiveSmallIntegerField(
+        null=True, verbose_name="응답 상태 코드"
+    )
+
+    # 렌더링 전 응답 데이터를 JSON 문자열로 저장합니다. (재생 시 그대로 역직렬화)
+    response_body = models.TextField(null=True, verbose_name="응답 본문(JSON)")
+
+    created_at = models.DateTimeField(verbose_name="생성 일시")
+
+    class Meta:
+        db_table = "idempotency_keys"
+        verbose_name = "멱등성 키"
+        verbose_name_plural = "멱등성 키 목록"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "key"], name="idempotency_key_user_key"
+            ),
+        ]
+        indexes = [
+            # 만료된 키 정리용
+            models.Index(fields=["created_at"], name="idempotency_key_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.key} ({self.status_code})"
+
+
+class LedgerShard(models.Model):
+    """
+    사용자 원장(계좌/거래 등)이 있는 DB 별칭 (샤드 맵, 기본 DB에만 저장)
+
+    행이 없으면 default에 있습니다. moving이 True인 동안에는 원장을 다른
+    샤드로 복사하는 중이므로 그 사용자의 쓰기를 거절합니다. (accounts/sharding.py)
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="ledger_shard",
+        verbose_name="사용자",
+    )
+
+    alias = models.CharField(max_length=64, verbose_name="DB 별칭")
+
+    moving = models.BooleanField(default=False, verbose_name="이동 중 여부")
+
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="변경 일시")
+
+    class Meta:
+        db_table = "ledger_shards"
+        verbose_name = "원장 샤드"
+        verbose_name_plural = "원장 샤드 목록"
+
+    def __str__(self):
+        return f"{self.user_id} → {self.alias}{' (이동 중)' if self.moving else ''}"
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+키셋(커서) 페이지네이션
+
+(정렬 컬럼, id) 조합의 마지막 위치를 불투명한 커서로 내려주고,
+다음 페이지는 해당 위치 이후의 인덱스 범위만 읽습니다.
+COUNT(*)와 OFFSET을 사용하지 않으므로 N번째 페이지도 첫 페이지와 비용이 같습니다.
+"""
+
+import base64
+import binascii
+import json
+from collections import namedtuple
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+Cursor = namedtuple("Cursor", ["value", "pk", "reverse"])
+
+
+class KeysetPagination(BasePagination):
+    """(ordering_field DESC, id DESC) 순서로 정렬된 목록을 커서로 나눕니다."""
+
+    ordering_field = None
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self._set_page(list(self._page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset()의 비동기 버전 (AsyncReadMixin.alist)"""
+        rows = [row async for row in self._page_queryset(queryset, request)]
+        return self._set_page(rows)
+
+    def _page_queryset(self, queryset, request):
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        self.reverse = self.cursor.reverse if self.cursor else False
+
+        if self.cursor:
+            queryset = queryset.filter(self.seek_filter(self.cursor))
+        field = self.ordering_field
+        if self.reverse:
+            queryset = queryset.order_by(field, "pk")
+        else:
+            queryset = queryset.order_by(f"-{field}", "-pk")
+
+        # 🌟 다음 페이지 존재 여부는 한 건 더 읽어서 판단 (COUNT(*) 없음)
+        return queryset[: self.page_size + 1]
+
+    def _set_page(self, rows):
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if self.reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            requested = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            requested = settings.API_PAGE_SIZE
+        return max(1, min(requested, settings.API_MAX_PAGE_SIZE))
+
+    def seek_filter(self, cursor):
+        """커서 위치 이후(또는 이전) 행만 남기는 조건"""
+        field = self.ordering_field
+        if cursor.reverse:
+            return Q(**{f"{field}__gte": cursor.value}) & (
+                Q(**{f"{field}__gt": cursor.value}) | Q(pk__gt=cursor.pk)
+            )
+        # `field <= value`가 인덱스 범위를 잡고, OR 조건은 같은 시각의 행만 거릅니다.
+        return Q(**{f"{field}__lte": cursor.value}) & (
+            Q(**{f"{field}__lt": cursor.value}) | Q(pk__lt=cursor.pk)
+        )
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, instance, reverse):
+        value = getattr(instance, self.ordering_field)
+        payload = {"v": value.isoformat(), "p": instance.pk}
+        if reverse:
+            payload["r"] = 1
+        token = base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(",", ":")).encode()
+        ).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+            value = parse_datetime(payload["v"])
+            pk = int(payload["p"])
+            reverse = bool(payload.get("r"))
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if value is None:
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(value, pk, reverse)
+
+
+class AccountCursorPagination(KeysetPagination):
+    ordering_field = "created_at"
+
+
+class TransactionCursorPagination(KeysetPagination):
+    ordering_field = "transaction_timestamp"
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+요청 본문 파서
+
+NDJSON(한 줄에 JSON 객체 하나) 본문을 dict 목록으로 읽습니다.
+은행 피드처럼 큰 일괄 요청을 배열 하나로 감싸지 않고 줄 단위로 보낼 수 있습니다.
+"""
+
+import json
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        rows = []
+        for number, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rows.append(json.loads(line))
+            except ValueError as exc:
+                raise ParseError(
+                    f"{number}번째 줄의 JSON 형식이 올바르지 않습니다: {exc}"
+                )
+        return rows
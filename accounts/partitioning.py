@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+transaction_history 월별 범위 파티셔닝 (PostgreSQL 전용)
+
+transaction_timestamp 기준 월 단위 파티션(transaction_history_pYYYYMM)과
+범위를 벗어난 거래를 받는 기본 파티션(transaction_history_default)을 씁니다.
+기간 조건이 있는 조회(목록 ?start=&end=, 키셋 커서, 시점 잔액, 내보내기)는
+플래너가 해당 월 파티션만 읽고(partition pruning), 오래된 월은 파티션 단위로
+VACUUM/분리(DETACH)/아카이빙할 수 있습니다.
+
+PostgreSQL은 파티션 테이블의 기본 키에 파티션 키가 포함되어야 하므로
+기본 키는 (id, transaction_timestamp)가 됩니다. ORM은 그대로 id로 조회합니다.
+
+함수는 모두 using DB(원장 샤드 하나)에서 실행합니다. 마이그레이션은 migrate
+대상 DB를, partition_transactions 명령은 샤드마다 별칭을 넘깁니다.
+"""
+
+from datetime import datetime
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+
+from .models import Transaction
+
+TABLE = Transaction._meta.db_table
+DEFAULT_PARTITION = f"{TABLE}_default"
+
+
+def month_start(value):
+    """value가 속한 달의 1일 00:00 (현재 시간대 기준, aware datetime)"""
+    local = timezone.localtime(value)
+    return timezone.make_aware(datetime(local.year, local.month, 1))
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return timezone.make_aware(datetime(index // 12, index % 12 + 1, 1))
+
+
+def partition_name(month):
+    return f"{TABLE}_p{month:%Y%m}"
+
+
+def is_partitioned(using=DEFAULT_DB_ALIAS):
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table"
+            " WHERE partrelid = to_regclass(%s))",
+            [TABLE],
+        )
+        return cursor.fetchone()[0]
+
+
+def partitions(using=DEFAULT_DB_ALIAS):
+    """(파티션 이름, 범위 표현식) 목록"""
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+              FROM pg_inherits i
+              JOIN pg_class c ON c.oid = i.inhrelid
+             WHERE i.inhparent = to_regclass(%s)
+             ORDER BY c.relname
+            """,
+            [TABLE],
+        )
+        return cursor.fetchall()
+
+
+def ensure_partitions(months_ahead=3, start=None, using=DEFAULT_DB_ALIAS):
+    """
+    start(기본값: 이번 달)부터 months_ahead개월 뒤까지의 월 파티션을 만듭니다.
+
+    이미 있는 파티션은 건너뛰고, 새로 만든 파티션 이름 목록을 반환합니다.
+    파티션은 별도 테이블로 만든 뒤 ATTACH하므로 부모 테이블에는
+    SHARE UPDATE EXCLUSIVE 잠금만 걸려 거래 조회/전기를 막지 않습니다.
+    """
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    existing = {name for name, _ in partitions(using)}
+    month = month_start(start or timezone.now())
+    created = []
+    for offset in range(months_ahead + 1):
+        lower, upper = add_months(month, offset), add_months(month, offset + 1)
+        name = partition_name(lower)
+        if name in existing:
+            continue
+        with transaction.atomic(using=using), connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE {qn(name)} (LIKE {qn(TABLE)}"
+                " INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+            if DEFAULT_PARTITION in existing:
+                # 기본 파티션에 들어와 있던 해당 월 거래를 새 파티션으로 옮깁니다.
+                cursor.execute(
+                    f"""
+                    WITH moved AS (
+                        DELETE FROM {qn(DEFAULT_PARTITION)}
+                         WHERE transaction_timestamp >= %s
+                           AND transaction_timestamp < %s
+                     RETURNING *
+                    )
+                    INSERT INTO {qn(name)} SELECT * FROM moved
+                    """,
+                    [lower, upper],
+                )
+            cursor.execute(
+                f"ALTER TABLE {qn(TABLE)} ATTACH PARTITION {qn(name)}"
+                " FOR VALUES FROM (%s) TO (%s)",
+                [lower, upper],
+            )
+        created.append(name)
+    return created
+
+
+def convert(months_ahead=3, keep_legacy=False, log=print, using=DEFAULT_DB_ALIAS):
+    """
+    일반 테이블인 transaction_history를 월별 파티션 테이블로 변환합니다.
+
+    한 트랜잭션 안에서 ① 기존 테이블 이름 변경 ② 파티션 테이블과 월 파티션 생성
+    ③ 데이터 복사 ④ 기본 키/인덱스/외래 키 재생성 ⑤ id 시퀀스 이어 붙이기를
+    수행합니다. 실패하면 전부 롤백되며, 실행 중에는 거래 테이블이 잠깁니다.
+    """
+    if is_partitioned(using):
+        log(f"{TABLE}은(는) 이미 파티션 테이블입니다.")
+        return False
+
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    legacy = f"{TABLE}_legacy"
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        # 지연(DEFERRABLE) 외래 키 검사를 먼저 끝내야 기존 테이블을 지울 수 있습니다.
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        cursor.execute(f"LOCK TABLE {qn(TABLE)} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute(
+            """
+            SELECT i.relname, pg_get_indexdef(i.oid)
+              FROM pg_index x
+              JOIN pg_class i ON i.oid = x.indexrelid
+             WHERE x.indrelid = to_regclass(%s) AND NOT x.indisprimary
+            """,
+            [TABLE],
+        )
+        indexes = cursor.fetchall()
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint"
+            " WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+            [TABLE],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            f"SELECT MIN(transaction_timestamp), MAX(transaction_timestamp),"
+            f" COUNT(*) FROM {qn(TABLE)}"
+        )
+        oldest, newest, rows = cursor.fetchone()
+
+        # ① 기존 테이블과 인덱스 이름을 비워 둡니다.
+        cursor.execute(f"ALTER TABLE {qn(TABLE)} RENAME TO {qn(legacy)}")
+        cursor.execute(
+            f"ALTER TABLE {qn(legacy)} RENAME CONSTRAINT"
+            f" {qn(TABLE + '_pkey')} TO {qn(legacy + '_pkey')}"
+        )
+        for name, _ in indexes:
+            cursor.execute(
+                f"ALTER INDEX {qn(name)} RENAME TO {qn(name[:56] + '_legacy')}"
+            )
+
+        # ② 파티션 테이블 (id 식별자 열과 기본값, NOT NULL/CHECK 제약 유지)
+        cursor.execute(
+            f"CREATE TABLE {qn(TABLE)} (LIKE {qn(legacy)} INCLUDING DEFAULTS"
+            " INCLUDING IDENTITY INCLUDING CONSTRAINTS)"
+            " PARTITION BY RANGE (transaction_timestamp)"
+        )
+        cursor.execute(
+            f"CREATE TABLE {qn(DEFAULT_PARTITION)} PARTITION OF {qn(TABLE)} DEFAULT"
+        )
+        now = timezone.now()
+        first = month_start(min(oldest or now, now))
+        last = month_start(max(newest or now, now))
+        months = (last.year - first.year) * 12 + last.month - first.month
+        for offset in range(months + months_ahead + 1):
+            lower, upper = add_months(first, offset), add_months(first, offset + 1)
+            cursor.execute(
+                f"CREATE TABLE {qn(partition_name(lower))} PARTITION OF"
+                f" {qn(TABLE)} FOR VALUES FROM (%s) TO (%s)",
+                [lower, upper],
+            )
+
+        # ③ 인덱스 없이 복사한 뒤 ④ 인덱스를 한 번에 만드는 편이 빠릅니다.
+        log(f"{rows}건 복사 중...")
+        cursor.execute(
+            f"INSERT INTO {qn(TABLE)} OVERRIDING SYSTEM VALUE"
+            f" SELECT * FROM {qn(legacy)}"
+        )
+        if not keep_legacy:
+            cursor.execute(f"DROP TABLE {qn(legacy)}")
+
+        cursor.execute(
+            f"ALTER TABLE {qn(TABLE)} ADD CONSTRAINT {qn(TABLE + '_pkey')}"
+            " PRIMARY KEY (id, transaction_timestamp)"
+        )
+        for name, definition in indexes:
+            # pg_get_indexdef는 이름 변경 전의 테이블/인덱스 이름으로 정의를 돌려줍니다.
+            cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(
+                f"ALTER TABLE {qn(TABLE)} ADD CONSTRAINT {qn(name)} {definition}"
+            )
+
+        # ⑤ 새 식별자 시퀀스를 기존 최대 id 다음부터 시작하게 합니다.
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence(%s, 'id'),"
+            f" COALESCE(MAX(id), 0) + 1, false) FROM {qn(TABLE)}",
+            [TABLE],
+        )
+        cursor.execute(f"ANALYZE {qn(TABLE)}")
+    log(f"{TABLE}을(를) {months + months_ahead + 1}개 월 파티션으로 변환했습니다.")
+    return True
@@ -18,10 +18,10 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
             return True
 
         # Write permissions (PUT, PATCH, DELETE) are only allowed to the owner of the object.
-        # Account, Transaction 모두 obj.account.user 또는 obj.user를 통해 소유자를 확인할 수 있어야 합니다.
-        if hasattr(obj, "user"):
-            return obj.user == request.user
-        elif hasattr(obj, "account") and hasattr(obj.account, "user"):
-            return obj.account.user == request.user
+        # 🌟 Account, Transaction 모두 user_id를 가지므로 추가 쿼리 없이 id만 비교합니다.
+        if hasattr(obj, "user_id"):
+            return obj.user_id == request.user.pk
+        elif hasattr(obj, "account"):
+            return obj.account.user_id == request.user.pk
 
         return False
@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+"""
+원장 정합성 검증과 복구 (manage.py verify_ledger)
+
+계좌 ID 범위마다 거래 내역을 계좌별 (transaction_timestamp, id) 순으로
+chunk_size행씩 스트리밍하며 두 가지를 확인합니다.
+
+1. 체인: 거래 후 잔액이 개설 잔액(첫 거래의 post - 변화량, balance_before()와
+   같은 규칙) + 누적 변화량과 일치하는지. 계좌별로 처음 어긋난 거래를 보고합니다.
+2. 잔액: Account.balance가 개설 잔액 + 거래 변화량 합계와 일치하는지.
+   (거래가 없는 계좌는 개설 잔액을 알 수 없으므로 건너뜁니다)
+
+금액은 DB에서 정수(1/100 단위)로 변환해 읽습니다. NumPy가 설치되어 있으면
+PostgreSQL에서는 COPY 바이너리 스트림을 행 단위 파이썬 객체 없이 배열로 바로
+읽어 청크 단위 누적합으로 비교하고, 없으면 서버 측 커서 + 같은 규칙의 파이썬
+루프로 비교합니다. 범위마다
+REPEATABLE READ 스냅숏 하나에서 잔액과 내역을 함께 읽으므로 운영 중에
+실행해도 동시 전기 때문에 거짓 불일치가 나지 않습니다. 범위는 프로세스 풀에
+나눠 병렬로 검증합니다.
+
+repair()는 불일치 계좌를 잠그고 ledger.rechain()으로 처음 어긋난 거래부터
+(체인이 맞으면 마지막 거래만) 다시 누적해 계좌 잔액까지 맞춥니다.
+
+검증/복구는 using DB(원장 샤드 하나) 범위입니다. verify_ledger 명령은
+샤드마다 use_shard(alias) 안에서 실행합니다. (accounts/sharding.py)
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+
+import django
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from . import ledger
+from .models import Account, Transaction
+
+try:
+    import numpy as np
+except ImportError:  # pyproject 의존성이지만 없는 환경에서는 파이썬 루프로 검증합니다.
+    np = None
+
+_BALANCES_SQL = """
+SELECT id, CAST(ROUND(balance * 100) AS BIGINT)
+  FROM {accounts}
+ WHERE id BETWEEN %s AND %s
+"""
+
+# 🌟 계좌 안에서만 시간순이면 되므로 account_id는 내림차순입니다.
+# (account, -transaction_timestamp, -id) 인덱스를 역방향으로 읽는 순서와 같습니다.
+_HISTORY_SQL = """
+SELECT account_id,
+       id,
+       CAST(ROUND(CASE WHEN transaction_type = 'WITHDRAW'
+                       THEN -transaction_amount
+                       ELSE transaction_amount END * 100) AS BIGINT),
+       CAST(ROUND(post_transaction_amount * 100) AS BIGINT)
+  FROM {history}
+ WHERE account_id BETWEEN %s AND %s
+ ORDER BY account_id DESC, transaction_timestamp, id
+"""
+
+
+# COPY ... (FORMAT binary)의 행: 필드 수(int16) + 필드마다 길이(int32)와 BIGINT 값
+_COPY_HEADER_SIZE = 19
+_COPY_TRAILER = b"\xff\xff"
+_COPY_FIELDS = 4
+
+
+def _copy_dtype():
+    fields = [("count", ">i2")]
+    for index in range(_COPY_FIELDS):
+        fields += [(f"length{index}", ">i4"), (f"value{index}", ">i8")]
+    return np.dtype(fields)
+
+
+class _CopyReader:
+    """COPY TO STDOUT 바이너리 스트림을 받아 size행씩 배열로 consume에 넘깁니다."""
+
+    def __init__(self, size, consume):
+        self._dtype = _copy_dtype()
+        self._chunk_bytes = size * self._dtype.itemsize
+        self._consume = consume
+        self._buffer = bytearray()
+        self._header = True
+
+    def write(self, data):
+        self._buffer += data
+        if self._header and len(self._buffer) >= _COPY_HEADER_SIZE:
+            del self._buffer[:_COPY_HEADER_SIZE]
+            self._header = False
+        if not self._header and len(self._buffer) >= self._chunk_bytes:
+            self._flush(self._chunk_bytes)
+
+    def close(self):
+        if self._buffer[-len(_COPY_TRAILER) :] == _COPY_TRAILER:
+            del self._buffer[-len(_COPY_TRAILER) :]
+        usable = len(self._buffer) - len(self._buffer) % self._dtype.itemsize
+        if usable:
+            self._flush(usable)
+
+    def _flush(self, size):
+        records = np.frombuffer(bytes(self._buffer[:size]), dtype=self._dtype)
+        del self._buffer[:size]
+        self._consume(
+            np.column_stack([
+                records[f"value{index}"] for index in range(_COPY_FIELDS)
+            ]).astype(np.int64)
+        )
+
+
+def _amount(cents):
+    return str(Decimal(cents).scaleb(-2))
+
+
+class _ChainChecker:
+    """청크로 나뉘어 들어오는 (account_id, id, 변화량, post) 행을 이어서 검증합니다."""
+
+    def __init__(self):
+        self.rows = 0
+        self.breaks = {}  # account_id → [거래 id, 기대값, 실제값, 어긋난 행 수]
+        self.finals = {}  # account_id → 개설 잔액 + 변화량 합계
+        self._carry = None  # 이전 청크 마지막 계좌의 (account_id, 누적 잔액)
+
+    def feed(self, rows):
+        self.rows += len(rows)
+        if np is None:
+            self._feed_rows(rows)
+        else:
+            self._feed_array(np.asarray(rows, dtype=np.int64))
+
+    def _feed_rows(self, rows):
+        account_id, running = self._carry or (None, 0)
+        for row_account, pk, signed, post in rows:
+            if row_account != account_id:
+                account_id, running = row_account, post - signed
+            running += signed
+            self.finals[account_id] = running
+            if post != running:
+                self._record(account_id, pk, running, post, 1)
+        self._carry = (account_id, running)
+
+    def _feed_array(self, rows):
+        accounts, pks, signed, posts = rows.T
+        size = len(rows)
+        starts = np.flatnonzero(np.concatenate(([True], accounts[1:] != accounts[:-1])))
+        opening = posts[starts] - signed[starts]
+        if self._carry is not None and accounts[0] == self._carry[0]:
+            opening[0] = self._carry[1]
+        # 계좌(그룹)별 누적합 = 전체 누적합 - 그룹 시작 직전 누적합
+        totals = np.cumsum(signed)
+        offsets = opening - (totals[starts] - signed[starts])
+        expected = totals + np.repeat(offsets, np.diff(np.append(starts, size)))
+
+        bad = np.flatnonzero(expected != posts)
+        if len(bad):
+            bad_accounts, first, counts = np.unique(
+                accounts[bad], return_index=True, return_counts=True
+            )
+            for account_id, index, count in zip(
+                bad_accounts.tolist(), bad[first].tolist(), counts.tolist()
+            ):
+                self._record(
+                    account_id,
+                    int(pks[index]),
+                    int(expected[index]),
+                    int(posts[index]),
+                    count,
+                )
+
+        ends = np.append(starts[1:], size) - 1
+        self.finals.update(zip(accounts[ends].tolist(), expected[ends].tolist()))
+        self._carry = (int(accounts[-1]), int(expected[-1]))
+
+    def _record(self, account_id, pk, expected, actual, count):
+        if account_id in self.breaks:
+            self.breaks[account_id][3] += count
+        else:
+            self.breaks[account_id] = [pk, expected, actual, count]
+
+    def mismatches(self, balances):
+        for account_id, (pk, expected, actual, count) in sorted(self.breaks.items()):
+            yield {
+                "kind": "chain",
+                "account_id": account_id,
+                "transaction_id": pk,
+                "expected": _amount(expected),
+                "actual": _amount(actual),
+                "rows": count,
+            }
+        for account_id, expected in sorted(self.finals.items()):
+            if balances.get(account_id, expected) != expected:
+                yield {
+                    "kind": "balance",
+                    "account_id": account_id,
+                    "expected": _amount(expected),
+                    "actual": _amount(balances[account_id]),
+                }
+
+
+def verify_range(first_id, last_id, chunk_size=10_000, using=DEFAULT_DB_ALIAS):
+    """
+    using DB의 계좌 ID [first_id, last_id] 범위를 검증해 (검사한 행 수, 불일치
+    목록)을 반환합니다.
+
+    PostgreSQL에서는 REPEATABLE READ 읽기 전용 트랜잭션 하나에서 읽습니다.
+    """
+    checker = _ChainChecker()
+    connection = connections[using]
+    snapshot = connection.vendor == "postgresql" and not connection.in_atomic_block
+    with transaction.atomic(using=using):
+        if snapshot:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY"
+                )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                _BALANCES_SQL.format(
+                    accounts=connection.ops.quote_name(Account._meta.db_table)
+                ),
+                [first_id, last_id],
+            )
+            balances = dict(cursor.fetchall())
+        sql = _HISTORY_SQL.format(
+            history=connection.ops.quote_name(Transaction._meta.db_table)
+        )
+        if np is not None and connection.vendor == "postgresql":
+            reader = _CopyReader(chunk_size, checker.feed)
+            query = connection.ops.compose_sql(sql, [first_id, last_id])
+            _copy_to(connection, f"COPY ({query}) TO STDOUT (FORMAT binary)", reader)
+            reader.close()
+        else:
+            with connection.chunked_cursor() as cursor:
+                cursor.execute(sql, [first_id, last_id])
+                while rows := cursor.fetchmany(chunk_size):
+                    checker.feed(rows)
+    return checker.rows, list(checker.mismatches(balances))
+
+
+def _copy_to(connection, sql, reader):
+    """COPY ... TO STDOUT 스트림을 reader.write()로 넘깁니다. (psycopg 3 / psycopg2)"""
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    with connection.cursor() as cursor:
+        if not is_psycopg3:
+            cursor.copy_expert(sql, reader)
+            return
+        with cursor.copy(sql) as copy:
+            for data in copy:
+                reader.write(data)
+
+
+def _verify_range_task(bounds, chunk_size, using):
+    return verify_range(*bounds, chunk_size=chunk_size, using=using)
+
+
+def account_ranges(batch_accounts=1000, using=DEFAULT_DB_ALIAS):
+    """계좌 ID를 batch_accounts개씩 끊은 [(첫 ID, 마지막 ID)] 범위를 만듭니다."""
+    ranges, first, last, count = [], None, None, 0
+    accounts = Account.objects.using(using).order_by("pk")
+    for pk in accounts.values_list("pk", flat=True).iterator():
+        if first is None:
+            first = pk
+        last, count = pk, count + 1
+        if count == batch_accounts:
+            ranges.append((first, last))
+            first, count = None, 0
+    if first is not None:
+        ranges.append((first, last))
+    return ranges
+
+
+def _pool_context():
+    # fork로 띄우면 자식 프로세스가 부모의 DB 설정(테스트 DB 이름 포함)을 그대로
+    # 물려받습니다. fork를 쓸 수 없는 플랫폼은 기본 방식 + django.setup()입니다.
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def verify(workers=0, batch_accounts=1000, chunk_size=10_000, using=DEFAULT_DB_ALIAS):
+    """
+    using DB의 원장을 계좌 범위별로 검증하며 (검사한 행 수, 불일치 목록)을
+    범위마다 순서대로 내보냅니다. workers가 0이면 현재 프로세스에서 검증합니다.
+    """
+    ranges = account_ranges(batch_accounts, using=using)
+    if workers <= 0:
+        for bounds in ranges:
+            yield verify_range(*bounds, chunk_size=chunk_size, using=using)
+        return
+
+    # 부모의 DB 소켓을 자식과 공유하지 않도록 fork 전에 연결을 닫습니다.
+    connections.close_all()
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=_pool_context(), initializer=django.setup
+    ) as pool:
+        yield from pool.map(
+            _verify_range_task,
+            ranges,
+            [chunk_size] * len(ranges),
+            [using] * len(ranges),
+            chunksize=4,
+        )
+
+
+def repair(mismatches, using=DEFAULT_DB_ALIAS):
+    """
+    verify()가 보고한 using DB의 불일치 계좌를 계좌별 트랜잭션에서 잠그고 다시
+    누적합니다. (샤드라면 use_shard(using) 안에서 호출합니다)
+
+    (복구한 계좌 ID 목록, 잔액이 음수가 되어 복구하지 못한 계좌 ID 목록)을
+    반환합니다. 검증 이후 이미 맞춰진 계좌는 바뀌는 행 없이 지나갑니다.
+    """
+    starts = {}
+    for mismatch in mismatches:
+        if mismatch["kind"] == "chain":
+            starts[mismatch["account_id"]] = mismatch["transaction_id"]
+        else:
+            starts.setdefault(mismatch["account_id"], None)
+
+    repaired, failed = [], []
+    for account_id, pk in sorted(starts.items()):
+        history = Transaction.objects.using(using).filter(account_id=account_id)
+        try:
+            with transaction.atomic(using=using):
+                ledger._lock_accounts([account_id])
+                if pk is None:
+                    # 체인은 맞고 잔액만 다르면 마지막 거래부터 다시 누적합니다.
+                    start = history.order_by("-transaction_timestamp", "-id")
+                else:
+                    start = history.filter(pk=pk)
+                row = start.values_list("transaction_timestamp", "pk").first()
+                if row is None:
+                    continue
+                ledger.rechain([(account_id, *row, None)])
+        except ledger.InsufficientBalance:
+            failed.append(account_id)
+        else:
+            repaired.append(account_id)
+    return repaired, failed
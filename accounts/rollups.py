@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+기간별 소비 집계(SpendingRollup) 유지와 조회
+
+거래 한 건은 일/주/월 버킷 세 행에 반영됩니다. 반영은 모두
+INSERT ... ON CONFLICT DO UPDATE 증감 한 문장이라 행을 먼저 읽지 않고,
+호출한 쪽의 트랜잭션(전기, 수정, 삭제)과 함께 커밋/롤백됩니다.
+분석 조회는 (user, granularity, period_start) 유니크 인덱스 범위만 읽습니다.
+"""
+
+from collections import namedtuple
+from datetime import timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import connection, connections, router, transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from .models import SpendingRollup, Transaction
+
+RollupEntry = namedtuple(
+    "RollupEntry",
+    [
+        "user_id",
+        "account_id",
+        "transaction_timestamp",
+        "transaction_type",
+        "transaction_method",
+        "amount",
+        "count",
+    ],
+)
+
+_CONFLICT_SQL = """
+ON CONFLICT (
+    user_id, granularity, period_start, account_id,
+    transaction_type, transaction_method
+) DO UPDATE
+   SET total_amount = {rollups}.total_amount + EXCLUDED.total_amount,
+       transaction_count = {rollups}.transaction_count + EXCLUDED.transaction_count
+"""
+
+_COLUMNS = """
+    user_id, account_id, granularity, period_start,
+    transaction_type, transaction_method, total_amount, transaction_count
+"""
+
+# 전체 재계산: 거래 내역을 (기간, 계좌, 타입, 종류)별로 한 번에 집계합니다.
+_REBUILD_SQL = """
+INSERT INTO {rollups} ({columns})
+SELECT user_id, account_id, g.granularity,
+       date_trunc(g.unit, transaction_timestamp AT TIME ZONE %(tz)s)::date,
+       transaction_type, transaction_method,
+       SUM(transaction_amount), COUNT(*)
+  FROM {history}
+ CROSS JOIN (VALUES ('DAY', 'day'), ('WEEK', 'week'), ('MONTH', 'month'))
+       AS g (granularity, unit)
+ WHERE {where}
+ GROUP BY 1, 2, 3, 4, 5, 6
+"""
+
+
+def rollups_table():
+    return connection.ops.quote_name(SpendingRollup._meta.db_table)
+
+
+def conflict_clause():
+    """전기 엔진(ledger)의 데이터 변경 CTE에서도 쓰는 증감 upsert 절"""
+    return _CONFLICT_SQL.format(rollups=rollups_table())
+
+
+def period_starts(timestamp):
+    """거래 일시가 속하는 일/주/월 버킷의 시작일 (settings.TIME_ZONE 기준)"""
+    return bucket_starts(timezone.localtime(timestamp).date())
+
+
+def bucket_starts(day):
+    """날짜가 속하는 일/주/월 버킷의 시작일 (주는 월요일 시작)"""
+    return {
+        "DAY": day,
+        "WEEK": day - timedelta(days=day.weekday()),
+        "MONTH": day.replace(day=1),
+    }
+
+
+def apply(entries):
+    """RollupEntry 목록을 일/주/월 버킷에 증감합니다. (한 문장)"""
+    # 한 INSERT 안에서 같은 버킷을 두 번 갱신할 수 없으므로 먼저 합칩니다.
+    # (수정 전후가 같은 버킷이면 증감이 상쇄되어 문장을 실행하지 않습니다.)
+    deltas = {}
+    for entry in entries:
+        for granularity, start in period_starts(entry.transaction_timestamp).items():
+            key = (
+                entry.user_id,
+                entry.account_id,
+                granularity,
+                start,
+                entry.transaction_type,
+                entry.transaction_method,
+            )
+            amount, count = deltas.get(key, (0, 0))
+            deltas[key] = (amount + entry.amount, count + entry.count)
+    rows = [key + delta for key, delta in deltas.items() if delta != (0, 0)]
+    if not rows:
+        return
+    placeholders = ", ".join(["(%s, %s, %s, %s, %s, %s, %s, %s)"] * len(rows))
+    sql = (
+        f"INSERT INTO {rollups_table()} ({_COLUMNS}) VALUES {placeholders}"
+        + conflict_clause()
+    )
+    # 호출한 쪽의 트랜잭션과 같은 원장 DB에 씁니다. (accounts/sharding.py)
+    with connections[router.db_for_write(SpendingRollup)].cursor() as cursor:
+        cursor.execute(sql, [value for row in rows for value in row])
+
+
+def _entry(tx, sign):
+    return RollupEntry(
+        tx.user_id,
+        tx.account_id,
+        tx.transaction_timestamp,
+        tx.transaction_type,
+        tx.transaction_method,
+        sign * tx.transaction_amount,
+        sign,
+    )
+
+
+def add(*transactions):
+    """거래를 집계에 더합니다."""
+    apply([_entry(tx, 1) for tx in transactions])
+
+
+def remove(*transactions):
+    """삭제된 거래를 집계에서 뺍니다."""
+    apply([_entry(tx, -1) for tx in transactions])
+
+
+def replace(before, after):
+    """수정된 거래의 이전 값을 빼고 새 값을 더합니다."""
+    apply([_entry(before, -1), _entry(after, 1)])
+
+
+def rebuild(user=None):
+    """
+    거래 내역에서 집계를 다시 만듭니다. (백필/복구용, PostgreSQL 전용)
+
+    user를 지정하면 해당 사용자의 집계만 다시 계산합니다. 라우터가 고른 원장
+    샤드 하나 범위이므로 use_shard() 안에서 샤드마다 호출합니다.
+    """
+    where, params = "TRUE", {"tz": settings.TIME_ZONE}
+    using = router.db_for_write(SpendingRollup)
+    rollups = SpendingRollup.objects.using(using)
+    if user is not None:
+        where, params["user_id"] = "user_id = %(user_id)s", user.pk
+        rollups = rollups.filter(user_id=user.pk)
+    sql = _REBUILD_SQL.format(
+        rollups=rollups_table(),
+        columns=_COLUMNS,
+        history=connections[using].ops.quote_name(Transaction._meta.db_table),
+        where=where,
+    )
+    with transaction.atomic(using=using):
+        rollups.delete()
+        with connections[using].cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.rowcount
+
+
+def summarize(user, granularity, start, end, account_id=None):
+    """
+    [start, end] 기간의 버킷별 입금/출금 합계와 거래 종류별 내역을 반환합니다.
+
+    start/end는 날짜이며 각각이 속한 버킷부터/까지 포함합니다.
+    """
+    start = bucket_starts(start)[granularity]
+    rollups = SpendingRollup.objects.filter(
+        user=user,
+        granularity=granularity,
+        period_start__gte=start,
+        period_start__lte=end,
+        transaction_count__gt=0,
+    )
+    if account_id is not None:
+        rollups = rollups.filter(account_id=account_id)
+    rows = (
+        rollups.values("period_start", "transaction_type", "transaction_method")
+        .annotate(amount=Sum("total_amount"), count=Sum("transaction_count"))
+        .order_by("period_start", "transaction_type", "transaction_method")
+    )
+
+    buckets = {}
+    for row in rows:
+        bucket = buckets.setdefault(
+            row["period_start"],
+            {
+                "period_start": row["period_start"],
+                "deposit_total": Decimal("0"),
+                "withdraw_total": Decimal("0"),
+                "transaction_count": 0,
+                "methods": [],
+            },
+        )
+        key = (
+            "deposit_total"
+            if row["transaction_type"] == "DEPOSIT"
+            else "withdraw_total"
+        )
+        bucket[key] += row["amount"]
+        bucket["transaction_count"] += row["count"]
+        bucket["methods"].append({
+            "transaction_type": row["transaction_type"],
+            "transaction_method": row["transaction_method"],
+            "total_amount": row["amount"],
+            "transaction_count": row["count"],
+        })
+    return list(buckets.values())
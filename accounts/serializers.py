@@ -1,22 +1,56 @@
 # -*- coding: utf-8 -*-
 
-from django.db import IntegrityError, transaction
+import copy
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import IntegrityError, router, transaction
+from django.utils import timezone
 from rest_framework import serializers
 
-# models.py에서 정의된 모델과 상수 임포트
+from . import ledger, rollups
+from .choices import (
+    ACCOUNT_TYPE_LABELS,
+    BANK_CODES,
+    BANK_LABELS,
+    PAYMENT_METHOD_LABELS,
+    PAYMENT_METHODS,
+    ROLLUP_GRANULARITIES,
+    TRANSACTION_TYPE_LABELS,
+    TRANSACTION_TYPES,
+)
+
+# models.py에서 정의된 모델 임포트
 from .models import (
-    BANK_CHOICES,
     Account,
     Transaction,
 )
 
 
+class ChoiceLabelField(serializers.Field):
+    """
+    코드 값을 미리 계산된 매핑(accounts.choices)에서 이름으로 바꾸는 읽기 전용 필드
+
+    get_FOO_display()와 같은 결과를 행마다 dict를 만들지 않고 O(1)로 조회합니다.
+    """
+
+    def __init__(self, labels, **kwargs):
+        kwargs["read_only"] = True
+        self.labels = labels
+        super().__init__(**kwargs)
+
+    def __deepcopy__(self, memo):
+        # 읽기 전용 매핑(MappingProxyType)은 복사하지 않고 그대로 공유합니다.
+        return self.__class__(self.labels, **self._kwargs)
+
+    def to_representation(self, value):
+        return self.labels.get(value, value)
+
+
 class AccountSerializer(serializers.ModelSerializer):
     # 🌟 1. 가독성 개선: 은행 이름 및 계좌 종류 이름을 읽기 전용 필드로 추가
-    bank_name = serializers.CharField(source="get_bank_code_display", read_only=True)
-    account_type_display = serializers.CharField(
-        source="get_account_type_display", read_only=True
-    )
+    bank_name = ChoiceLabelField(BANK_LABELS, source="bank_code")
+    account_type_display = ChoiceLabelField(ACCOUNT_TYPE_LABELS, source="account_type")
 
     class Meta:
         model = Account
@@ -42,7 +76,7 @@ class AccountSerializer(serializers.ModelSerializer):
         bank_code = data.get("bank_code")
 
         # 은행 코드 유효성 검사 (안전성 강화)
-        if bank_code and bank_code not in [code for code, name in BANK_CHOICES]:
+        if bank_code and bank_code not in BANK_CODES:
             raise serializers.ValidationError({
                 "bank_code": "유효하지 않은 은행 코드입니다."
             })
@@ -65,15 +99,31 @@ class AccountSerializer(serializers.ModelSerializer):
         return data
 
 
+# 🌟 거래의 계좌는 요청 사용자의 활성 계좌 중에서만 고를 수 있습니다.
+# (다른 사용자의 계좌로 거래를 만들거나 옮기면 그 사용자의 잔액/집계가 바뀝니다)
+class OwnAccountField(serializers.PrimaryKeyRelatedField):
+    default_error_messages = {
+        "does_not_exist": "존재하지 않는 계좌입니다.",
+    }
+
+    def get_queryset(self):
+        request = self.context.get("request")
+        if request is None:
+            return Account.objects.none()
+        return Account.objects.filter(user=request.user, is_deleted=False)
+
+
 class TransactionSerializer(serializers.ModelSerializer):
     # 🌟 3. 가독성 개선: 거래 타입, 거래 방식 display name 추가
-    transaction_type_display = serializers.CharField(
-        source="get_transaction_type_display", read_only=True
+    transaction_type_display = ChoiceLabelField(
+        TRANSACTION_TYPE_LABELS, source="transaction_type"
     )
-    transaction_method_display = serializers.CharField(
-        source="get_transaction_method_display", read_only=True
+    transaction_method_display = ChoiceLabelField(
+        PAYMENT_METHOD_LABELS, source="transaction_method"
     )
 
+    account = OwnAccountField()
+
     # 계좌 번호를 응답에 포함 (읽기 전용)
     account_number = serializers.CharField(
         source="account.account_number", read_only=True
@@ -103,43 +153,181 @@ class TransactionSerializer(serializers.ModelSerializer):
             "account_number",
         ]
 
-    # 🌟 4. 핵심 비즈니스 로직: Atomic Transaction 및 잔액 업데이트
+    # 🌟 4. 핵심 비즈니스 로직: 단일 SQL 문으로 잔액 검사/갱신 및 거래 기록
     def create(self, validated_data):
         """거래 생성 시 계좌 잔액을 업데이트하고 거래 후 잔액을 기록합니다."""
 
-        # 🌟 DB 트랜잭션 시작: 잔액 업데이트와 거래 기록을 원자적으로 처리
+        # 🌟 잔액 조건 검사, 잔액 갱신, 거래 INSERT는 ledger 엔진이 원자적으로 처리
+        # (동시 출금 시에도 DB가 행 잠금 시점의 잔액으로 다시 검사합니다.)
         try:
-            with transaction.atomic():
-                account = validated_data["account"]
-                amount = validated_data["transaction_amount"]
-                trans_type = validated_data["transaction_type"]
-
-                # 잔액 계산 및 출금 시 잔액 부족 검사
-                if trans_type == "DEPOSIT":
-                    new_balance = account.balance + amount
-                elif trans_type == "WITHDRAW":
-                    if account.balance < amount:
-                        # 🌟 유효성 검사: 잔액 부족 시 에러 발생
-                        raise serializers.ValidationError({
-                            "transaction_amount": "잔액이 부족하여 출금할 수 없습니다."
-                        })
-                    new_balance = account.balance - amount
-                else:
-                    raise serializers.ValidationError({
-                        "transaction_type": "유효하지 않은 거래 타입입니다."
-                    })
-
-                # 1. Account 모델의 잔액 업데이트
-                account.balance = new_balance
-                account.save(update_fields=["balance"])
-
-                # 2. Transaction 모델 생성 시 거래 후 잔액(post_transaction_amount) 기록
-                validated_data["post_transaction_amount"] = new_balance
-                transaction_instance = Transaction.objects.create(**validated_data)
-
-                return transaction_instance
+            return ledger.post_transaction(**validated_data)
+        except ledger.InsufficientBalance:
+            # 🌟 유효성 검사: 잔액 부족 시 에러 발생
+            raise serializers.ValidationError({
+                "transaction_amount": "잔액이 부족하여 출금할 수 없습니다."
+            })
+        except ledger.AccountNotFound:
+            raise serializers.ValidationError({"account": "존재하지 않는 계좌입니다."})
+        except ValueError:
+            raise serializers.ValidationError({
+                "transaction_type": "유효하지 않은 거래 타입입니다."
+            })
         except IntegrityError:
             # DB 레벨의 충돌(예: Unique 제약 조건 위반) 발생 시 처리
             raise serializers.ValidationError(
                 "데이터베이스 오류로 거래를 처리할 수 없습니다."
             )
+
+    # 잔액 체인(post_transaction_amount)에 영향을 주는 필드
+    CHAIN_FIELDS = (
+        "account",
+        "transaction_amount",
+        "transaction_type",
+        "transaction_timestamp",
+    )
+
+    # 🌟 5. 수정 시 잔액 체인과 소비 집계(SpendingRollup)를 같은 트랜잭션에서 보정
+    def update(self, instance, validated_data):
+        before = copy.copy(instance)
+        chain_changed = any(
+            field in validated_data and validated_data[field] != getattr(before, field)
+            for field in self.CHAIN_FIELDS
+        )
+        try:
+            with transaction.atomic(using=router.db_for_write(Transaction)):
+                segments = []
+                if chain_changed:
+                    account = validated_data.get("account")
+                    segments = ledger.plan_rechain(
+                        before,
+                        account_id=account.pk if account else None,
+                        timestamp=validated_data.get("transaction_timestamp"),
+                    )
+                instance = super().update(instance, validated_data)
+                if segments:
+                    _, posts = ledger.rechain(segments, exclude=[instance.pk])
+                    instance.post_transaction_amount = posts.get(
+                        instance.pk, instance.post_transaction_amount
+                    )
+                rollups.replace(before, instance)
+        except ledger.InsufficientBalance:
+            raise serializers.ValidationError({
+                "transaction_amount": "수정하면 계좌 잔액이 음수가 됩니다."
+            })
+        return instance
+
+
+# 🌟 일괄 전기 요청의 한 행 (DB 조회 없이 값만 검증, 계좌는 전기 시 한 번에 확인)
+class BulkTransactionSerializer(serializers.Serializer):
+    account = serializers.IntegerField(min_value=1)
+    transaction_amount = serializers.DecimalField(
+        max_digits=18, decimal_places=2, min_value=Decimal("0.01")
+    )
+    transaction_type = serializers.ChoiceField(choices=sorted(TRANSACTION_TYPES))
+    transaction_method = serializers.ChoiceField(
+        choices=sorted(PAYMENT_METHODS), default="TRANSFER"
+    )
+    transaction_details = serializers.CharField(
+        max_length=255, allow_blank=True, default=""
+    )
+    transaction_timestamp = serializers.DateTimeField()
+
+
+# 🌟 내 계좌 간 이체 요청 (출금/입금 거래 두 건을 한 트랜잭션으로 전기)
+class TransferSerializer(serializers.Serializer):
+    from_account = serializers.IntegerField(min_value=1)
+    to_account = serializers.IntegerField(min_value=1)
+    transaction_amount = serializers.DecimalField(
+        max_digits=18, decimal_places=2, min_value=Decimal("0.01")
+    )
+    transaction_details = serializers.CharField(
+        max_length=255, allow_blank=True, default=""
+    )
+    transaction_timestamp = serializers.DateTimeField(default=timezone.now)
+
+    def validate(self, data):
+        if data["from_account"] == data["to_account"]:
+            raise serializers.ValidationError({
+                "to_account": "같은 계좌로는 이체할 수 없습니다."
+            })
+        return data
+
+
+# 🌟 6. 특정 시점 잔액 조회 (단건/일괄)
+class BalanceQuerySerializer(serializers.Serializer):
+    """일괄 잔액 조회의 (계좌, 시점) 한 쌍"""
+
+    account = serializers.IntegerField()
+    at = serializers.DateTimeField(required=False)
+
+
+class BalanceBatchSerializer(serializers.Serializer):
+    """일괄 잔액 조회 요청 (최대 100쌍)"""
+
+    queries = BalanceQuerySerializer(many=True, allow_empty=False, max_length=100)
+
+
+class BalanceSerializer(serializers.Serializer):
+    """시점 잔액 응답"""
+
+    account = serializers.IntegerField()
+    at = serializers.DateTimeField()
+    balance = serializers.DecimalField(max_digits=18, decimal_places=2)
+
+
+# 🌟 7. 기간별 소비 분석 (SpendingRollup 집계 조회)
+class AnalysisQuerySerializer(serializers.Serializer):
+    """분석 조회 조건: 기간 단위(day/week/month), 날짜 범위, 계좌"""
+
+    # 기간 단위별 기본 조회 범위와 최대 버킷 수
+    DEFAULT_SPANS = {"DAY": 30, "WEEK": 7 * 12, "MONTH": 365}
+    MAX_BUCKETS = 366
+
+    granularity = serializers.CharField(required=False, default="MONTH")
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    account = serializers.IntegerField(required=False, min_value=1)
+
+    def validate_granularity(self, value):
+        value = value.upper()
+        if value not in ROLLUP_GRANULARITIES:
+            raise serializers.ValidationError("day, week, month 중 하나여야 합니다.")
+        return value
+
+    def validate(self, attrs):
+        granularity = attrs["granularity"]
+        end = attrs.setdefault("end", timezone.localdate())
+        start = attrs.setdefault(
+            "start", end - timedelta(days=self.DEFAULT_SPANS[granularity] - 1)
+        )
+        if start > end:
+            raise serializers.ValidationError({
+                "end": "종료일은 시작일보다 빠를 수 없습니다."
+            })
+        days = (end - start).days + 1
+        buckets = {"DAY": days, "WEEK": days // 7 + 1, "MONTH": days // 28 + 1}
+        if buckets[granularity] > self.MAX_BUCKETS:
+            raise serializers.ValidationError(
+                f"한 번에 조회할 수 있는 기간은 최대 {self.MAX_BUCKETS}개 구간입니다."
+            )
+        return attrs
+
+
+class AnalysisMethodSerializer(serializers.Serializer):
+    transaction_type = serializers.CharField()
+    transaction_method = serializers.CharField()
+    transaction_method_display = ChoiceLabelField(
+        PAYMENT_METHOD_LABELS, source="transaction_method"
+    )
+    total_amount = serializers.DecimalField(max_digits=18, decimal_places=2)
+    transaction_count = serializers.IntegerField()
+
+
+class AnalysisBucketSerializer(serializers.Serializer):
+    """기간 버킷 하나의 입금/출금 합계와 거래 종류별 내역"""
+
+    period_start = serializers.DateField()
+    deposit_total = serializers.DecimalField(max_digits=18, decimal_places=2)
+    withdraw_total = serializers.DecimalField(max_digits=18, decimal_places=2)
+    transaction_count = serializers.IntegerField()
+    methods = AnalysisMethodSerializer(many=True)
@@ -0,0 +1,432 @@
+# -*- coding: utf-8 -*-
+"""
+원장 데이터의 사용자별 수평 샤딩
+
+계좌/거래 API는 모두 request.user 범위이므로 사용자 한 명의 원장(accounts 앱
+모델: 계좌, 거래, 체크포인트, 소비 집계, 멱등성 키)을 통째로 한 DB에 둡니다.
+
+    LEDGER_SHARDS = {"ALIASES": ["default", "shard1", "shard2"], "MAP_TTL": 5}
+    DATABASE_ROUTERS = ["accounts.sharding.LedgerShardRouter", ...]
+    MIDDLEWARE = [..., "accounts.sharding.ShardRoutingMiddleware"]
+
+- 샤드 맵: LedgerShard(사용자 → 별칭, 이동 중 여부)는 기본 DB에만 있습니다.
+  행이 없는 사용자(샤딩 전 가입자)의 원장은 default에 있고, 새 사용자는 가입할
+  때 user_id % 샤드 수로 배치합니다. 맵은 기본 캐시에 MAP_TTL초 동안 둡니다.
+- LedgerShardRouter는 원장 모델의 조회/쓰기를 현재 요청 사용자(인증 후
+  request.user)의 샤드로 보냅니다. 요청 밖에서는 use_shard()로 지정합니다.
+  인스턴스에서 시작한 접근(관계 조회, save())은 그 인스턴스의 사용자/DB를
+  따릅니다. default 샤드의 조회/쓰기는 다음 라우터(읽기 복제본)가 정합니다.
+- 원장 코드(ledger, rollups, idempotency 등)는 router.db_for_write()로 구한
+  별칭에서 트랜잭션을 열고 raw SQL을 실행합니다.
+- 샤드에는 외래 키를 위한 사용자 자리표시 행(같은 id, 로그인 불가, 개인정보
+  없음)을 둡니다. 실제 사용자 행과 인증은 기본 DB에 있습니다.
+- 샤드마다 원장 테이블의 id 시퀀스를 (ALIASES 순번 << 40)부터 시작해
+  (post_migrate) 사용자를 옮겨도 id가 겹치지 않습니다.
+- move_user(): 사용자 한 명을 다른 샤드로 옮깁니다. (manage.py move_ledger_user)
+  이동하는 동안 그 사용자의 쓰기만 503(LedgerMoving)으로 거절하고, 조회와 다른
+  사용자의 요청은 그대로 처리합니다.
+- fan_out(): 관리자용 교차 사용자 조회 (모든 샤드에서 실행해 합칩니다)
+- 계좌 번호 유니크 제약과 관리 명령(체크포인트, 집계 재계산 등)은 샤드 하나
+  범위입니다. 명령은 use_shard(alias) 안에서 샤드마다 실행합니다.
+
+맵과 이동 상태를 워커 간에 바로 공유하려면 기본 캐시가 Redis(REDIS_URL)여야
+합니다. 로컬 메모리 캐시면 MAP_TTL초 안에 반영되며, 이동 명령은 각 단계
+사이에 그만큼 기다립니다.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from config.querybudget import uncounted
+
+from . import listcache
+from .models import (
+    Account,
+    BalanceCheckpoint,
+    IdempotencyKey,
+    LedgerShard,
+    SpendingRollup,
+    Transaction,
+)
+
+# 이동 순서 (외래 키 참조 대상부터), 삭제는 역순
+LEDGER_MODELS = (
+    Account,
+    Transaction,
+    BalanceCheckpoint,
+    SpendingRollup,
+    IdempotencyKey,
+)
+SEQUENCE_SHIFT = 40
+
+# 현재 요청(또는 use_shard)의 샤드 선택 (sync_to_async 스레드로 컨텍스트가 복사됩니다)
+_route = ContextVar("ledger_shard", default=None)
+
+
+class LedgerMoving(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = (
+        "원장을 다른 데이터베이스로 옮기는 중입니다. 잠시 후 다시 시도해 주세요."
+    )
+    default_code = "ledger_moving"
+
+
+def is_enabled():
+    return len(settings.LEDGER_SHARDS["ALIASES"]) > 1
+
+
+def is_ledger_model(model):
+    return model._meta.app_label == "accounts" and model is not LedgerShard
+
+
+# ----------------------------------------------------------------------
+# 샤드 맵
+# ----------------------------------------------------------------------
+
+
+def _map_key(user_id):
+    return f"accounts:ledger-shard:{user_id}"
+
+
+def shard_of(user_id):
+    """(별칭, 이동 중 여부)"""
+    key = _map_key(user_id)
+    entry = cache.get(key)
+    if entry is None:
+        # 맵 조회는 MAP_TTL초에 한 번이므로 뷰의 쿼리 예산에 넣지 않습니다.
+        with uncounted():
+            entry = LedgerShard.objects.using(DEFAULT_DB_ALIAS).filter(
+                user_id=user_id
+            ).values_list("alias", "moving").first() or (DEFAULT_DB_ALIAS, False)
+        cache.set(key, entry, settings.LEDGER_SHARDS["MAP_TTL"])
+    return entry
+
+
+def _set_shard(user_id, alias, moving=False):
+    LedgerShard.objects.using(DEFAULT_DB_ALIAS).update_or_create(
+        user_id=user_id, defaults={"alias": alias, "moving": moving}
+    )
+    cache.set(_map_key(user_id), (alias, moving), settings.LEDGER_SHARDS["MAP_TTL"])
+
+
+def place_new_user(sender, instance, created, raw=False, using=None, **kwargs):
+    """post_save(User): 새 사용자의 원장 샤드를 정하고 자리표시 행을 만듭니다."""
+    if not created or raw or using != DEFAULT_DB_ALIAS or not is_enabled():
+        return
+    aliases = settings.LEDGER_SHARDS["ALIASES"]
+    alias = aliases[instance.pk % len(aliases)]
+    if alias != DEFAULT_DB_ALIAS:
+        _ensure_user_row(instance.pk, alias)
+        LedgerShard.objects.using(DEFAULT_DB_ALIAS).create(
+            user_id=instance.pk, alias=alias
+        )
+        cache.set(
+            _map_key(instance.pk), (alias, False), settings.LEDGER_SHARDS["MAP_TTL"]
+        )
+
+
+def purge_deleted_user(sender, instance, using=None, **kwargs):
+    """pre_delete(User): 사용자를 실제로 지우면 커밋 후 샤드의 원장도 지웁니다."""
+    if using != DEFAULT_DB_ALIAS or not is_enabled():
+        return
+    alias, _ = shard_of(instance.pk)
+    if alias != DEFAULT_DB_ALIAS:
+        transaction.on_commit(
+            lambda: _delete_ledger(instance.pk, alias, user_row=True),
+            using=DEFAULT_DB_ALIAS,
+        )
+
+
+def _ensure_user_row(user_id, alias):
+    User = get_user_model()
+    stub = User(
+        pk=user_id,
+        email=f"user-{user_id}@ledger-shard.invalid",
+        nickname=f"ledger-shard-{user_id}",
+        is_active=False,
+    )
+    stub.set_unusable_password()
+    User._base_manager.using(alias).bulk_create([stub], ignore_conflicts=True)
+
+
+def prepare_shard(alias, **kwargs):
+    """원장 테이블의 id 시퀀스를 샤드 순번 구간으로 옮깁니다. (반복 실행 가능)"""
+    aliases = settings.LEDGER_SHARDS["ALIASES"]
+    connection = connections[alias]
+    if alias not in aliases or connection.vendor != "postgresql":
+        return
+    start = aliases.index(alias) << SEQUENCE_SHIFT
+    if not start:
+        return
+    with connection.cursor() as cursor:
+        for model in LEDGER_MODELS:
+            cursor.execute(
+                "SELECT pg_get_serial_sequence(%s, 'id')", [model._meta.db_table]
+            )
+            (sequence,) = cursor.fetchone()
+            cursor.execute(
+                f"SELECT setval(%s, %s, false) FROM {sequence} WHERE last_value < %s",
+                [sequence, start + 1, start],
+            )
+
+
+def on_post_migrate(sender, using=DEFAULT_DB_ALIAS, **kwargs):
+    prepare_shard(using)
+
+
+# ----------------------------------------------------------------------
+# 라우팅
+# ----------------------------------------------------------------------
+
+
+class _Route:
+    """요청 사용자(인증 후 request.user) 또는 고정 별칭의 샤드 선택"""
+
+    def __init__(self, request=None, alias=None):
+        self.request = request
+        self.entry = None if alias is None else (alias, False)
+
+    def resolve(self):
+        if self.entry is None:
+            # DRF는 인증한 사용자를 Django 요청(request.user)에도 넣습니다.
+            user = getattr(self.request, "user", None)
+            if user is None or not user.is_authenticated:
+                return None
+            self.entry = shard_of(user.pk)
+        return self.entry
+
+
+@contextmanager
+def use_shard(alias):
+    """요청 밖(관리 명령, fan_out)에서 원장 모델을 alias 샤드로 보냅니다."""
+    token = _route.set(_Route(alias=alias))
+    try:
+        yield
+    finally:
+        _route.reset(token)
+
+
+def _is_ledger_instance(instance):
+    return instance is not None and is_ledger_model(type(instance))
+
+
+def _hinted_shard(instance):
+    """인스턴스 힌트의 샤드 (사용자/원장 인스턴스가 아니면 None)"""
+    if instance is None:
+        return None
+    if isinstance(instance, get_user_model()):
+        return shard_of(instance.pk)
+    if not is_ledger_model(type(instance)):
+        return None
+    user_id = getattr(instance, "user_id", None)
+    if user_id is not None:
+        return shard_of(user_id)
+    if instance._state.db in settings.LEDGER_SHARDS["ALIASES"]:
+        return instance._state.db, False
+    return None
+
+
+class LedgerShardRouter:
+    """원장 모델을 사용자의 샤드로, 샤드 맵을 기본 DB로 보냅니다."""
+
+    def db_for_read(self, model, **hints):
+        if not is_enabled():
+            return None
+        if model is LedgerShard:
+            return DEFAULT_DB_ALIAS
+        instance = hints.get("instance")
+        if not is_ledger_model(model):
+            if model is get_user_model() and _is_ledger_instance(instance):
+                # account.user는 샤드의 자리표시 행이 아니라 실제 사용자 행을 읽습니다.
+                return DEFAULT_DB_ALIAS
+            return None
+        if _is_ledger_instance(instance):
+            # 인스턴스를 읽은 DB(복제본 포함)에서 관계를 이어서 읽습니다.
+            return instance._state.db
+        entry = _hinted_shard(instance)
+        if entry is None:
+            route = _route.get()
+            entry = route.resolve() if route is not None else None
+        if entry is None or entry[0] == DEFAULT_DB_ALIAS:
+            return None
+        return entry[0]
+
+    def db_for_write(self, model, **hints):
+        if not is_enabled():
+            return None
+        if model is LedgerShard:
+            return DEFAULT_DB_ALIAS
+        if not is_ledger_model(model):
+            return None
+        entry = _hinted_shard(hints.get("instance"))
+        if entry is None:
+            route = _route.get()
+            entry = route.resolve() if route is not None else None
+        if entry is None:
+            return None
+        alias, moving = entry
+        if moving:
+            raise LedgerMoving()
+        # default 샤드는 다음 라우터가 정합니다. (복제본 라우터의 쓰기 기록)
+        return None if alias == DEFAULT_DB_ALIAS else alias
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 사용자 행(기본 DB)과 원장 행(샤드)은 자리표시 행으로 연결됩니다.
+        if is_enabled() and (
+            is_ledger_model(type(obj1)) or is_ledger_model(type(obj2))
+        ):
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if model_name == LedgerShard._meta.model_name and app_label == "accounts":
+            return db == DEFAULT_DB_ALIAS
+        return None
+
+
+class ShardRoutingMiddleware:
+    """요청마다 샤드 선택 상태를 만듭니다. (인증 후 request.user로 결정)"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not is_enabled():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = _route.set(_Route(request))
+        try:
+            return self.get_response(request)
+        finally:
+            _route.reset(token)
+
+    async def __acall__(self, request):
+        token = _route.set(_Route(request))
+        try:
+            return await self.get_response(request)
+        finally:
+            _route.reset(token)
+
+
+# ----------------------------------------------------------------------
+# 이동과 교차 조회
+# ----------------------------------------------------------------------
+
+
+def _ledger_rows(model, user_id, alias):
+    rows = model._base_manager.using(alias)
+    if model is BalanceCheckpoint:
+        return rows.filter(account__user_id=user_id)
+    return rows.filter(user_id=user_id)
+
+
+def _delete_ledger(user_id, alias, user_row=False):
+    with transaction.atomic(using=alias):
+        for model in reversed(LEDGER_MODELS):
+            _ledger_rows(model, user_id, alias).delete()
+        if user_row:
+            get_user_model()._base_manager.using(alias).filter(pk=user_id).delete()
+
+
+def _copy_rows(model, rows, alias):
+    # bulk_create()는 auto_now/auto_now_add(created_at)를 현재 시각으로 덮어쓰므로
+    # raw 삽입으로 원본 값을 그대로 옮깁니다.
+    if rows:
+        model._base_manager.using(alias)._insert(
+            rows, fields=model._meta.local_concrete_fields, using=alias, raw=True
+        )
+    return len(rows)
+
+
+def move_user(user_id, target, batch_size=5000, grace=None, log=None):
+    """
+    user_id의 원장을 target 샤드로 옮기고 옮긴 모델별 행 수를 반환합니다.
+
+    ① 맵에 이동 중 표시 (그 사용자의 쓰기 거절) → grace초 대기
+    ② target에 한 트랜잭션으로 복사 (id 유지) 후 행 수 확인
+    ③ 맵을 target으로 전환 → grace초 대기 (이전 맵으로 읽는 요청 종료)
+    ④ 원본 샤드의 원장 삭제
+
+    실패하면 맵을 원래 샤드로 되돌립니다. grace 기본값은 MAP_TTL입니다.
+    """
+    log = log or (lambda message: None)
+    if target not in settings.LEDGER_SHARDS["ALIASES"]:
+        raise ValueError(f"{target}은(는) LEDGER_SHARDS에 없는 별칭입니다.")
+    grace = settings.LEDGER_SHARDS["MAP_TTL"] if grace is None else grace
+    cache.delete(_map_key(user_id))
+    source, moving = shard_of(user_id)
+    if moving:
+        raise ValueError(f"사용자 {user_id}의 원장은 이미 이동 중입니다.")
+    if source == target:
+        return {}
+
+    _set_shard(user_id, source, moving=True)
+    counts = {}
+    try:
+        time.sleep(grace)
+        if target != DEFAULT_DB_ALIAS:
+            _ensure_user_row(user_id, target)
+        with transaction.atomic(using=target):
+            for model in LEDGER_MODELS:
+                rows = _ledger_rows(model, user_id, source).order_by("pk")
+                batch, copied = [], 0
+                for row in rows.iterator(chunk_size=batch_size):
+                    batch.append(row)
+                    if len(batch) == batch_size:
+                        copied += _copy_rows(model, batch, target)
+                        batch = []
+                copied += _copy_rows(model, batch, target)
+                if _ledger_rows(model, user_id, target).count() != copied:
+                    raise RuntimeError(f"{model.__name__} 행 수가 일치하지 않습니다.")
+                counts[model.__name__] = copied
+                log(f"{model.__name__}: {copied}건 복사")
+    except BaseException:
+        _set_shard(user_id, source)
+        raise
+
+    _set_shard(user_id, target)
+    listcache.bump_ledger_version(user_id, using=DEFAULT_DB_ALIAS)
+    time.sleep(grace)
+    _delete_ledger(user_id, source, user_row=source != DEFAULT_DB_ALIAS)
+    log(f"{source} → {target} 이동 완료")
+    return counts
+
+
+def fan_out(queryset, aliases=None):
+    """
+    관리자용 교차 사용자 조회: queryset을 모든 샤드에서 실행해 결과를 이어 붙입니다.
+
+    정렬/슬라이스는 샤드마다 적용되므로 필요하면 합친 결과를 다시 정렬합니다.
+    """
+    results = []
+    for alias in aliases or settings.LEDGER_SHARDS["ALIASES"]:
+        with use_shard(alias):
+            results.extend(queryset.using(alias))
+    return results
+
+
+def fan_out_aggregate(queryset, aliases=None, **aggregates):
+    """모든 샤드의 aggregate() 결과를 더합니다. (Count, Sum 등 합산 가능한 집계만)"""
+    totals = dict.fromkeys(aggregates)
+    for alias in aliases or settings.LEDGER_SHARDS["ALIASES"]:
+        for name, value in queryset.using(alias).aggregate(**aggregates).items():
+            if value is not None:
+                totals[name] = value if totals[name] is None else totals[name] + value
+    return totals
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from datetime import timedelta
+from unittest import mock
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import override_settings
+from django.urls import path, reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import Account, Transaction
+from accounts.views import (
+    AccountListCreateView,
+    AccountRetrieveUpdateDestroyView,
+    TransactionExportView,
+    TransactionListCreateView,
+)
+from config.querybudget import QueryBudgetMiddleware
+from users.models import User
+
+
+class _AsyncUrls:
+    """ASYNC_API_VIEWS=True 상태에서 as_view()한 뷰로 구성한 URLconf"""
+
+    def __init__(self):
+        # 뷰를 코루틴으로 표시할지는 as_view() 시점의 설정으로 정해집니다.
+        self.urlpatterns = [
+            path("api/v1/accounts/accounts/", AccountListCreateView.as_view()),
+            path(
+                "api/v1/accounts/accounts/<int:pk>/",
+                AccountRetrieveUpdateDestroyView.as_view(),
+            ),
+            path("api/v1/accounts/transactions/", TransactionListCreateView.as_view()),
+        ]
+
+
+def _off_loop(method):
+    """이벤트 루프 스레드에서 호출되면 실패하는 캐시 메서드"""
+
+    def inner(*args, **kwargs):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return method(*args, **kwargs)
+        raise AssertionError("이벤트 루프에서 동기 캐시 API를 호출했습니다.")
+
+    return inner
+
+
+class AsyncReadViewTestCase(APITestCase):
+    """ASGI 배포 모드의 조회 API가 동기 뷰와 같은 응답을 돌려주는지 확인"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="async@example.com", password="password123"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="ASYNC-001", bank_code="004"
+        )
+        now = timezone.now()
+        Transaction.objects.bulk_create([
+            Transaction(
+                account=self.account,
+                user=self.user,
+                transaction_amount=i + 1,
+                post_transaction_amount=i + 1,
+                transaction_type="DEPOSIT",
+                transaction_method="TRANSFER",
+                transaction_timestamp=now - timedelta(minutes=i),
+            )
+            for i in range(5)
+        ])
+        token = RefreshToken.for_user(self.user).access_token
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        with self.settings(ASYNC_API_VIEWS=True):
+            self.urls = _AsyncUrls()
+
+    def test_views_are_async_only_in_asgi_mode(self):
+        self.assertFalse(iscoroutinefunction(AccountListCreateView.as_view()))
+        with self.settings(ASYNC_API_VIEWS=True):
+            self.assertTrue(iscoroutinefunction(AccountListCreateView.as_view()))
+            self.assertFalse(iscoroutinefunction(TransactionExportView.as_view()))
+
+    async def _get(self, url):
+        with self.settings(ROOT_URLCONF=self.urls):
+            return await self.async_client.get(url, headers=self.headers)
+
+    async def test_async_list_and_detail_match_sync_responses(self):
+        for name, kwargs, query in [
+            ("accounts:account-list", {}, ""),
+            ("accounts:account-detail", {"pk": self.account.pk}, ""),
+            ("accounts:transaction-list", {}, "?page_size=2&transaction_type=DEPOSIT"),
+        ]:
+            with self.subTest(name=name):
+                url = reverse(name, kwargs=kwargs) + query
+                response = await self._get(url)
+                self.assertEqual(response.status_code, 200)
+                # 기존 동기 뷰(WSGI 경로)의 응답과 비교
+                expected = await sync_to_async(self.client.get)(url)
+                self.assertEqual(response.json(), expected.json())
+
+    @override_settings(SHARED_CACHE=True)
+    async def test_async_list_cache_does_not_block_the_event_loop(self):
+        url = reverse("accounts:transaction-list")
+        with (
+            mock.patch.object(LocMemCache, "get", _off_loop(LocMemCache.get)),
+            mock.patch.object(LocMemCache, "add", _off_loop(LocMemCache.add)),
+            mock.patch.object(LocMemCache, "set", _off_loop(LocMemCache.set)),
+        ):
+            first = await self._get(url)
+            with self.settings(ROOT_URLCONF=self.urls):
+                cached = await self.async_client.get(
+                    url, headers={**self.headers, "If-None-Match": first["ETag"]}
+                )
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(cached.status_code, 304)
+
+    async def test_async_cursor_pagination_and_not_found(self):
+        url = reverse("accounts:transaction-list") + "?page_size=3"
+        first = (await self._get(url)).json()
+        second = (await self._get(first["next"].split("testserver")[1])).json()
+        amounts = [row["transaction_amount"] for row in first["results"]]
+        amounts += [row["transaction_amount"] for row in second["results"]]
+        self.assertEqual(amounts, ["1.00", "2.00", "3.00", "4.00", "5.00"])
+        self.assertIsNone(second["next"])
+
+        other = await User.objects.acreate(email="other@example.com", nickname="other")
+        account = await Account.objects.acreate(
+            user=other, account_number="ASYNC-002", bank_code="004"
+        )
+        url = reverse("accounts:account-detail", kwargs={"pk": account.pk})
+        self.assertEqual((await self._get(url)).status_code, 404)
+
+    async def test_async_auth_rejects_missing_or_invalid_token(self):
+        url = reverse("accounts:account-list")
+        with self.settings(ROOT_URLCONF=self.urls):
+            response = await self.async_client.get(url)
+            self.assertEqual(response.status_code, 401)
+            response = await self.async_client.get(
+                url, headers={"Authorization": "Bearer invalid"}
+            )
+            self.assertEqual(response.status_code, 401)
+            self.assertEqual(response.json()["code"], "token_not_valid")
+
+    async def test_write_handlers_still_run_in_asgi_mode(self):
+        url = reverse("accounts:account-list")
+        with self.settings(ROOT_URLCONF=self.urls):
+            response = await self.async_client.post(
+                url,
+                {"account_number": "ASYNC-003", "bank_code": "004"},
+                content_type="application/json",
+                headers=self.headers,
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(
+            await Account.objects.filter(account_number="ASYNC-003").aexists()
+        )
+
+    async def test_query_budget_counts_queries_of_async_views(self):
+        url = reverse("accounts:account-detail", kwargs={"pk": self.account.pk})
+        with mock.patch.object(QueryBudgetMiddleware, "_check", autospec=True) as check:
+            response = await self._get(url)
+        self.assertEqual(response.status_code, 200)
+        # 쿼리는 sync_to_async 스레드에서 실행돼도 요청의 카운터에 기록됩니다.
+        counter = check.call_args.args[2]
+        self.assertGreaterEqual(counter.count, 1)
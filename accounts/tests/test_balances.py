@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts import ledger
+from accounts.models import Account, BalanceCheckpoint, Transaction
+from users.models import User
+
+
+class PointInTimeBalanceTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="pit@example.com", password="password123"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="321-000", bank_code="004", balance=1000
+        )
+        self.t0 = timezone.now() - timedelta(days=10)
+        # 1000 -> +500 (day 1) -> -300 (day 2) -> +100 (day 3)
+        for day, trans_type, amount in [
+            (1, "DEPOSIT", 500),
+            (2, "WITHDRAW", 300),
+            (3, "DEPOSIT", 100),
+        ]:
+            ledger.post_transaction(
+                self.account,
+                trans_type,
+                Decimal(amount),
+                self.t0 + timedelta(days=day),
+            )
+        self.client.force_authenticate(self.user)
+
+    def _balance(self, at):
+        url = reverse("accounts:account-balance", args=[self.account.pk])
+        response = self.client.get(url, {"at": at.isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["balance"]
+
+    def test_balance_at_each_instant(self):
+        self.assertEqual(self._balance(self.t0), "1000.00")
+        self.assertEqual(self._balance(self.t0 + timedelta(days=1)), "1500.00")
+        self.assertEqual(self._balance(self.t0 + timedelta(days=2, hours=5)), "1200.00")
+        self.assertEqual(self._balance(timezone.now()), "1300.00")
+
+    def test_checkpoint_answers_after_history_is_archived(self):
+        call_command(
+            "create_balance_checkpoints",
+            as_of=(self.t0 + timedelta(days=2, hours=1)).isoformat(),
+            stdout=StringIO(),
+        )
+        self.assertEqual(BalanceCheckpoint.objects.get().balance, Decimal("1200.00"))
+
+        # 체크포인트 이전 거래 내역 아카이빙(삭제)
+        Transaction.objects.filter(
+            transaction_timestamp__lte=self.t0 + timedelta(days=2)
+        ).delete()
+
+        self.assertEqual(self._balance(self.t0 + timedelta(days=2, hours=5)), "1200.00")
+        self.assertEqual(self._balance(timezone.now()), "1300.00")
+
+    def test_backdated_post_invalidates_later_checkpoints(self):
+        call_command("create_balance_checkpoints", stdout=StringIO())
+        self.assertTrue(BalanceCheckpoint.objects.exists())
+
+        ledger.post_transaction(
+            self.account, "DEPOSIT", Decimal("1"), self.t0 + timedelta(hours=1)
+        )
+        self.assertFalse(BalanceCheckpoint.objects.exists())
+
+    def test_batch_balances(self):
+        other = User.objects.create_user(
+            email="other@example.com", password="pw", nickname="other"
+        )
+        foreign = Account.objects.create(
+            user=other, account_number="999-999", bank_code="004"
+        )
+        response = self.client.post(
+            reverse("accounts:account-balance-batch"),
+            {
+                "queries": [
+                    {"account": self.account.pk, "at": self.t0.isoformat()},
+                    {"account": self.account.pk},
+                    {"account": foreign.pk},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [row["balance"] for row in response.data["results"]],
+            ["1000.00", "1300.00", None],
+        )
+
+    def test_other_users_account_is_not_found(self):
+        other = User.objects.create_user(
+            email="other2@example.com", password="pw", nickname="other2"
+        )
+        self.client.force_authenticate(other)
+        url = reverse("accounts:account-balance", args=[self.account.pk])
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_timestamp_is_rejected(self):
+        url = reverse("accounts:account-balance", args=[self.account.pk])
+        response = self.client.get(url, {"at": "yesterday"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import json
+from decimal import Decimal
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import Account, SpendingRollup, Transaction
+from config.querybudget import max_queries
+from users.models import User
+
+
+class BulkTransactionTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="bulk@example.com", password="password123"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="900-100", bank_code="004", balance=100
+        )
+        self.other_account = Account.objects.create(
+            user=self.user, account_number="900-200", bank_code="088"
+        )
+        stranger = User.objects.create_user(
+            email="stranger@example.com", password="pw", nickname="stranger"
+        )
+        self.foreign_account = Account.objects.create(
+            user=stranger, account_number="900-900", bank_code="004", balance=500
+        )
+        self.client.force_authenticate(self.user)
+        self.url = reverse("accounts:transaction-bulk")
+
+    def _row(self, account, trans_type, amount, day, **extra):
+        return {
+            "account": account.pk,
+            "transaction_type": trans_type,
+            "transaction_amount": amount,
+            "transaction_timestamp": f"2025-05-{day:02d}T09:00:00Z",
+            **extra,
+        }
+
+    def test_rows_are_chained_per_account_in_timestamp_order(self):
+        rows = [
+            self._row(self.account, "WITHDRAW", "150.00", 3),
+            self._row(self.other_account, "DEPOSIT", "10.00", 1),
+            self._row(self.account, "DEPOSIT", "100.00", 2),
+            self._row(self.account, "WITHDRAW", "30.00", 4, transaction_method="CARD"),
+        ]
+        with max_queries(8):
+            response = self.client.post(self.url, rows, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [result["post_transaction_amount"] for result in response.data["results"]],
+            ["50.00", "10.00", "200.00", "20.00"],
+        )
+        self.account.refresh_from_db()
+        self.other_account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("20.00"))
+        self.assertEqual(self.other_account.balance, Decimal("10.00"))
+        self.assertEqual(
+            SpendingRollup.objects.get(
+                granularity="MONTH", account=self.account, transaction_method="CARD"
+            ).total_amount,
+            Decimal("30.00"),
+        )
+
+    def test_row_errors_are_reported_and_others_applied(self):
+        body = "\n".join(
+            json.dumps(row)
+            for row in [
+                self._row(self.account, "WITHDRAW", "500.00", 1),
+                self._row(self.account, "DEPOSIT", "-1", 2),
+                self._row(self.foreign_account, "WITHDRAW", "500.00", 3),
+                self._row(self.account, "DEPOSIT", "5.00", 4),
+            ]
+        )
+        response = self.client.post(self.url, body, content_type="application/x-ndjson")
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        results = response.data["results"]
+        self.assertIn("transaction_amount", results[0]["errors"])
+        self.assertIn("transaction_amount", results[1]["errors"])
+        self.assertIn("account", results[2]["errors"])
+        self.assertEqual(results[3]["post_transaction_amount"], "105.00")
+        self.assertEqual(response.data["created"], 1)
+        self.foreign_account.refresh_from_db()
+        self.assertEqual(self.foreign_account.balance, Decimal("500.00"))
+
+    def test_atomic_import_applies_nothing_on_failure(self):
+        rows = [
+            self._row(self.account, "DEPOSIT", "5.00", 1),
+            self._row(self.account, "WITHDRAW", "1000.00", 2),
+        ]
+        response = self.client.post(f"{self.url}?atomic=true", rows, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["created"], 0)
+        self.assertNotIn("id", response.data["results"][0])
+        self.assertFalse(Transaction.objects.exists())
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("100.00"))
+
+    def test_body_must_be_a_list(self):
+        response = self.client.post(self.url, {"account": 1}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(
+            self.url, "{not json", content_type="application/x-ndjson"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.choices import (
+    ACCOUNT_TYPE_CHOICES,
+    BANK_CHOICES,
+    BANK_LABELS,
+    REFERENCE_DATA_ETAG,
+)
+from accounts.models import Account, Transaction
+from accounts.serializers import AccountSerializer, TransactionSerializer
+from users.models import User
+
+
+class ChoiceRegistryTestCase(APITestCase):
+    def test_labels_match_get_display(self):
+        for bank_code, _ in BANK_CHOICES:
+            for account_type, _ in ACCOUNT_TYPE_CHOICES:
+                account = Account(bank_code=bank_code, account_type=account_type)
+                data = AccountSerializer(account).data
+                self.assertEqual(data["bank_name"], account.get_bank_code_display())
+                self.assertEqual(
+                    data["account_type_display"], account.get_account_type_display()
+                )
+
+        transaction = Transaction(
+            account=Account(account_number="1"),
+            transaction_type="WITHDRAW",
+            transaction_method="AUTOMATIC_TRANSFER",
+            transaction_timestamp=timezone.now(),
+        )
+        data = TransactionSerializer(transaction).data
+        self.assertEqual(data["transaction_type_display"], "출금")
+        self.assertEqual(data["transaction_method_display"], "자동이체")
+
+    def test_registry_is_immutable(self):
+        with self.assertRaises(TypeError):
+            BANK_LABELS["999"] = "가짜은행"
+
+    def test_invalid_bank_code_is_rejected(self):
+        user = User.objects.create_user(email="bank@example.com", password="pw")
+        self.client.force_authenticate(user)
+        response = self.client.post(
+            reverse("accounts:account-list"),
+            {"account_number": "1-2-3", "bank_code": "999"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("bank_code", response.data)
+
+    def test_reference_data_endpoint_supports_etag(self):
+        url = reverse("accounts:reference-data")
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], REFERENCE_DATA_ETAG)
+        self.assertIn("max-age=86400", response["Cache-Control"])
+        self.assertEqual(len(response.json()["banks"]), len(BANK_CHOICES))
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=REFERENCE_DATA_ETAG)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+import csv
+import gzip
+import io
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts import exports
+from accounts.models import Account, Transaction
+from users.models import User
+
+
+class TransactionExportTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="export@example.com", password="password123"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="100-200", bank_code="004"
+        )
+        self.other_account = Account.objects.create(
+            user=self.user, account_number="100-300", bank_code="088"
+        )
+        self.t0 = timezone.now() - timedelta(days=30)
+        for day in range(10):
+            Transaction.objects.create(
+                account=self.account if day % 2 else self.other_account,
+                transaction_amount=day + 1,
+                post_transaction_amount=day + 1,
+                transaction_details=f"거래 {day}",
+                transaction_type="DEPOSIT",
+                transaction_method="CARD",
+                transaction_timestamp=self.t0 + timedelta(days=day),
+            )
+        stranger = User.objects.create_user(
+            email="stranger@example.com", password="pw", nickname="stranger"
+        )
+        Transaction.objects.create(
+            account=Account.objects.create(
+                user=stranger, account_number="900-900", bank_code="004"
+            ),
+            transaction_amount=1,
+            post_transaction_amount=1,
+            transaction_type="DEPOSIT",
+            transaction_timestamp=self.t0,
+        )
+        self.client.force_authenticate(self.user)
+
+    def _export(self, file_format, **params):
+        url = reverse("accounts:transaction-export", args=[file_format])
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content)
+
+    def test_csv_export_streams_all_rows_in_order(self):
+        response, body = self._export("csv")
+
+        rows = list(csv.DictReader(io.StringIO(body.decode("utf-8-sig"))))
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(len(rows), 10)
+        self.assertEqual(rows[0]["transaction_details"], "거래 0")
+        self.assertEqual(rows[0]["transaction_method_display"], "카드결제")
+        self.assertEqual(rows[1]["account_number"], "100-200")
+
+    def test_csv_export_neutralizes_formulas(self):
+        Transaction.objects.filter(transaction_details="거래 0").update(
+            transaction_details='=HYPERLINK("http://evil.example","x")'
+        )
+        Transaction.objects.filter(transaction_details="거래 1").update(
+            transaction_details="-10+20"
+        )
+
+        _, body = self._export("csv")
+        rows = list(csv.DictReader(io.StringIO(body.decode("utf-8-sig"))))
+        self.assertEqual(
+            rows[0]["transaction_details"], '\'=HYPERLINK("http://evil.example","x")'
+        )
+        self.assertEqual(rows[1]["transaction_details"], "'-10+20")
+        self.assertEqual(rows[2]["transaction_details"], "거래 2")
+
+        # NDJSON은 스프레드시트로 열지 않으므로 원래 값을 그대로 씁니다.
+        _, body = self._export("ndjson")
+        self.assertEqual(
+            json.loads(body.splitlines()[1])["transaction_details"], "-10+20"
+        )
+
+    def test_ndjson_export_with_date_and_account_filters(self):
+        _, body = self._export(
+            "ndjson",
+            start=(self.t0 + timedelta(days=2)).isoformat(),
+            end=(self.t0 + timedelta(days=8)).isoformat(),
+            account=self.account.pk,
+        )
+
+        records = [json.loads(line) for line in body.decode().splitlines()]
+        self.assertEqual(
+            [record["transaction_details"] for record in records],
+            ["거래 3", "거래 5", "거래 7"],
+        )
+        self.assertEqual(records[0]["transaction_amount"], "4.00")
+
+    def test_gzip_export(self):
+        response, body = self._export("ndjson", gzip="true")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(len(gzip.decompress(body).decode().splitlines()), 10)
+
+    async def test_asgi_export_streams_chunk_by_chunk(self):
+        token = AccessToken.for_user(self.user)
+        url = reverse("accounts:transaction-export", args=["csv"])
+        with mock.patch.object(exports, "FLUSH_BYTES", 1):
+            response = await self.async_client.get(
+                url, headers={"Authorization": f"Bearer {token}"}
+            )
+            # 동기 이터레이터였다면 Django가 본문 전체를 list()로 모아 보냅니다.
+            self.assertTrue(response.is_async)
+            chunks = [chunk async for chunk in response.streaming_content]
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(chunks), 11)  # 헤더 + 10행, 한 줄씩 흘려보냅니다.
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8-sig"))))
+        self.assertEqual(
+            [row[5] for row in rows[1:]], [f"{n}.00" for n in range(1, 11)]
+        )
+
+    def test_invalid_filters_and_format(self):
+        url = reverse("accounts:transaction-export", args=["csv"])
+        response = self.client.get(url, {"start": "2025-02-01", "end": "2025-01-01"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        url = reverse("accounts:transaction-export", args=["xml"])
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import Account, Transaction
+from users.models import User
+
+
+class TransactionFilterTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="filter@example.com", password="password123"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="300-100", bank_code="004"
+        )
+        self.other_account = Account.objects.create(
+            user=self.user, account_number="300-200", bank_code="088"
+        )
+        self.t0 = timezone.now() - timedelta(days=30)
+        rows = [
+            (self.account, "DEPOSIT", "TRANSFER", 1000, "월급 10월"),
+            (self.account, "WITHDRAW", "CARD", 4500, "스타벅스 강남점"),
+            (self.other_account, "WITHDRAW", "CARD", 12000, "이마트 성수"),
+            (self.other_account, "WITHDRAW", "AUTOMATIC_TRANSFER", 80000, "관리비"),
+            (self.account, "WITHDRAW", "CARD", 5200, "STARBUCKS 역삼"),
+        ]
+        for day, (account, kind, method, amount, details) in enumerate(rows):
+            Transaction.objects.create(
+                account=account,
+                transaction_amount=amount,
+                post_transaction_amount=amount,
+                transaction_details=details,
+                transaction_type=kind,
+                transaction_method=method,
+                transaction_timestamp=self.t0 + timedelta(days=day),
+            )
+        self.client.force_authenticate(self.user)
+        self.url = reverse("accounts:transaction-list")
+
+    def _details(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row["transaction_details"] for row in response.data["results"]]
+
+    def test_type_method_and_amount_filters(self):
+        self.assertEqual(self._details(transaction_type="DEPOSIT"), ["월급 10월"])
+        self.assertEqual(
+            self._details(transaction_method="CARD", account=self.account.pk),
+            ["STARBUCKS 역삼", "스타벅스 강남점"],
+        )
+        self.assertEqual(
+            self._details(min_amount="5000", max_amount="12000"),
+            ["STARBUCKS 역삼", "이마트 성수"],
+        )
+
+    def test_substring_search_is_case_insensitive(self):
+        self.assertEqual(self._details(q="스타벅스"), ["스타벅스 강남점"])
+        self.assertEqual(self._details(q="starbucks"), ["STARBUCKS 역삼"])
+        self.assertEqual(self._details(q="%"), [])
+
+    def test_filters_keep_keyset_pagination(self):
+        response = self.client.get(
+            self.url, {"transaction_type": "WITHDRAW", "page_size": 2}
+        )
+        details = [row["transaction_details"] for row in response.data["results"]]
+        next_url = response.data["next"]
+        self.assertIn("transaction_type=WITHDRAW", next_url)
+
+        response = self.client.get(next_url)
+        details += [row["transaction_details"] for row in response.data["results"]]
+        self.assertEqual(
+            details, ["STARBUCKS 역삼", "관리비", "이마트 성수", "스타벅스 강남점"]
+        )
+        self.assertIsNone(response.data["next"])
+
+    def test_invalid_filters_are_rejected(self):
+        for params in (
+            {"transaction_type": "REFUND"},
+            {"min_amount": "abc"},
+            {"min_amount": "10", "max_amount": "1"},
+        ):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
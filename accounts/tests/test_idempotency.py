@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import threading
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts.models import Account, IdempotencyKey, Transaction
+from users.models import User
+
+
+def _payload(account, amount="300.00", trans_type="WITHDRAW"):
+    return {
+        "account": account.pk,
+        "transaction_amount": amount,
+        "transaction_type": trans_type,
+        "transaction_timestamp": "2025-06-01T09:00:00Z",
+    }
+
+
+class IdempotencyKeyTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="idem@example.com", password="password123"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="500-100", bank_code="004", balance=1000
+        )
+        self.client.force_authenticate(self.user)
+        self.url = reverse("accounts:transaction-list")
+
+    def _post(self, key, **kwargs):
+        return self.client.post(
+            self.url,
+            _payload(self.account, **kwargs),
+            format="json",
+            HTTP_IDEMPOTENCY_KEY=key,
+        )
+
+    def test_retry_replays_response_without_posting_again(self):
+        first = self._post("retry-1")
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+
+        replay = self._post("retry-1")
+        cache.clear()  # 캐시가 비어도 DB에 저장된 응답으로 재생
+        replay_from_db = self._post("retry-1")
+
+        for response in (replay, replay_from_db):
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertEqual(response["Idempotent-Replayed"], "true")
+            self.assertEqual(response.json(), first.json())
+        self.assertEqual(Transaction.objects.count(), 1)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("700.00"))
+
+    def test_key_reused_with_different_body_is_rejected(self):
+        self._post("reuse-1")
+        response = self._post("reuse-1", amount="1.00")
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(Transaction.objects.count(), 1)
+
+    def test_failed_request_does_not_store_key(self):
+        response = self._post("fail-1", amount="5000.00")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+    def test_expired_key_is_processed_as_new_request(self):
+        self._post("old-1")
+        IdempotencyKey.objects.update(created_at=timezone.now() - timedelta(days=2))
+        cache.clear()
+
+        response = self._post("old-1")
+        self.assertNotIn("Idempotent-Replayed", response)
+        self.assertEqual(Transaction.objects.count(), 2)
+
+
+class ConcurrentIdempotencyTestCase(TransactionTestCase):
+    def test_concurrent_duplicates_wait_for_first_request(self):
+        cache.clear()
+        user = User.objects.create_user(email="idem-race@example.com", password="pw")
+        account = Account.objects.create(
+            user=user, account_number="500-900", bank_code="004", balance=1000
+        )
+        barrier = threading.Barrier(6)
+        responses = []
+
+        def post():
+            client = APIClient()
+            client.force_authenticate(user)
+            barrier.wait()
+            try:
+                responses.append(
+                    client.post(
+                        reverse("accounts:transaction-list"),
+                        _payload(account),
+                        format="json",
+                        HTTP_IDEMPOTENCY_KEY="race-1",
+                    )
+                )
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=post) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(
+            {response.status_code for response in responses}, {status.HTTP_201_CREATED}
+        )
+        self.assertEqual(len({response.json()["id"] for response in responses}), 1)
+        self.assertEqual(Transaction.objects.filter(account=account).count(), 1)
+        account.refresh_from_db()
+        self.assertEqual(account.balance, Decimal("700.00"))
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+from unittest import skipIf, skipUnless
+
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import Account, Transaction
+from users.models import User
+
+
+@skipUnless(connection.vendor == "postgresql", "EXPLAIN 플랜 검증은 PostgreSQL 전용")
+@skipIf(
+    settings.TRANSACTION_PARTITIONING["ENABLED"],
+    "파티션 테이블에서는 인덱스 이름이 파티션별로 달라집니다.",
+)
+class ListQueryPlanTestCase(TestCase):
+    """목록 조회 쿼리가 복합/부분 인덱스를 사용하는지 EXPLAIN으로 확인합니다."""
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        cls.users = [
+            User.objects.create_user(
+                email=f"plan{i}@example.com", password="pw", nickname=f"plan{i}"
+            )
+            for i in range(20)
+        ]
+        accounts = Account.objects.bulk_create([
+            Account(
+                user=user,
+                account_number=f"{i:03d}-{j}",
+                bank_code="004",
+                is_deleted=j == 0,
+            )
+            for i, user in enumerate(cls.users)
+            for j in range(3)
+        ])
+        Transaction.objects.bulk_create([
+            Transaction(
+                account=account,
+                user_id=account.user_id,
+                transaction_amount=1,
+                post_transaction_amount=k,
+                transaction_type="DEPOSIT",
+                transaction_timestamp=now - timedelta(minutes=k),
+            )
+            for account in accounts
+            for k in range(100)
+        ])
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE accounts")
+            cursor.execute("ANALYZE transaction_history")
+
+    def assertUsesIndex(self, queryset, index_name):
+        # 작은 시드 데이터에서는 Seq Scan + Sort가 더 싸게 계산되므로,
+        # 인덱스만으로 정렬까지 처리할 수 있는지를 확인하도록 두 전략을 끕니다.
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("SET LOCAL enable_sort = off")
+        plan = queryset.explain()
+        self.assertIn(index_name, plan)
+        self.assertNotIn("Sort", plan)
+
+    def test_transaction_list_is_index_range_scan(self):
+        queryset = Transaction.objects.filter(user=self.users[3]).order_by(
+            "-transaction_timestamp", "-id"
+        )[:21]
+        self.assertUsesIndex(queryset, "tx_user_ts_idx")
+        self.assertNotIn("Join", queryset.explain())
+
+    def test_account_transactions_use_account_index(self):
+        account = Account.objects.filter(user=self.users[5]).first()
+        queryset = Transaction.objects.filter(account=account).order_by(
+            "-transaction_timestamp", "-id"
+        )[:21]
+        self.assertUsesIndex(queryset, "tx_account_ts_idx")
+
+    def test_active_account_list_uses_partial_index(self):
+        queryset = Account.objects.filter(
+            user=self.users[7], is_deleted=False
+        ).order_by("-created_at", "-id")[:21]
+        self.assertUsesIndex(queryset, "account_user_active_idx")
+
+    def test_type_filter_uses_type_index(self):
+        queryset = Transaction.objects.filter(
+            user=self.users[9], transaction_type="WITHDRAW"
+        ).order_by("-transaction_timestamp", "-id")[:21]
+        self.assertUsesIndex(queryset, "tx_user_type_ts_idx")
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+import json
+import pstats
+import re
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import Account, Transaction
+from users.authentication import invalidate_cached_user
+from users.models import User
+
+SERVER_TIMING = re.compile(
+    r'db;dur=[\d.]+;desc="(\d+) queries", serializer;dur=[\d.]+, '
+    r"view;dur=[\d.]+, total;dur=[\d.]+"
+)
+
+
+class InstrumentationTestCase(APITestCase):
+    """요청별 Server-Timing 헤더, JSON 로그, 샘플링 프로파일"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="timing@example.com", password="password123"
+        )
+        account = Account.objects.create(
+            user=self.user, account_number="TM-001", bank_code="004"
+        )
+        Transaction.objects.create(
+            account=account,
+            user=self.user,
+            transaction_amount=100,
+            post_transaction_amount=100,
+            transaction_type="DEPOSIT",
+            transaction_timestamp=timezone.now(),
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.url = reverse("accounts:transaction-list")
+
+    def test_server_timing_header_and_log_line(self):
+        with self.assertLogs("config.instrumentation", "INFO") as logs:
+            response = self.client.get(self.url)
+
+        match = SERVER_TIMING.fullmatch(response["Server-Timing"])
+        self.assertIsNotNone(match, response["Server-Timing"])
+        record = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(record["view"], "accounts:transaction-list")
+        self.assertEqual(record["status"], 200)
+        self.assertEqual(record["db_queries"], int(match[1]))
+        self.assertGreater(record["db_queries"], 0)
+        self.assertGreater(record["serializer_ms"], 0)
+        self.assertGreaterEqual(record["total_ms"], record["view_ms"])
+        self.assertIsNone(record["profile"])
+
+    async def test_async_chain_counts_queries_from_worker_threads(self):
+        response = await self.async_client.get(self.url, headers=self.headers)
+        match = SERVER_TIMING.fullmatch(response["Server-Timing"])
+        self.assertIsNotNone(match, response["Server-Timing"])
+        self.assertGreater(int(match[1]), 0)
+
+    def test_sampled_profiles_keep_only_the_slowest(self):
+        with tempfile.TemporaryDirectory() as directory:
+            options = {
+                **settings.INSTRUMENTATION,
+                "PROFILE_SAMPLE_RATE": 1,
+                "PROFILE_SLOW_MS": 0,
+                "PROFILE_DIR": directory,
+                "PROFILE_KEEP": 2,
+            }
+            with override_settings(INSTRUMENTATION=options):
+                for _ in range(3):
+                    self.client.get(self.url)
+
+            profiles = sorted(Path(directory).glob("*.prof"))
+            self.assertEqual(len(profiles), 2)
+            stats = pstats.Stats(str(profiles[0]))
+            self.assertTrue(
+                any(name == "list" for _, _, name in stats.stats),
+                "뷰 호출이 프로파일에 있어야 합니다.",
+            )
+
+    def test_profile_header_requires_secret_and_staff(self):
+        with tempfile.TemporaryDirectory() as directory:
+            options = {
+                **settings.INSTRUMENTATION,
+                "PROFILE_DIR": directory,
+                "PROFILE_SECRET": "s3cret",
+            }
+            with override_settings(INSTRUMENTATION=options):
+                self.client.get(self.url, HTTP_X_PROFILE="s3cret")
+                self.assertEqual(list(Path(directory).iterdir()), [])
+
+                self.user.is_staff = True
+                self.user.save()
+                invalidate_cached_user(self.user.pk)
+                with mock.patch("cProfile.Profile") as profile:
+                    self.client.get(self.url, HTTP_X_PROFILE="guess")
+                # 비밀 값이 틀리면 프로파일러를 켜지 않습니다.
+                profile.assert_not_called()
+                self.client.get(self.url, HTTP_X_PROFILE="s3cret")
+                self.assertEqual(len(list(Path(directory).glob("*.prof"))), 1)
+
+    def test_profile_header_is_ignored_without_secret(self):
+        self.user.is_staff = True
+        self.user.save()
+        invalidate_cached_user(self.user.pk)
+        with tempfile.TemporaryDirectory() as directory:
+            options = {
+                **settings.INSTRUMENTATION,
+                "PROFILE_DIR": directory,
+                "PROFILE_SECRET": "",
+            }
+            with override_settings(INSTRUMENTATION=options):
+                self.client.get(self.url, HTTP_X_PROFILE="")
+                self.client.get(self.url, HTTP_X_PROFILE="1")
+            self.assertEqual(list(Path(directory).iterdir()), [])
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import threading
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts import ledger
+from accounts.models import Account, Transaction
+from users.models import User
+
+
+class TransactionPostingTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="ledger@example.com", password="password123"
+        )
+        self.account = Account.objects.create(
+            user=self.user,
+            account_number="111-222-333",
+            bank_code="004",
+            balance=10000,
+        )
+        self.client.force_authenticate(self.user)
+        self.url = reverse("accounts:transaction-list")
+
+    def _post(self, transaction_type, amount):
+        return self.client.post(
+            self.url,
+            {
+                "account": self.account.pk,
+                "transaction_amount": amount,
+                "transaction_type": transaction_type,
+                "transaction_method": "ATM",
+                "transaction_timestamp": timezone.now().isoformat(),
+            },
+            format="json",
+        )
+
+    def test_deposit_updates_balance_and_post_amount(self):
+        response = self._post("DEPOSIT", "2500.00")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["post_transaction_amount"], "12500.00")
+        self.assertEqual(response.data["account_number"], "111-222-333")
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("12500.00"))
+
+    def test_withdraw_insufficient_balance_is_rejected(self):
+        response = self._post("WITHDRAW", "10000.01")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("transaction_amount", response.data)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal("10000.00"))
+        self.assertFalse(Transaction.objects.exists())
+
+
+class ConcurrentPostingTestCase(TransactionTestCase):
+    def test_parallel_withdrawals_never_overdraw(self):
+        user = User.objects.create_user(email="hot@example.com", password="pw")
+        account = Account.objects.create(
+            user=user, account_number="999-000", bank_code="004", balance=10000
+        )
+        barrier = threading.Barrier(8)
+        outcomes = []
+
+        def withdraw():
+            barrier.wait()
+            try:
+                ledger.post_transaction(
+                    Account(pk=account.pk), "WITHDRAW", Decimal("3000"), timezone.now()
+                )
+                outcomes.append(True)
+            except ledger.InsufficientBalance:
+                outcomes.append(False)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=withdraw) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        account.refresh_from_db()
+        self.assertEqual(outcomes.count(True), 3)
+        self.assertEqual(account.balance, Decimal("1000.00"))
+        self.assertEqual(
+            sorted(
+                Transaction.objects.filter(account=account).values_list(
+                    "post_transaction_amount", flat=True
+                )
+            ),
+            [Decimal("1000.00"), Decimal("4000.00"), Decimal("7000.00")],
+        )
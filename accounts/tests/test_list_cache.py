@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+from django.db import transaction
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts import ledger
+from accounts.listcache import ledger_version
+from accounts.models import Account
+from config.querybudget import max_queries
+from users.models import User
+
+
+@override_settings(SHARED_CACHE=True)
+class ListCacheTestCase(APITestCase):
+    """목록 응답은 원장 버전별로 캐시되고 If-None-Match에는 DB 조회 없이 304"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="listcache@example.com", password="password123"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="LC-001", bank_code="004", balance=1000
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.accounts_url = reverse("accounts:account-list")
+        self.transactions_url = reverse("accounts:transaction-list")
+
+    def test_conditional_get_returns_304_without_queries(self):
+        first = self.client.get(self.transactions_url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        etag = first["ETag"]
+        self.assertIn("private", first["Cache-Control"])
+        self.assertIn("no-cache", first["Cache-Control"])
+        self.assertIn("Authorization", first["Vary"])
+
+        # 인증 사용자와 목록 응답이 모두 캐시에 있어 DB를 읽지 않습니다.
+        with max_queries(0):
+            cached = self.client.get(self.transactions_url)
+            not_modified = self.client.get(
+                self.transactions_url, HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(cached.content, first.content)
+        self.assertEqual(cached["ETag"], etag)
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified["ETag"], etag)
+
+    def test_posting_bumps_version_and_refreshes_list(self):
+        etag = self.client.get(self.transactions_url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.transactions_url,
+                {
+                    "account": self.account.pk,
+                    "transaction_amount": "100.00",
+                    "transaction_type": "DEPOSIT",
+                    "transaction_timestamp": "2025-06-01T09:00:00Z",
+                },
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.get(self.transactions_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_soft_delete_and_batch_posting_bump_version(self):
+        self.client.get(self.accounts_url)
+        version = ledger_version(self.user.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            ledger.post_batch(
+                [
+                    {
+                        "account": self.account.pk,
+                        "transaction_type": "DEPOSIT",
+                        "transaction_amount": 1,
+                        "transaction_timestamp": timezone.now(),
+                    }
+                ],
+                user=self.user,
+            )
+        self.assertNotEqual(ledger_version(self.user.pk), version)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            url = reverse("accounts:account-detail", args=[self.account.pk])
+            self.client.delete(url)
+        self.assertEqual(self.client.get(self.accounts_url).data["results"], [])
+
+    def test_rolled_back_write_keeps_version(self):
+        version = ledger_version(self.user.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self.account.save()
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        self.assertEqual(ledger_version(self.user.pk), version)
+
+    @override_settings(LIST_CACHE={"ENABLED": False, "CACHE": "responses", "TTL": 0})
+    def test_cache_can_be_disabled(self):
+        response = self.client.get(self.accounts_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("ETag", response)
+
+    @override_settings(SHARED_CACHE=False)
+    def test_local_cache_is_not_used_across_workers(self):
+        # 다른 워커의 쓰기가 올린 버전을 볼 수 없으므로 목록을 캐시하지 않습니다.
+        for _ in range(2):
+            response = self.client.get(self.accounts_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("ETag", response)
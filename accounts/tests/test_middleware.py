@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users.models import User
+
+
+class LeanApiMiddlewareTestCase(APITestCase):
+    """API 경로는 웹 전용 미들웨어를 건너뛰고 /admin/은 전체 체인을 유지"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="lean@example.com", password="password123"
+        )
+        self.client.force_authenticate(self.user)
+
+    def test_api_request_skips_web_only_middleware(self):
+        response = self.client.get(reverse("accounts:account-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(hasattr(response.wsgi_request, "session"))
+        self.assertFalse(hasattr(response.wsgi_request, "_messages"))
+        self.assertNotIn("X-Frame-Options", response)
+
+    def test_admin_keeps_full_middleware_chain(self):
+        response = self.client.get("/admin/login/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(hasattr(response.wsgi_request, "session"))
+        self.assertEqual(response["X-Frame-Options"], "DENY")
+        self.assertIn("csrftoken", response.cookies)
+
+    @override_settings(API_MIDDLEWARE={"LEAN": False, "PATH_PREFIX": "/api/v1/"})
+    def test_lean_mode_can_be_disabled(self):
+        response = self.client.get(reverse("accounts:account-list"))
+        self.assertTrue(hasattr(response.wsgi_request, "session"))
+        self.assertEqual(response["X-Frame-Options"], "DENY")
+
+    async def test_api_request_under_asgi_handler(self):
+        response = await self.async_client.get(reverse("accounts:account-list"))
+        # 인증 없이도 미들웨어 체인을 끝까지 통과해 뷰의 401을 받습니다.
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertNotIn("X-Frame-Options", response)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import Account, Transaction
+from users.models import User
+
+
+class KeysetPaginationTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="pager@example.com", password="password123"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="555-000", bank_code="004"
+        )
+        base = timezone.now()
+        # 같은 시각의 거래를 섞어 (timestamp, id) 동률 처리를 검증
+        Transaction.objects.bulk_create([
+            Transaction(
+                account=self.account,
+                user=self.user,
+                transaction_amount=i + 1,
+                post_transaction_amount=i + 1,
+                transaction_type="DEPOSIT",
+                transaction_timestamp=base - timedelta(minutes=i // 3),
+            )
+            for i in range(25)
+        ])
+        self.client.force_authenticate(self.user)
+        self.url = reverse("accounts:transaction-list")
+
+    def _walk(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(row["id"] for row in response.data["results"])
+            url = response.data["next"]
+        return ids
+
+    def test_pages_cover_history_in_order_without_duplicates(self):
+        expected = list(
+            Transaction.objects.order_by("-transaction_timestamp", "-id").values_list(
+                "id", flat=True
+            )
+        )
+        self.assertEqual(self._walk(f"{self.url}?page_size=10"), expected)
+
+    def test_previous_link_returns_prior_page(self):
+        first = self.client.get(f"{self.url}?page_size=10").data
+        self.assertIsNone(first["previous"])
+        second = self.client.get(first["next"]).data
+        back = self.client.get(second["previous"]).data
+
+        self.assertEqual(
+            [row["id"] for row in back["results"]],
+            [row["id"] for row in first["results"]],
+        )
+
+    def test_page_size_is_capped_and_no_count_query(self):
+        with self.settings(API_MAX_PAGE_SIZE=5):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(f"{self.url}?page_size=1000")
+
+        self.assertEqual(len(response.data["results"]), 5)
+        sql = " ".join(query["sql"] for query in ctx.captured_queries).upper()
+        self.assertNotIn("COUNT(", sql)
+        self.assertNotIn("OFFSET", sql)
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(f"{self.url}?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_account_list_is_paginated(self):
+        response = self.client.get(reverse("accounts:account-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIsNone(response.data["next"])
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+import io
+from datetime import timedelta
+from unittest import skipIf, skipUnless
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts import partitioning
+from accounts.models import Account, Transaction
+from users.models import User
+
+
+@skipUnless(connection.vendor == "postgresql", "파티셔닝은 PostgreSQL 전용")
+@skipIf(settings.TRANSACTION_PARTITIONING["ENABLED"], "이미 파티션 테이블로 변환된 DB")
+class TransactionPartitioningTestCase(TestCase):
+    databases = {"default", "shard1"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="part@example.com", password="pw")
+        cls.account = Account.objects.create(
+            user=cls.user, account_number="800-100", bank_code="004"
+        )
+        cls.this_month = partitioning.month_start(timezone.now())
+        for months_ago in range(3):
+            month = partitioning.add_months(cls.this_month, -months_ago)
+            for day in range(3):
+                Transaction.objects.create(
+                    account=cls.account,
+                    transaction_amount=1,
+                    post_transaction_amount=1,
+                    transaction_type="DEPOSIT",
+                    transaction_timestamp=month + timedelta(days=day, hours=1),
+                )
+
+    def _convert(self):
+        ids = list(Transaction.objects.order_by("id").values_list("id", flat=True))
+        self.assertTrue(partitioning.convert(months_ahead=2, log=lambda _: None))
+        return ids
+
+    def test_convert_keeps_rows_ids_and_indexes(self):
+        ids = self._convert()
+
+        self.assertTrue(partitioning.is_partitioned())
+        self.assertEqual(
+            list(Transaction.objects.order_by("id").values_list("id", flat=True)), ids
+        )
+        names = [name for name, _ in partitioning.partitions()]
+        self.assertIn(partitioning.DEFAULT_PARTITION, names)
+        self.assertIn(
+            partitioning.partition_name(partitioning.add_months(self.this_month, 2)),
+            names,
+        )
+        self.assertFalse(partitioning.convert(log=lambda _: None))
+
+        created = Transaction.objects.create(
+            account=self.account,
+            transaction_amount=1,
+            post_transaction_amount=1,
+            transaction_type="DEPOSIT",
+            transaction_timestamp=timezone.now(),
+        )
+        self.assertGreater(created.pk, max(ids))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes WHERE tablename = %s",
+                [partitioning.TABLE],
+            )
+            indexes = {row[0] for row in cursor.fetchall()}
+        self.assertLessEqual(
+            {"transaction_history_pkey", "tx_user_ts_idx", "tx_account_ts_idx"},
+            indexes,
+        )
+
+    def test_date_filtered_list_prunes_partitions(self):
+        self._convert()
+        last_month = partitioning.add_months(self.this_month, -1)
+        plan = (
+            Transaction.objects.filter(
+                user=self.user,
+                transaction_timestamp__gte=last_month,
+                transaction_timestamp__lt=self.this_month,
+            )
+            .order_by("-transaction_timestamp", "-id")[:21]
+            .explain()
+        )
+        self.assertIn(partitioning.partition_name(last_month), plan)
+        self.assertNotIn(partitioning.partition_name(self.this_month), plan)
+        self.assertNotIn(partitioning.DEFAULT_PARTITION, plan)
+
+    def test_convert_runs_on_the_given_database(self):
+        # migrate --database shard1은 그 샤드의 테이블만 변환합니다.
+        self.assertTrue(
+            partitioning.convert(months_ahead=1, log=lambda _: None, using="shard1")
+        )
+        self.assertTrue(partitioning.is_partitioned(using="shard1"))
+        self.assertFalse(partitioning.is_partitioned())
+        self.assertEqual(
+            len(partitioning.ensure_partitions(months_ahead=3, using="shard1")), 2
+        )
+
+    @override_settings(LEDGER_SHARDS={"ALIASES": ["default", "shard1"], "MAP_TTL": 5})
+    def test_command_runs_on_every_shard(self):
+        call_command("partition_transactions", convert=True, stdout=io.StringIO())
+        output = io.StringIO()
+        call_command("partition_transactions", months_ahead=6, stdout=output)
+        for alias in ("default", "shard1"):
+            with self.subTest(alias=alias):
+                self.assertTrue(partitioning.is_partitioned(using=alias))
+                self.assertIn(f"[{alias}] 파티션", output.getvalue())
+
+    def test_ensure_partitions_moves_rows_out_of_default(self):
+        self._convert()
+        future = partitioning.add_months(self.this_month, 6)
+        Transaction.objects.create(
+            account=self.account,
+            transaction_amount=1,
+            post_transaction_amount=1,
+            transaction_type="DEPOSIT",
+            transaction_timestamp=future + timedelta(days=1),
+        )
+
+        created = partitioning.ensure_partitions(months_ahead=6)
+        self.assertEqual(
+            created,
+            [
+                partitioning.partition_name(
+                    partitioning.add_months(self.this_month, offset)
+                )
+                for offset in range(3, 7)
+            ],
+        )
+        self.assertEqual(partitioning.ensure_partitions(months_ahead=6), [])
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT COUNT(*) FROM "{partitioning.partition_name(future)}"'
+            )
+            self.assertEqual(cursor.fetchone()[0], 1)
+            cursor.execute(f'SELECT COUNT(*) FROM "{partitioning.DEFAULT_PARTITION}"')
+            self.assertEqual(cursor.fetchone()[0], 0)
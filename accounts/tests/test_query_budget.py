@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import Account, Transaction
+from config.querybudget import (
+    QueryBudgetExceeded,
+    max_queries,
+    query_budget,
+    uncounted,
+)
+from users.models import User
+
+
+# 인증 사용자 캐시와 목록 응답 캐시를 끄고 캐시 미스(사용자 조회 1회) 경로로 예산을 검증
+@override_settings(
+    AUTH_USER_CACHE={"MAX_SIZE": 0, "TTL": 0},
+    LIST_CACHE={"ENABLED": False, "CACHE": "responses", "TTL": 0},
+)
+class QueryBudgetTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="budget@example.com", password="password123"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="777-000", bank_code="004"
+        )
+        # 실제 JWT 인증 경로(사용자 조회 1회)를 포함해 예산을 검증
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def _create_transactions(self, count):
+        for _ in range(count):
+            Transaction.objects.create(
+                account=self.account,
+                transaction_amount=1,
+                post_transaction_amount=1,
+                transaction_type="DEPOSIT",
+                transaction_timestamp=timezone.now(),
+            )
+
+    def test_transaction_list_query_count_is_constant(self):
+        url = reverse("accounts:transaction-list")
+        self._create_transactions(1)
+        with max_queries(2) as small:
+            self.client.get(url)
+        self._create_transactions(30)
+        with max_queries(2) as large:
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.data["results"]), 20)
+        self.assertEqual(small.count, large.count)
+
+    def test_transaction_detail_write_checks_owner_without_extra_query(self):
+        self._create_transactions(1)
+        transaction = Transaction.objects.get()
+        url = reverse("accounts:transaction-detail", args=[transaction.pk])
+
+        with max_queries(2):
+            self.client.get(url)
+        # 인증, 조회, UPDATE + 집계 보정용 atomic()의 SAVEPOINT/RELEASE
+        # (설명만 바뀌면 집계 버킷이 그대로라 집계 upsert는 실행되지 않습니다.)
+        with max_queries(5):
+            self.client.patch(url, {"transaction_details": "메모"}, format="json")
+
+    def test_account_endpoints_fit_declared_budgets(self):
+        with max_queries(2):
+            self.client.get(reverse("accounts:account-list"))
+        with max_queries(2):
+            self.client.get(reverse("accounts:account-detail", args=[self.account.pk]))
+
+    def test_middleware_raises_when_view_exceeds_budget(self):
+        from accounts.views import AccountListCreateView
+
+        original = AccountListCreateView.query_budget
+        query_budget(GET=1)(AccountListCreateView)
+        try:
+            with override_settings(QUERY_BUDGET={"ENABLED": True, "RAISE": True}):
+                with self.assertRaises(QueryBudgetExceeded):
+                    self.client.get(reverse("accounts:account-list"))
+        finally:
+            AccountListCreateView.query_budget = original
+
+    def test_uncounted_queries_are_excluded(self):
+        with max_queries(1) as counter:
+            Account.objects.count()
+            with uncounted():
+                Account.objects.count()
+        self.assertEqual(counter.count, 1)
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts import ledger
+from accounts.models import Account, BalanceCheckpoint, Transaction
+from users.models import User
+
+
+def _at(day):
+    return datetime(2025, 3, day, 9, tzinfo=dt_timezone.utc)
+
+
+class RechainTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="chain@example.com", password="pw")
+        self.account = Account.objects.create(
+            user=self.user, account_number="600-100", bank_code="004", balance=1000
+        )
+        self.client.force_authenticate(self.user)
+        # 1일 +100, 3일 -200, 5일 +50 → 1100, 900, 950
+        for day, trans_type, amount in [
+            (1, "DEPOSIT", "100"),
+            (3, "WITHDRAW", "200"),
+            (5, "DEPOSIT", "50"),
+        ]:
+            ledger.post_transaction(self.account, trans_type, Decimal(amount), _at(day))
+
+    def _post(self, trans_type, amount, day):
+        return self.client.post(
+            reverse("accounts:transaction-list"),
+            {
+                "account": self.account.pk,
+                "transaction_type": trans_type,
+                "transaction_amount": amount,
+                "transaction_timestamp": _at(day).isoformat(),
+            },
+            format="json",
+        )
+
+    def _detail(self, day):
+        tx = Transaction.objects.get(transaction_timestamp=_at(day))
+        return reverse("accounts:transaction-detail", args=[tx.pk])
+
+    def assertChain(self, expected):
+        self.assertEqual(
+            list(
+                Transaction.objects.filter(account=self.account)
+                .order_by("transaction_timestamp", "id")
+                .values_list("post_transaction_amount", flat=True)
+            ),
+            [Decimal(value) for value in expected],
+        )
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.balance, Decimal(expected[-1]))
+
+    def test_backdated_post_rechains_later_rows(self):
+        BalanceCheckpoint.objects.create(
+            account=self.account, as_of=_at(4), balance=900
+        )
+        response = self._post("WITHDRAW", "30.00", 2)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["post_transaction_amount"], "1070.00")
+        self.assertChain(["1100", "1070", "870", "920"])
+        self.assertFalse(BalanceCheckpoint.objects.exists())
+
+    def test_backdated_bulk_rows_rechain_from_earliest(self):
+        response = self.client.post(
+            reverse("accounts:transaction-bulk"),
+            [
+                {
+                    "account": self.account.pk,
+                    "transaction_type": trans_type,
+                    "transaction_amount": amount,
+                    "transaction_timestamp": _at(day).isoformat(),
+                }
+                for trans_type, amount, day in [
+                    ("DEPOSIT", "10.00", 4),
+                    ("DEPOSIT", "5.00", 2),
+                ]
+            ],
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [row["post_transaction_amount"] for row in response.data["results"]],
+            ["915.00", "1105.00"],
+        )
+        self.assertChain(["1100", "1105", "905", "915", "965"])
+
+    def test_update_amount_and_type_shifts_suffix(self):
+        response = self.client.patch(
+            self._detail(3),
+            {"transaction_type": "DEPOSIT", "transaction_amount": "20.00"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["post_transaction_amount"], "1120.00")
+        self.assertChain(["1100", "1120", "1170"])
+
+    def test_update_timestamp_moves_row_in_chain(self):
+        # 5일 입금을 앞으로(2일), 1일 입금을 맨 뒤로(6일) 옮깁니다.
+        for day, moved_to, expected in [
+            (5, 2, ["1100", "1150", "950"]),
+            (1, 6, ["1050", "850", "950"]),
+        ]:
+            with self.subTest(day=day, moved_to=moved_to):
+                response = self.client.patch(
+                    self._detail(day),
+                    {"transaction_timestamp": _at(moved_to).isoformat()},
+                    format="json",
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertChain(expected)
+
+    def test_update_account_rechains_both_accounts(self):
+        other = Account.objects.create(
+            user=self.user, account_number="600-200", bank_code="088", balance=10
+        )
+        response = self.client.patch(
+            self._detail(1), {"account": other.pk}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["post_transaction_amount"], "110.00")
+        self.assertChain(["800", "850"])
+        other.refresh_from_db()
+        self.assertEqual(other.balance, Decimal("110.00"))
+
+    def test_other_users_account_is_rejected(self):
+        stranger = User.objects.create_user(
+            email="stranger@example.com", password="pw", nickname="stranger"
+        )
+        foreign = Account.objects.create(
+            user=stranger, account_number="600-300", bank_code="088", balance=1000
+        )
+        moved = self.client.patch(
+            self._detail(1), {"account": foreign.pk}, format="json"
+        )
+        posted = self.client.post(
+            reverse("accounts:transaction-list"),
+            {
+                "account": foreign.pk,
+                "transaction_type": "DEPOSIT",
+                "transaction_amount": "100",
+                "transaction_timestamp": _at(7).isoformat(),
+            },
+            format="json",
+        )
+
+        for response in (moved, posted):
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("account", response.data)
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.balance, Decimal("1000.00"))
+        self.assertFalse(Transaction.objects.filter(account=foreign).exists())
+
+    def test_delete_rechains_and_rejects_negative_balance(self):
+        response = self.client.delete(self._detail(3))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertChain(["1100", "1150"])
+
+        ledger.post_transaction(self.account, "WITHDRAW", Decimal("1150"), _at(7))
+        response = self.client.delete(self._detail(1))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertChain(["1100", "1150", "0"])
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+import tempfile
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase, TransactionTestCase
+
+from accounts import ledger, reconcile
+from accounts.models import Account, Transaction
+from users.models import User
+
+
+def _at(day):
+    return datetime(2025, 4, day, 9, tzinfo=dt_timezone.utc)
+
+
+def _seed_accounts(test):
+    test.user = User.objects.create_user(email="recon@example.com", password="pw")
+    test.accounts = []
+    for number, balance in [("800-100", 1000), ("800-200", 50), ("800-300", 7)]:
+        account = Account.objects.create(
+            user=test.user, account_number=number, bank_code="004", balance=balance
+        )
+        test.accounts.append(account)
+    for day in range(1, 6):
+        for account in test.accounts[:2]:
+            ledger.post_transaction(account, "DEPOSIT", Decimal("10.50"), _at(day))
+        ledger.post_transaction(test.accounts[0], "WITHDRAW", Decimal("3"), _at(day))
+
+
+def _corrupt(test):
+    # 첫 계좌 3일째 거래의 post를 틀리게, 두 번째 계좌의 잔액을 틀리게 만듭니다.
+    broken = Transaction.objects.filter(
+        account=test.accounts[0], transaction_timestamp=_at(3)
+    ).order_by("id")[0]
+    Transaction.objects.filter(pk=broken.pk).update(post_transaction_amount=1)
+    Account.objects.filter(pk=test.accounts[1].pk).update(balance=999)
+    return broken
+
+
+class VerifyLedgerTestCase(TestCase):
+    def setUp(self):
+        _seed_accounts(self)
+
+    def _mismatches(self, **options):
+        return [m for _, found in reconcile.verify(**options) for m in found]
+
+    def test_consistent_ledger_has_no_mismatches(self):
+        checked = sum(rows for rows, _ in reconcile.verify(chunk_size=4))
+        self.assertEqual(checked, 15)
+        self.assertEqual(self._mismatches(chunk_size=4), [])
+
+    def test_reports_chain_and_balance_mismatches(self):
+        broken = _corrupt(self)
+        expected = [
+            {
+                "kind": "chain",
+                "account_id": self.accounts[0].pk,
+                "transaction_id": broken.pk,
+                "expected": "1025.50",
+                "actual": "1.00",
+                "rows": 1,
+            },
+            {
+                "kind": "balance",
+                "account_id": self.accounts[1].pk,
+                "expected": "102.50",
+                "actual": "999.00",
+            },
+        ]
+        # 청크 경계가 계좌 중간에 걸리도록 작은 청크로, NumPy/파이썬 경로 모두 확인
+        for numpy in (True, False):
+            with self.subTest(numpy=numpy):
+                if numpy and reconcile.np is None:
+                    self.skipTest("NumPy가 설치되어 있지 않습니다.")
+                with mock.patch.object(
+                    reconcile, "np", reconcile.np if numpy else None
+                ):
+                    self.assertEqual(
+                        self._mismatches(chunk_size=4, batch_accounts=2), expected
+                    )
+
+    def test_repair_rechains_mismatched_accounts(self):
+        _corrupt(self)
+        repaired, failed = reconcile.repair(self._mismatches())
+
+        self.assertEqual(repaired, [self.accounts[0].pk, self.accounts[1].pk])
+        self.assertEqual(failed, [])
+        self.assertEqual(self._mismatches(), [])
+        self.accounts[1].refresh_from_db()
+        self.assertEqual(self.accounts[1].balance, Decimal("102.50"))
+
+
+class VerifyLedgerCommandTestCase(TransactionTestCase):
+    def setUp(self):
+        _seed_accounts(self)
+
+    def test_parallel_report_and_repair(self):
+        _corrupt(self)
+        with tempfile.NamedTemporaryFile("r", suffix=".jsonl") as report:
+            with self.assertRaises(CommandError):
+                call_command(
+                    "verify_ledger",
+                    workers=2,
+                    batch_accounts=1,
+                    output=report.name,
+                    stderr=io.StringIO(),
+                )
+            kinds = [json.loads(line)["kind"] for line in report]
+        self.assertEqual(kinds, ["chain", "balance"])
+
+        call_command(
+            "verify_ledger",
+            workers=2,
+            repair=True,
+            stdout=io.StringIO(),
+            stderr=io.StringIO(),
+        )
+        call_command("verify_ledger", workers=2, stderr=io.StringIO())
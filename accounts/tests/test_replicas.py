@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from django.core.cache import cache
+from django.db import connections
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import Account
+from config.replicas import ReplicaRouter, is_pinned
+from users.models import User
+
+
+# "replica"는 테스트에서 default의 미러(별도 연결)입니다. (config/settings/dev.py)
+@override_settings(
+    READ_REPLICAS={
+        "ALIASES": ["replica"],
+        "APPS": ["accounts", "users"],
+        "STICKY_SECONDS": 5,
+    },
+    LIST_CACHE={"ENABLED": False, "CACHE": "responses", "TTL": 0},
+)
+class ReplicaRoutingTestCase(TransactionTestCase):
+    """조회는 복제본으로, 쓰기 직후 그 사용자의 조회는 기본 DB로"""
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="replica@example.com", password="password123"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="RP-001", bank_code="004", balance=1000
+        )
+        token = RefreshToken.for_user(self.user).access_token
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.transactions_url = reverse("accounts:transaction-list")
+
+    def _get(self, url):
+        with (
+            CaptureQueriesContext(connections["default"]) as primary,
+            CaptureQueriesContext(connections["replica"]) as replica,
+        ):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, primary, replica
+
+    def test_reads_go_to_replica_after_authentication(self):
+        response, primary, replica = self._get(reverse("accounts:account-list"))
+        self.assertEqual(response.data["results"][0]["id"], self.account.pk)
+        self.assertTrue(replica.captured_queries)
+        # JWT 사용자 조회는 기본 DB에서 실행됩니다.
+        self.assertFalse(any("users_user" in q["sql"] for q in replica))
+        self.assertFalse(any("accounts_account" in q["sql"] for q in primary))
+
+    def test_write_pins_user_to_primary(self):
+        response = self.client.post(
+            self.transactions_url,
+            {
+                "account": self.account.pk,
+                "transaction_amount": "100.00",
+                "transaction_type": "DEPOSIT",
+                "transaction_timestamp": "2025-06-01T09:00:00Z",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(is_pinned(self.user.pk))
+
+        response, primary, replica = self._get(self.transactions_url)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(replica.captured_queries, [])
+
+        cache.clear()  # STICKY_SECONDS가 지난 경우
+        response, primary, replica = self._get(self.transactions_url)
+        self.assertTrue(replica.captured_queries)
+
+    def test_router_outside_requests_uses_primary(self):
+        router = ReplicaRouter()
+        self.assertIsNone(router.db_for_read(Account))
+        self.assertEqual(router.db_for_write(Account), "default")
+        self.assertFalse(router.allow_migrate("replica", "accounts"))
+        self.assertIsNone(router.allow_migrate("default", "accounts"))
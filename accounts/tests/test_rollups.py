@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts import ledger
+from accounts.models import Account, SpendingRollup, Transaction
+from users.models import User
+
+
+def _at(day, hour=12):
+    return datetime.fromisoformat(f"2025-03-{day:02d}T{hour:02d}:00:00+00:00")
+
+
+class SpendingRollupTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="rollup@example.com", password="password123"
+        )
+        self.account = Account.objects.create(
+            user=self.user, account_number="700-100", bank_code="004", balance=1000
+        )
+        # 2025-03-03(월) ~ 2025-03-10(월): 두 주에 걸친 거래
+        for day, trans_type, method, amount in [
+            (3, "WITHDRAW", "CARD", 100),
+            (3, "WITHDRAW", "CARD", 50),
+            (5, "DEPOSIT", "TRANSFER", 300),
+            (10, "WITHDRAW", "ATM", 200),
+        ]:
+            ledger.post_transaction(
+                self.account,
+                trans_type,
+                Decimal(amount),
+                _at(day),
+                transaction_method=method,
+            )
+        self.client.force_authenticate(self.user)
+        self.url = reverse("accounts:analysis")
+
+    def _analysis(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["results"]
+
+    def _snapshot(self):
+        return sorted(
+            SpendingRollup.objects.filter(transaction_count__gt=0).values_list(
+                "granularity",
+                "period_start",
+                "transaction_type",
+                "transaction_method",
+                "total_amount",
+                "transaction_count",
+            )
+        )
+
+    def test_posting_updates_daily_weekly_monthly_buckets(self):
+        weeks = self._analysis(granularity="week", start="2025-03-03", end="2025-03-16")
+        self.assertEqual(
+            [(str(b["period_start"]), b["withdraw_total"]) for b in weeks],
+            [("2025-03-03", "150.00"), ("2025-03-10", "200.00")],
+        )
+        self.assertEqual(weeks[0]["deposit_total"], "300.00")
+        self.assertEqual(
+            weeks[0]["methods"][0]["transaction_method_display"], "계좌이체"
+        )
+
+        (month,) = self._analysis(
+            granularity="MONTH", start="2025-03-15", end="2025-03-31"
+        )
+        self.assertEqual(str(month["period_start"]), "2025-03-01")
+        self.assertEqual(month["transaction_count"], 4)
+
+        days = self._analysis(granularity="day", start="2025-03-03", end="2025-03-03")
+        self.assertEqual(days[0]["methods"][0]["transaction_count"], 2)
+
+    def test_update_and_delete_adjust_rollups(self):
+        card = Transaction.objects.filter(transaction_amount=100).get()
+        url = reverse("accounts:transaction-detail", args=[card.pk])
+        response = self.client.patch(
+            url, {"transaction_amount": "120.00", "transaction_timestamp": _at(12)}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        atm = Transaction.objects.filter(transaction_method="ATM").get()
+        response = self.client.delete(
+            reverse("accounts:transaction-detail", args=[atm.pk])
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        weeks = self._analysis(granularity="week", start="2025-03-03", end="2025-03-16")
+        self.assertEqual(
+            [(str(b["period_start"]), b["withdraw_total"]) for b in weeks],
+            [("2025-03-03", "50.00"), ("2025-03-10", "120.00")],
+        )
+
+        # 증분 유지 결과는 거래 내역에서 다시 계산한 결과와 같아야 합니다.
+        incremental = self._snapshot()
+        call_command("rebuild_rollups", stdout=StringIO())
+        self.assertEqual(self._snapshot(), incremental)
+
+    def test_analysis_is_scoped_and_validated(self):
+        stranger = User.objects.create_user(
+            email="stranger@example.com", password="pw", nickname="stranger"
+        )
+        self.client.force_authenticate(stranger)
+        self.assertEqual(self._analysis(start="2025-01-01", end="2025-12-31"), [])
+
+        for params in (
+            {"granularity": "hour"},
+            {"start": "2025-03-10", "end": "2025-03-01"},
+            {"granularity": "day", "start": "2020-01-01", "end": "2025-01-01"},
+        ):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
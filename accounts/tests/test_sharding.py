@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db.models import Count, Sum
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import (
+    Account,
+    BalanceCheckpoint,
+    LedgerShard,
+    SpendingRollup,
+    Transaction,
+)
+from accounts.sharding import (
+    SEQUENCE_SHIFT,
+    _set_shard,
+    fan_out,
+    fan_out_aggregate,
+    move_user,
+    prepare_shard,
+    shard_of,
+)
+from users.models import User
+
+
+# "shard1"은 테스트에서 별도 DB입니다. (config/settings/dev.py)
+# 새 사용자는 user_id % 2로 배치되므로 홀수 id는 shard1, 짝수 id는 default입니다.
+@override_settings(
+    LEDGER_SHARDS={"ALIASES": ["default", "shard1"], "MAP_TTL": 5},
+    LIST_CACHE={"ENABLED": False, "CACHE": "responses", "TTL": 0},
+)
+class LedgerShardingTestCase(TransactionTestCase):
+    """사용자별 원장 샤드 라우팅, 이동, 교차 조회"""
+
+    databases = {"default", "shard1"}
+
+    def setUp(self):
+        cache.clear()
+        prepare_shard("shard1")
+        self.accounts_url = reverse("accounts:account-list")
+        self.transactions_url = reverse("accounts:transaction-list")
+
+    def _client(self, user):
+        client = APIClient()
+        token = RefreshToken.for_user(user).access_token
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        return client
+
+    def _create_ledger(self, client, account_number):
+        response = client.post(
+            self.accounts_url,
+            {"account_number": account_number, "bank_code": "004"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        account_id = response.data["id"]
+        for amount, day in (("1000.00", "01"), ("250.00", "02")):
+            response = client.post(
+                self.transactions_url,
+                {
+                    "account": account_id,
+                    "transaction_amount": amount,
+                    "transaction_type": "DEPOSIT",
+                    "transaction_timestamp": f"2025-06-{day}T09:00:00Z",
+                },
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return account_id
+
+    def test_new_user_ledger_is_written_to_its_shard(self):
+        user = User.objects.create_user(
+            pk=1001, email="shard@example.com", password="password123"
+        )
+        self.assertEqual(shard_of(user.pk), ("shard1", False))
+        # 인증은 기본 DB, 외래 키는 샤드의 자리표시 행을 씁니다.
+        stub = User.objects.using("shard1").get(pk=user.pk)
+        self.assertFalse(stub.is_active)
+        self.assertFalse(stub.has_usable_password())
+
+        client = self._client(user)
+        self._create_ledger(client, "SH-001")
+        self.assertFalse(Account.objects.using("default").exists())
+        self.assertEqual(
+            Transaction.objects.using("shard1").filter(user_id=user.pk).count(), 2
+        )
+        # 샤드의 id는 (순번 << SEQUENCE_SHIFT)부터 시작합니다.
+        self.assertGreater(
+            Account.objects.using("shard1").get().pk, 1 << SEQUENCE_SHIFT
+        )
+
+        response = client.get(self.transactions_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [row["post_transaction_amount"] for row in response.data["results"]],
+            ["1250.00", "1000.00"],
+        )
+
+    def test_move_user_keeps_ids_and_created_at(self):
+        user = User.objects.create_user(
+            pk=1002, email="mover@example.com", password="password123"
+        )
+        self.assertEqual(shard_of(user.pk), ("default", False))
+        self._create_ledger(self._client(user), "SH-002")
+        before = list(
+            Transaction.objects.using("default").values_list("pk", "created_at")
+        )
+
+        counts = move_user(user.pk, "shard1", grace=0)
+
+        self.assertEqual(counts["Account"], 1)
+        self.assertEqual(counts["Transaction"], 2)
+        self.assertEqual(
+            list(Transaction.objects.using("shard1").values_list("pk", "created_at")),
+            before,
+        )
+        self.assertFalse(Transaction.objects.using("default").exists())
+        self.assertEqual(shard_of(user.pk), ("shard1", False))
+
+        response = self._client(user).get(self.transactions_url)
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_writes_are_rejected_while_moving(self):
+        user = User.objects.create_user(
+            pk=1003, email="moving@example.com", password="password123"
+        )
+        client = self._client(user)
+        self._create_ledger(client, "SH-003")
+        _set_shard(user.pk, "shard1", moving=True)
+
+        response = client.post(
+            self.accounts_url,
+            {"account_number": "SH-004", "bank_code": "004"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response.data["detail"].code, "ledger_moving")
+        self.assertEqual(client.get(self.accounts_url).status_code, status.HTTP_200_OK)
+
+    def test_fan_out_reads_every_shard(self):
+        for pk in (1004, 1005):
+            user = User.objects.create_user(
+                pk=pk,
+                email=f"fan{pk}@example.com",
+                password="password123",
+                nickname=f"fan{pk}",
+            )
+            self._create_ledger(self._client(user), f"SH-{pk}")
+        self.assertEqual(LedgerShard.objects.count(), 1)
+
+        accounts = fan_out(Account.objects.order_by("pk"))
+        self.assertEqual(sorted(account.user_id for account in accounts), [1004, 1005])
+        self.assertEqual(
+            fan_out_aggregate(
+                Transaction.objects.all(),
+                count=Count("pk"),
+                total=Sum("transaction_amount"),
+            ),
+            {"count": 4, "total": 2500},
+        )
+
+    def test_maintenance_commands_run_on_every_shard(self):
+        for pk in (1006, 1007):
+            user = User.objects.create_user(
+                pk=pk,
+                email=f"cmd{pk}@example.com",
+                password="password123",
+                nickname=f"cmd{pk}",
+            )
+            self._create_ledger(self._client(user), f"SH-{pk}")
+        Account.objects.using("shard1").update(balance=1)
+
+        report = io.StringIO()
+        with self.assertRaises(CommandError):
+            call_command("verify_ledger", workers=0, stdout=report)
+        mismatches = [json.loads(line) for line in report.getvalue().splitlines()]
+        self.assertEqual(
+            [(m["kind"], m["database"]) for m in mismatches], [("balance", "shard1")]
+        )
+        call_command("verify_ledger", workers=0, repair=True, stdout=io.StringIO())
+        self.assertEqual(
+            Account.objects.using("shard1").get().balance,
+            Account.objects.using("default").get().balance,
+        )
+
+        for command in ("create_balance_checkpoints", "rebuild_rollups"):
+            call_command(command, stdout=io.StringIO())
+        call_command("purge_idempotency_keys", stdout=io.StringIO())
+        for alias in ("default", "shard1"):
+            with self.subTest(alias=alias):
+                self.assertTrue(BalanceCheckpoint.objects.using(alias).exists())
+                self.assertTrue(SpendingRollup.objects.using(alias).exists())
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+import threading
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from accounts import ledger
+from accounts.models import Account, SpendingRollup, Transaction
+from config.querybudget import max_queries
+from users.models import User
+
+
+class TransferTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="tr@example.com", password="pw")
+        self.source = Account.objects.create(
+            user=self.user, account_number="700-100", bank_code="004", balance=1000
+        )
+        self.target = Account.objects.create(
+            user=self.user, account_number="700-200", bank_code="088", balance=50
+        )
+        stranger = User.objects.create_user(
+            email="tr-stranger@example.com", password="pw", nickname="tr-stranger"
+        )
+        self.foreign = Account.objects.create(
+            user=stranger, account_number="700-900", bank_code="004", balance=10
+        )
+        self.client.force_authenticate(self.user)
+        self.url = reverse("accounts:transfer")
+
+    def _transfer(self, source, target, amount):
+        return self.client.post(
+            self.url,
+            {
+                "from_account": source.pk,
+                "to_account": target.pk,
+                "transaction_amount": amount,
+                "transaction_details": "생활비",
+            },
+            format="json",
+        )
+
+    def test_transfer_writes_both_legs(self):
+        with max_queries(9):
+            response = self._transfer(self.source, self.target, "300.00")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["withdraw"]["post_transaction_amount"], "700.00")
+        self.assertEqual(response.data["deposit"]["post_transaction_amount"], "350.00")
+        self.source.refresh_from_db()
+        self.target.refresh_from_db()
+        self.assertEqual(self.source.balance, Decimal("700.00"))
+        self.assertEqual(self.target.balance, Decimal("350.00"))
+        self.assertEqual(
+            list(
+                Transaction.objects.order_by("id").values_list(
+                    "account_id", "transaction_type", "transaction_method"
+                )
+            ),
+            [
+                (self.source.pk, "WITHDRAW", "TRANSFER"),
+                (self.target.pk, "DEPOSIT", "TRANSFER"),
+            ],
+        )
+        self.assertEqual(SpendingRollup.objects.filter(granularity="DAY").count(), 2)
+
+    def test_failed_transfer_changes_nothing(self):
+        for target, amount, field in [
+            (self.target, "1000.01", "transaction_amount"),
+            (self.foreign, "10.00", "to_account"),
+            (self.source, "10.00", "to_account"),
+        ]:
+            with self.subTest(field=field, amount=amount):
+                response = self._transfer(self.source, target, amount)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn(field, response.data)
+
+        self.assertFalse(Transaction.objects.exists())
+        self.source.refresh_from_db()
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.source.balance, Decimal("1000.00"))
+        self.assertEqual(self.foreign.balance, Decimal("10.00"))
+
+
+class ConcurrentTransferTestCase(TransactionTestCase):
+    def test_opposite_transfers_do_not_deadlock(self):
+        user = User.objects.create_user(email="tr-race@example.com", password="pw")
+        first, second = (
+            Account.objects.create(
+                user=user, account_number=number, bank_code="004", balance=1000
+            )
+            for number in ("710-100", "710-200")
+        )
+        barrier = threading.Barrier(8)
+        errors = []
+
+        def worker(index):
+            source, target = (first, second) if index % 2 else (second, first)
+            client = APIClient()
+            client.force_authenticate(user)
+            try:
+                barrier.wait()
+                for _ in range(5):
+                    response = client.post(
+                        reverse("accounts:transfer"),
+                        {
+                            "from_account": source.pk,
+                            "to_account": target.pk,
+                            "transaction_amount": "10.00",
+                        },
+                        format="json",
+                    )
+                    if response.status_code != status.HTTP_201_CREATED:
+                        errors.append(response.status_code)
+            except Exception as exc:  # 교착 상태(OperationalError) 등
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.balance + second.balance, Decimal("2000.00"))
+        self.assertEqual(Transaction.objects.count(), 80)
+        for account in (first, second):
+            rows = Transaction.objects.filter(account=account).order_by(
+                "transaction_timestamp", "id"
+            )
+            balance = Decimal("1000.00")
+            for row in rows:
+                balance += ledger.signed_amount(
+                    row.transaction_type, row.transaction_amount
+                )
+                self.assertEqual(row.post_transaction_amount, balance)
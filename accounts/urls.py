@@ -2,10 +2,17 @@
 from django.urls import path
 
 from accounts.views import (
+    AccountBalanceBatchView,
+    AccountBalanceView,
     AccountListCreateView,
     AccountRetrieveUpdateDestroyView,
+    AnalysisView,
+    ReferenceDataView,
+    TransactionBulkCreateView,
+    TransactionExportView,
     TransactionListCreateView,
     TransactionRetrieveUpdateDestroyView,
+    TransferCreateView,
 )
 
 app_name = "accounts"
@@ -17,10 +24,33 @@ urlpatterns = [
         AccountRetrieveUpdateDestroyView.as_view(),
         name="account-detail",
     ),
+    path(
+        "accounts/<int:pk>/balance/",
+        AccountBalanceView.as_view(),
+        name="account-balance",
+    ),
+    path(
+        "accounts/balances/",
+        AccountBalanceBatchView.as_view(),
+        name="account-balance-batch",
+    ),
     path("transactions/", TransactionListCreateView.as_view(), name="transaction-list"),
+    path(
+        "transactions/bulk/",
+        TransactionBulkCreateView.as_view(),
+        name="transaction-bulk",
+    ),
+    path(
+        "transactions/export/<str:file_format>/",
+        TransactionExportView.as_view(),
+        name="transaction-export",
+    ),
     path(
         "transactions/<int:pk>/",
         TransactionRetrieveUpdateDestroyView.as_view(),
         name="transaction-detail",
     ),
+    path("transfers/", TransferCreateView.as_view(), name="transfer"),
+    path("analysis/", AnalysisView.as_view(), name="analysis"),
+    path("banks/", ReferenceDataView.as_view(), name="reference-data"),
 ]
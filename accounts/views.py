@@ -1,10 +1,38 @@
 # -*- coding: utf-8 -*-
 # accounts/views.py (개선된 버전)
 
-from rest_framework import generics, permissions
+import functools
 
+from django.core.handlers.asgi import ASGIRequest
+from django.db import router, transaction
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from rest_framework import generics, permissions, serializers, status
+from rest_framework.exceptions import NotFound
+from rest_framework.parsers import JSONParser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from accounts import balances, exports, idempotency, ledger, rollups
+from accounts.choices import REFERENCE_DATA_ETAG, REFERENCE_DATA_JSON
+from accounts.filters import filter_transactions
+from accounts.listcache import CachedListMixin
 from accounts.models import Account, Transaction
-from accounts.serializers import AccountSerializer, TransactionSerializer
+from accounts.pagination import AccountCursorPagination, TransactionCursorPagination
+from accounts.parsers import NDJSONParser
+from accounts.serializers import (
+    AccountSerializer,
+    AnalysisBucketSerializer,
+    AnalysisQuerySerializer,
+    BalanceBatchSerializer,
+    BalanceSerializer,
+    BulkTransactionSerializer,
+    TransactionSerializer,
+    TransferSerializer,
+)
+from config.asyncviews import AsyncReadMixin
+from config.querybudget import query_budget
 
 # 🌟 커스텀 권한 클래스를 임포트해야 합니다.
 from .permissions import IsOwnerOrReadOnly
@@ -14,14 +42,25 @@ class AuthenticatedAPIView:
     permission_classes = [permissions.IsAuthenticated]
 
 
+# 🌟 @query_budget: 인증(사용자 조회 1회)을 포함한 요청당 최대 SQL 쿼리 수
+# 🌟 AsyncReadMixin: ASGI 배포(settings.ASYNC_API_VIEWS)에서는 GET을 aget으로 처리
+# 🌟 CachedListMixin: 목록은 원장 버전별로 캐시하고 ETag/304로 응답
 # ----------------------------------------------------------------------
 # 1. Account Views
 # ----------------------------------------------------------------------
 
 
-class AccountListCreateView(AuthenticatedAPIView, generics.ListCreateAPIView):
+@query_budget(GET=2, POST=4)
+class AccountListCreateView(
+    AuthenticatedAPIView, CachedListMixin, AsyncReadMixin, generics.ListCreateAPIView
+):
     # (이전 코드와 동일: 목록 조회 및 생성)
     serializer_class = AccountSerializer
+    # 🌟 키셋 페이지네이션: (created_at, id) 커서
+    pagination_class = AccountCursorPagination
+
+    async def aget(self, request, *args, **kwargs):
+        return await self.alist(request, *args, **kwargs)
 
     def get_queryset(self):
         return Account.objects.filter(
@@ -32,13 +71,17 @@ class AccountListCreateView(AuthenticatedAPIView, generics.ListCreateAPIView):
         serializer.save(user=self.request.user)
 
 
+@query_budget(GET=2, PUT=5, PATCH=5, DELETE=3)
 class AccountRetrieveUpdateDestroyView(
-    AuthenticatedAPIView, generics.RetrieveUpdateDestroyAPIView
+    AuthenticatedAPIView, AsyncReadMixin, generics.RetrieveUpdateDestroyAPIView
 ):
     serializer_class = AccountSerializer
     # 🌟 2. 객체 레벨 권한 추가
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
 
+    async def aget(self, request, *args, **kwargs):
+        return await self.aretrieve(request, *args, **kwargs)
+
     def get_queryset(self):
         return Account.objects.filter(user=self.request.user, is_deleted=False)
 
@@ -49,17 +92,87 @@ class AccountRetrieveUpdateDestroyView(
         instance.save()
 
 
+# 🌟 4. 특정 시점 잔액 조회: (account, transaction_timestamp) 인덱스 탐색
+@query_budget(GET=2)
+class AccountBalanceView(AuthenticatedAPIView, APIView):
+    """GET /accounts/<pk>/balance/?at=<ISO 8601> : 해당 시점의 계좌 잔액"""
+
+    def get(self, request, pk):
+        at = request.query_params.get("at")
+        try:
+            at = serializers.DateTimeField().to_internal_value(at) if at else None
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError({"at": exc.detail})
+        at = at or timezone.now()
+
+        balance = balances.balance_at(pk, at, user=request.user)
+        if balance is None:
+            raise NotFound()
+        return Response(
+            BalanceSerializer({"account": pk, "at": at, "balance": balance}).data
+        )
+
+
+@query_budget(POST=2)
+class AccountBalanceBatchView(AuthenticatedAPIView, APIView):
+    """
+    POST /accounts/balances/ : 여러 (계좌, 시점) 쌍의 잔액을 한 번에 조회
+
+    {"queries": [{"account": 1, "at": "2025-01-01T00:00:00Z"}, ...]}
+    조회할 수 없는 계좌의 balance는 null입니다.
+    """
+
+    def post(self, request):
+        serializer = BalanceBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        now = timezone.now()
+        queries = [
+            balances.BalanceQuery(item["account"], item.get("at") or now)
+            for item in serializer.validated_data["queries"]
+        ]
+        results = balances.balances_at(queries, user=request.user)
+        data = [
+            {"account": query.account_id, "at": query.at, "balance": balance}
+            for query, balance in zip(queries, results)
+        ]
+        return Response({"results": BalanceSerializer(data, many=True).data})
+
+
 # ----------------------------------------------------------------------
 # 2. Transaction Views
 # ----------------------------------------------------------------------
 
 
-class TransactionListCreateView(AuthenticatedAPIView, generics.ListCreateAPIView):
+# POST: 키 선점 + 계좌 조회 + 전기 + 응답 저장 (+ 실패 시 세이브포인트 롤백)
+@query_budget(GET=2, POST=7)
+class TransactionListCreateView(
+    AuthenticatedAPIView, CachedListMixin, AsyncReadMixin, generics.ListCreateAPIView
+):
     serializer_class = TransactionSerializer
+    # 🌟 키셋 페이지네이션: (transaction_timestamp, id) 커서
+    pagination_class = TransactionCursorPagination
+
+    async def aget(self, request, *args, **kwargs):
+        return await self.alist(request, *args, **kwargs)
 
     def get_queryset(self):
-        return Transaction.objects.filter(account__user=self.request.user).order_by(
-            "-transaction_timestamp"
+        # 🌟 비정규화된 소유자(user)로 필터링: JOIN 없이 tx_user_ts_idx 범위 스캔
+        # 🌟 account_number 직렬화를 위해 계좌를 JOIN으로 함께 로드 (N+1 방지)
+        return (
+            Transaction.objects.filter(user=self.request.user)
+            .select_related("account")
+            .order_by("-transaction_timestamp")
+        )
+
+    def filter_queryset(self, queryset):
+        # 🌟 기간/계좌/타입/종류/금액/설명 검색 필터 (잘못된 값은 400)
+        # 정렬은 페이지네이션 커서가 결정하므로 필터는 WHERE 조건만 추가합니다.
+        return filter_transactions(queryset, self.request.query_params)
+
+    def create(self, request, *args, **kwargs):
+        # 🌟 Idempotency-Key: 재시도는 저장된 응답을 재생하고 잔액은 건드리지 않습니다.
+        return idempotency.run(
+            request, functools.partial(super().create, request, *args, **kwargs)
         )
 
     def perform_create(self, serializer):
@@ -68,6 +181,169 @@ class TransactionListCreateView(AuthenticatedAPIView, generics.ListCreateAPIView
         serializer.save()
 
 
+# 🌟 일괄 전기: 행 수와 관계없이 쿼리 수가 일정합니다.
+@query_budget(POST=9)
+class TransactionBulkCreateView(AuthenticatedAPIView, APIView):
+    """
+    POST /transactions/bulk/?atomic=true
+
+    본문은 거래 객체의 JSON 배열 또는 NDJSON(Content-Type: application/x-ndjson)입니다.
+    행별 결과(생성된 id와 거래 후 잔액, 또는 오류)를 입력 순서대로 반환합니다.
+    atomic=true면 한 행이라도 실패할 때 아무것도 반영하지 않습니다.
+    """
+
+    parser_classes = [JSONParser, NDJSONParser]
+    MAX_ROWS = 10_000
+
+    LEDGER_ERRORS = {
+        ledger.InsufficientBalance: {
+            "transaction_amount": ["잔액이 부족하여 출금할 수 없습니다."]
+        },
+        ledger.AccountNotFound: {"account": ["존재하지 않는 계좌입니다."]},
+    }
+
+    def post(self, request):
+        rows = request.data
+        if not isinstance(rows, list) or not rows:
+            raise serializers.ValidationError(
+                "거래 목록(JSON 배열 또는 NDJSON)이 필요합니다."
+            )
+        if len(rows) > self.MAX_ROWS:
+            raise serializers.ValidationError(
+                f"한 번에 최대 {self.MAX_ROWS}건까지 전기할 수 있습니다."
+            )
+        all_or_nothing = request.query_params.get("atomic", "").lower() in (
+            "1",
+            "true",
+        )
+
+        # 필드 객체를 행마다 새로 만들지 않도록 Serializer 하나로 모든 행을 검증합니다.
+        row_serializer = BulkTransactionSerializer()
+        entries, errors = [], {}
+        for index, row in enumerate(rows):
+            try:
+                entries.append((index, row_serializer.run_validation(row)))
+            except serializers.ValidationError as exc:
+                errors[index] = exc.detail
+
+        outcomes = []
+        if not (all_or_nothing and errors):
+            outcomes = ledger.post_batch(
+                [entry for _, entry in entries],
+                user=request.user,
+                all_or_nothing=all_or_nothing,
+            )
+        posted = {}
+        for (index, _), outcome in zip(entries, outcomes):
+            if isinstance(outcome, ledger.LedgerError):
+                errors[index] = self.LEDGER_ERRORS[type(outcome)]
+            else:
+                posted[index] = outcome
+        if all_or_nothing and errors:
+            posted = {}
+
+        results = []
+        for index in range(len(rows)):
+            result = {"index": index}
+            if index in errors:
+                result["errors"] = errors[index]
+            elif index in posted:
+                result["id"] = posted[index].pk
+                result["account"] = posted[index].account_id
+                result["post_transaction_amount"] = str(
+                    posted[index].post_transaction_amount
+                )
+            results.append(result)
+
+        created = len(posted)
+        if not errors:
+            code = status.HTTP_201_CREATED
+        elif created:
+            code = status.HTTP_207_MULTI_STATUS
+        else:
+            code = status.HTTP_400_BAD_REQUEST
+        return Response(
+            {"created": created, "failed": len(errors), "results": results},
+            status=code,
+        )
+
+
+# 🌟 계좌 간 이체: 두 계좌를 ID 순서로 잠그고 출금/입금을 한 트랜잭션으로 전기
+@query_budget(POST=9)
+class TransferCreateView(AuthenticatedAPIView, APIView):
+    """
+    POST /transfers/
+
+    from_account에서 to_account로 transaction_amount를 이체하고
+    생성된 출금/입금 거래를 반환합니다. Idempotency-Key 헤더를 지원합니다.
+    """
+
+    def post(self, request):
+        return idempotency.run(request, functools.partial(self._transfer, request))
+
+    def _transfer(self, request):
+        serializer = TransferSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        try:
+            withdraw, deposit = ledger.transfer(
+                data["from_account"],
+                data["to_account"],
+                data["transaction_amount"],
+                data["transaction_timestamp"],
+                transaction_details=data["transaction_details"],
+                user=request.user,
+            )
+        except ledger.InsufficientBalance:
+            raise serializers.ValidationError({
+                "transaction_amount": "잔액이 부족하여 이체할 수 없습니다."
+            })
+        except ledger.AccountNotFound as exc:
+            field = (
+                "from_account" if exc.args[0] == data["from_account"] else "to_account"
+            )
+            raise serializers.ValidationError({field: "존재하지 않는 계좌입니다."})
+        return Response(
+            {
+                "withdraw": TransactionSerializer(withdraw).data,
+                "deposit": TransactionSerializer(deposit).data,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+# 🌟 거래 내역 스트리밍 내보내기 (서버 측 커서 + StreamingHttpResponse)
+@query_budget(GET=1)
+class TransactionExportView(TransactionListCreateView):
+    """
+    GET /transactions/export/<csv|ndjson>/?start=&end=&account=&q=&gzip=true
+
+    목록 API와 같은 QuerySet과 필터를 페이지네이션 없이 끝까지 스트리밍합니다.
+    """
+
+    http_method_names = ["get", "head", "options"]
+    # 뷰는 동기로 실행하고, ASGI 요청이면 응답 본문만 비동기 이터레이터로
+    # 바꿔 청크마다 스레드에서 읽습니다. (accounts/exports.py)
+    view_is_async = False
+
+    def get(self, request, file_format):
+        if file_format not in exports.CONTENT_TYPES:
+            raise NotFound()
+        queryset = self.filter_queryset(self.get_queryset())
+        # 응답 스트리밍은 미들웨어가 끝난 뒤에 읽으므로 요청 중에 정한 DB
+        # (원장 샤드/읽기 복제본)를 고정합니다.
+        queryset = queryset.order_by("transaction_timestamp", "id")
+        queryset = queryset.using(queryset.db)
+        compress = request.query_params.get("gzip", "").lower() in ("1", "true")
+        return exports.export_response(
+            queryset,
+            file_format,
+            compress=compress,
+            asynchronous=isinstance(request._request, ASGIRequest),
+        )
+
+
+@query_budget(GET=2, PUT=9, PATCH=9, DELETE=7)
 class TransactionRetrieveUpdateDestroyView(
     AuthenticatedAPIView, generics.RetrieveUpdateDestroyAPIView
 ):
@@ -76,4 +352,78 @@ class TransactionRetrieveUpdateDestroyView(
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
 
     def get_queryset(self):
-        return Transaction.objects.filter(account__user=self.request.user)
+        return Transaction.objects.filter(user=self.request.user).select_related(
+            "account"
+        )
+
+    def perform_destroy(self, instance):
+        # 🌟 삭제된 거래 이후의 잔액 체인과 소비 집계를 같은 트랜잭션으로 보정
+        try:
+            with transaction.atomic(using=router.db_for_write(Transaction)):
+                segments = ledger.plan_rechain(instance)
+                instance.delete()
+                ledger.rechain(segments)
+                rollups.remove(instance)
+        except ledger.InsufficientBalance:
+            raise serializers.ValidationError({
+                "transaction_amount": "삭제하면 계좌 잔액이 음수가 됩니다."
+            })
+
+
+# ----------------------------------------------------------------------
+# 3. Analysis Views
+# ----------------------------------------------------------------------
+
+
+# 🌟 기간별 소비 분석: 거래 내역 대신 SpendingRollup 버킷만 읽습니다.
+@query_budget(GET=2)
+class AnalysisView(AuthenticatedAPIView, APIView):
+    """
+    GET /analysis/?granularity=day|week|month&start=YYYY-MM-DD&end=YYYY-MM-DD&account=
+
+    기간 버킷별 입금/출금 합계, 거래 건수, 거래 종류별 내역을 반환합니다.
+    """
+
+    def get(self, request):
+        serializer = AnalysisQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        buckets = rollups.summarize(
+            request.user,
+            params["granularity"],
+            params["start"],
+            params["end"],
+            account_id=params.get("account"),
+        )
+        return Response({
+            "granularity": params["granularity"],
+            "start": params["start"],
+            "end": params["end"],
+            "results": AnalysisBucketSerializer(buckets, many=True).data,
+        })
+
+
+# ----------------------------------------------------------------------
+# 4. Reference Data Views
+# ----------------------------------------------------------------------
+
+
+# 🌟 은행/계좌 종류/거래 타입 참조 데이터 (배포 단위로 불변: ETag + 캐시 허용)
+@query_budget(0)
+class ReferenceDataView(APIView):
+    """GET /banks/ : 선택지 코드와 이름 목록 (인증 불필요, DB 조회 없음)"""
+
+    permission_classes = [permissions.AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        etags = request.headers.get("If-None-Match", "")
+        if {REFERENCE_DATA_ETAG, "*"} & {tag.strip() for tag in etags.split(",")}:
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(
+                REFERENCE_DATA_JSON, content_type="application/json; charset=utf-8"
+            )
+        response["ETag"] = REFERENCE_DATA_ETAG
+        patch_cache_control(response, public=True, max_age=86400)
+        return response
@@ -6,12 +6,23 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+
+운영 실행 예:
+    DJANGO_SETTINGS_MODULE=config.settings.prod \
+        uvicorn config.asgi:application --workers 4 --no-access-log
 """
 
 import os
 
 from django.core.asgi import get_asgi_application
 
+from config import dbmetrics
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+# 🌟 ASGI에서는 조회 API를 async 뷰로 디스패치합니다. (settings.ASYNC_API_VIEWS)
+os.environ.setdefault("ASYNC_API_VIEWS", "True")
 
 application = get_asgi_application()
+
+# 🌟 DB 연결 재사용 지표 수집 (/api/v1/users/db/metrics/)
+dbmetrics.install()
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+DRF APIView의 비동기 핸들러 지원
+
+DRF의 APIView.dispatch는 동기 함수라 async def 핸들러가 반환한 코루틴을
+응답으로 쓸 수 없습니다. AsyncAPIView는 dispatch를 코루틴으로 바꿔 ASGI
+이벤트 루프에서 핸들러를 await합니다. (WSGI에서는 Django가 요청마다
+이벤트 루프를 만들어 실행합니다)
+
+    class LoginView(AsyncAPIView):
+        async def post(self, request): ...
+
+AsyncReadMixin은 동기 generic 뷰에 async 조회 핸들러(aget)를 더합니다.
+settings.ASYNC_API_VIEWS가 True(ASGI 배포, config/asgi.py)면 뷰 전체를
+비동기로 디스패치해 GET은 aget을 이벤트 루프에서 실행하고, 나머지 동기
+핸들러는 sync_to_async로 실행합니다. False(WSGI 배포)면 기존 동기 뷰와 같습니다.
+
+    class AccountListCreateView(AsyncReadMixin, generics.ListCreateAPIView):
+        async def aget(self, request, *args, **kwargs):
+            return await self.alist(request, *args, **kwargs)
+
+DB 연결은 요청마다 따로 열리므로 한 워커에서 동시에 실행되는 async 조회 뷰 수를
+settings.ASYNC_VIEW_CONCURRENCY로 제한합니다. 나머지 요청은 이벤트 루프에서
+차례를 기다립니다. (PostgreSQL max_connections 초과 방지)
+
+비동기 디스패치에서 인증은 인증 클래스의 aauthenticate()를 await합니다.
+(없으면 sync_to_async로 authenticate() 실행) 권한/스로틀 검사는 이벤트 루프에서
+바로 실행하므로 DB를 조회하지 않아야 합니다. 핸들러 안에서 ORM은 async
+메서드(afirst, 비동기 순회 등)나 sync_to_async로 호출해야 합니다.
+"""
+
+import asyncio
+import weakref
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.http import Http404
+from django.utils.functional import classproperty
+from rest_framework import exceptions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+# 이벤트 루프 → 동시 실행 제한 세마포어 (asyncio 세마포어는 루프마다 만들어야 합니다)
+_view_slots = weakref.WeakKeyDictionary()
+
+
+def _get_view_slots():
+    loop = asyncio.get_running_loop()
+    slots = _view_slots.get(loop)
+    if slots is None:
+        slots = _view_slots[loop] = asyncio.Semaphore(settings.ASYNC_VIEW_CONCURRENCY)
+    return slots
+
+
+class AsyncDispatchMixin:
+    """APIView.dispatch/initial의 비동기 버전"""
+
+    async def adispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await self.ainitial(request, *args, **kwargs)
+            handler = self.get_async_handler(request.method.lower())
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    def get_async_handler(self, method):
+        """a<method>(예: aget)가 있으면 그것을, 없으면 <method> 핸들러를 반환합니다."""
+        if method not in self.http_method_names:
+            return self.http_method_not_allowed
+        return getattr(self, f"a{method}", None) or getattr(
+            self, method, self.http_method_not_allowed
+        )
+
+    async def ainitial(self, request, *args, **kwargs):
+        # APIView.initial()과 같은 순서: 협상/버전 → 인증 → 권한 → 스로틀
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+        neg = self.perform_content_negotiation(request)
+        request.accepted_renderer, request.accepted_media_type = neg
+        version, scheme = self.determine_version(request, *args, **kwargs)
+        request.version, request.versioning_scheme = version, scheme
+
+        await self.aperform_authentication(request)
+        self.check_permissions(request)
+        self.check_throttles(request)
+
+    async def aperform_authentication(self, request):
+        """Request._authenticate()의 비동기 버전 (request.user/auth를 채웁니다)"""
+        for authenticator in request.authenticators:
+            authenticate = getattr(authenticator, "aauthenticate", None)
+            if authenticate is None:
+                authenticate = sync_to_async(authenticator.authenticate)
+            try:
+                user_auth_tuple = await authenticate(request)
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                return
+        request._not_authenticated()
+
+
+class AsyncAPIView(AsyncDispatchMixin, APIView):
+    """async def 핸들러를 await하는 APIView (동기 핸들러는 sync_to_async로 실행)"""
+
+    # 동기 핸들러(OPTIONS 등)가 섞여 있어도 뷰는 항상 비동기로 디스패치합니다.
+    view_is_async = True
+
+    async def dispatch(self, request, *args, **kwargs):
+        return await self.adispatch(request, *args, **kwargs)
+
+
+class AsyncReadMixin(AsyncDispatchMixin):
+    """generic 뷰에 async 조회 경로를 더합니다. (settings.ASYNC_API_VIEWS)"""
+
+    @classproperty
+    def view_is_async(cls):
+        # as_view() 시점(URLconf 로드)에 뷰 함수를 코루틴으로 표시할지 결정합니다.
+        return settings.ASYNC_API_VIEWS
+
+    def dispatch(self, request, *args, **kwargs):
+        # 코루틴으로 표시된 뷰는 Django가 이벤트 루프에서 호출합니다.
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return super().dispatch(request, *args, **kwargs)
+        return self.adispatch_bounded(request, *args, **kwargs)
+
+    async def adispatch_bounded(self, request, *args, **kwargs):
+        async with _get_view_slots():
+            return await self.adispatch(request, *args, **kwargs)
+
+    async def aget_object(self):
+        """get_object()의 비동기 버전"""
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        obj = await queryset.filter(**{
+            self.lookup_field: self.kwargs[lookup_url_kwarg]
+        }).afirst()
+        if obj is None:
+            raise Http404(
+                f"No {queryset.model._meta.object_name} matches the given query."
+            )
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    async def apaginate_queryset(self, queryset):
+        if self.paginator is None:
+            return None
+        return await self.paginator.apaginate_queryset(
+            queryset, self.request, view=self
+        )
+
+    async def alist(self, request, *args, **kwargs):
+        """ListModelMixin.list()의 비동기 버전"""
+        queryset = self.filter_queryset(self.get_queryset())
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer([obj async for obj in queryset], many=True)
+        return Response(serializer.data)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        """RetrieveModelMixin.retrieve()의 비동기 버전"""
+        instance = await self.aget_object()
+        return Response(self.get_serializer(instance).data)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+DB 연결 재사용 지표 (요청을 받은 워커 프로세스 기준)
+
+install()은 요청 수(request_started)와 Django가 DB 연결을 연 횟수
+(connection_created)를 세기 시작합니다. config/wsgi.py, config/asgi.py가
+호출합니다.
+
+- 연결 풀(settings.DATABASES의 OPTIONS["pool"], config/settings/prod.py)을 쓰면
+  psycopg_pool 통계로 재사용률 = 1 - 새로 연 물리 연결 수 / 풀에서 빌린 횟수를
+  계산하고, 풀 크기, 대기 중인 요청, 대기 시간을 함께 반환합니다.
+- 풀이 없으면 재사용률 = 1 - 새로 연 연결 수 / 요청 수입니다. (DB를 쓰지 않은
+  요청도 분모에 들어갑니다)
+"""
+
+import threading
+
+from django.core.signals import request_started
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.signals import connection_created
+
+_lock = threading.Lock()
+_counts = {"requests": 0, "connections": 0}
+
+
+def _count(name):
+    def receiver(**kwargs):
+        with _lock:
+            _counts[name] += 1
+
+    return receiver
+
+
+_count_request = _count("requests")
+_count_connection = _count("connections")
+
+
+def install():
+    request_started.connect(_count_request, dispatch_uid="dbmetrics_requests")
+    connection_created.connect(_count_connection, dispatch_uid="dbmetrics_connections")
+
+
+def reset():
+    with _lock:
+        _counts.update(requests=0, connections=0)
+
+
+def _reuse_ratio(opened, uses):
+    return round(max(1 - opened / uses, 0.0), 4) if uses else None
+
+
+def metrics():
+    with _lock:
+        snapshot = dict(_counts)
+    pools = {}
+    for connection in connections.all(initialized_only=True):
+        pool = getattr(connection, "pool", None)
+        if pool is None:
+            continue
+        stats = pool.get_stats()
+        pools[connection.alias] = {
+            "checkouts": stats.get("requests_num", 0),
+            "opened": stats.get("connections_num", 0),
+            "reuse_ratio": _reuse_ratio(
+                stats.get("connections_num", 0), stats.get("requests_num", 0)
+            ),
+            "pool_size": stats.get("pool_size"),
+            "pool_available": stats.get("pool_available"),
+            "requests_waiting": stats.get("requests_waiting"),
+            "wait_ms": stats.get("requests_wait_ms", 0),
+            "errors": stats.get("requests_errors", 0),
+        }
+    default = pools.get(DEFAULT_DB_ALIAS)
+    return {
+        "requests": snapshot["requests"],
+        # 풀을 쓰면 풀에서 빌린 횟수, 아니면 새로 연 연결 수
+        "connections": snapshot["connections"],
+        "reuse_ratio": (
+            default["reuse_ratio"]
+            if default
+            else _reuse_ratio(snapshot["connections"], snapshot["requests"])
+        ),
+        "pools": pools,
+    }
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+요청 단위 성능 계측 (Server-Timing, 구조화 로그, 샘플링 프로파일)
+
+    MIDDLEWARE = ["config.instrumentation.InstrumentationMiddleware", ...]
+    INSTRUMENTATION = {"ENABLED": True, "PATH_PREFIX": "/api/v1/", ...}
+
+PATH_PREFIX 아래 요청마다 다음 값을 기록합니다.
+
+- db: 실행한 SQL 쿼리 수와 시간 (모든 DB 별칭 합계)
+- serializer: DRF 직렬화(is_valid(), .data)에 걸린 시간. 목록 QuerySet은
+  .data에서 평가되므로 그 쿼리 시간도 포함됩니다.
+- view: 뷰 호출부터 응답 렌더링까지 (안쪽 미들웨어 포함)
+- total: 이 미들웨어가 요청을 받아 응답을 돌려줄 때까지 (스트리밍 응답의 본문
+  전송 시간은 빠집니다)
+
+값은 Server-Timing 응답 헤더(브라우저 개발자 도구의 Timing 탭)와
+"config.instrumentation" 로거의 JSON 한 줄로 남깁니다.
+
+프로파일: PROFILE_SAMPLE_RATE=N이면 N건 중 1건, PROFILE_HEADER(기본 X-Profile)
+헤더 값이 서버 비밀 값 PROFILE_SECRET과 같으면 그 요청을 cProfile로 기록합니다.
+DRF 인증은 뷰 안에서 일어나 프로파일을 켜는 시점에는 사용자를 알 수 없으므로,
+아무 클라이언트나 프로파일러를 켜지 못하도록 비밀 값으로 거르고 저장은 인증된
+관리자(is_staff) 요청만 합니다. 샘플 요청은 PROFILE_SLOW_MS 이상 걸린 경우만
+PROFILE_DIR에 .prof 파일로 저장하고, 가장 느린 PROFILE_KEEP개만 남깁니다.
+(python -m pstats, snakeviz로 열기)
+Python 3.12부터 cProfile은 프로세스의 모든 스레드를 기록하고 동시에 하나만
+켤 수 있으므로 한 번에 한 요청만 프로파일하며, 그동안 같은 프로세스에서
+처리된 다른 요청의 호출도 함께 기록됩니다.
+"""
+
+import cProfile
+import functools
+import hmac
+import itertools
+import json
+import logging
+import re
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils import timezone
+from rest_framework import serializers
+
+from config.middleware import run_on_loop
+from config.querybudget import (
+    count_queries,
+    count_request_queries,
+    enable_request_counting,
+)
+
+logger = logging.getLogger(__name__)
+
+# 현재 요청의 계측 값 (sync_to_async 스레드로 컨텍스트가 복사됩니다)
+_timings = ContextVar("request_timings", default=None)
+
+# cProfile은 프로세스에 하나만 켤 수 있습니다.
+_profile_lock = threading.Lock()
+_sample = itertools.count()
+
+
+class RequestTimings:
+    """요청 하나의 계측 값 (초 단위)"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = None  # QueryCounter
+        self.serializer = 0.0
+        self.serializing = False
+        self.view_started = None
+        self.view = None
+        self.total = None
+
+    def stop(self):
+        now = time.perf_counter()
+        self.total = now - self.started
+        if self.view_started is not None:
+            self.view = now - self.view_started
+
+    def server_timing(self):
+        queries = self.queries
+        metrics = [
+            f'db;dur={queries.duration * 1000:.1f};desc="{queries.count} queries"',
+            f"serializer;dur={self.serializer * 1000:.1f}",
+        ]
+        if self.view is not None:
+            metrics.append(f"view;dur={self.view * 1000:.1f}")
+        metrics.append(f"total;dur={self.total * 1000:.1f}")
+        return ", ".join(metrics)
+
+    def as_dict(self):
+        return {
+            "db_queries": self.queries.count,
+            "db_ms": round(self.queries.duration * 1000, 1),
+            "serializer_ms": round(self.serializer * 1000, 1),
+            "view_ms": None if self.view is None else round(self.view * 1000, 1),
+            "total_ms": round(self.total * 1000, 1),
+        }
+
+
+def _timed(method):
+    @functools.wraps(method)
+    def inner(*args, **kwargs):
+        timings = _timings.get()
+        # 중첩 직렬화(ListSerializer → Serializer)는 바깥 호출에서 한 번만 잽니다.
+        if timings is None or timings.serializing:
+            return method(*args, **kwargs)
+        timings.serializing = True
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            timings.serializer += time.perf_counter() - started
+            timings.serializing = False
+
+    inner.instrumented = True
+    return inner
+
+
+def install():
+    """DRF 직렬화(is_valid(), .data)에 걸린 시간을 요청별로 기록하도록 감쌉니다."""
+    base = serializers.BaseSerializer
+    if getattr(base.is_valid, "instrumented", False):
+        return
+    base.is_valid = _timed(base.is_valid)
+    # ListSerializer는 is_valid()를 super() 없이 다시 구현합니다.
+    serializers.ListSerializer.is_valid = _timed(serializers.ListSerializer.is_valid)
+    # Serializer/ListSerializer의 .data는 super().data로 여기를 거칩니다.
+    base.data = property(_timed(base.data.fget))
+
+
+def _profile_name(request, timings):
+    path = re.sub(r"[^A-Za-z0-9]+", "-", request.path_info).strip("-") or "root"
+    # 파일 이름을 정렬하면 느린 순서가 되도록 소요 시간을 앞에 둡니다.
+    return (
+        f"{int(timings.total * 1000):08d}ms-{request.method}-{path[:80]}-"
+        f"{timezone.now():%Y%m%dT%H%M%S%f}.prof"
+    )
+
+
+def save_profile(profiler, request, timings, options):
+    """프로파일을 저장하고 PROFILE_KEEP개보다 많으면 가장 빠른 것부터 지웁니다."""
+    directory = Path(options["PROFILE_DIR"])
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / _profile_name(request, timings)
+    profiler.dump_stats(path)
+    for stale in sorted(directory.glob("*.prof"), reverse=True)[
+        options["PROFILE_KEEP"] :
+    ]:
+        stale.unlink(missing_ok=True)
+    return path
+
+
+class InstrumentationMiddleware:
+    """요청별 DB/직렬화/뷰 시간을 Server-Timing 헤더와 로그로 남깁니다."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        options = settings.INSTRUMENTATION
+        if not options["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.options = options
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+            # process_view는 DB를 쓰지 않으므로 스레드 전환 없이 실행합니다.
+            self.process_view = run_on_loop(self.process_view)
+            enable_request_counting()
+        self.profile_header = "HTTP_" + options["PROFILE_HEADER"].upper().replace(
+            "-", "_"
+        )
+        install()
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not request.path_info.startswith(self.options["PATH_PREFIX"]):
+            return self.get_response(request)
+
+        timings = RequestTimings()
+        token = _timings.set(timings)
+        profiler = self._start_profile(request)
+        try:
+            with count_queries() as timings.queries:
+                response = self.get_response(request)
+        finally:
+            _timings.reset(token)
+            profiler = self._stop_profile(profiler)
+        timings.stop()
+        path = self._save_profile(profiler, request, timings)
+        return self._finish(request, response, timings, path)
+
+    async def __acall__(self, request):
+        if not request.path_info.startswith(self.options["PATH_PREFIX"]):
+            return await self.get_response(request)
+
+        timings = RequestTimings()
+        token = _timings.set(timings)
+        profiler = self._start_profile(request)
+        try:
+            with count_request_queries() as timings.queries:
+                response = await self.get_response(request)
+        finally:
+            _timings.reset(token)
+            profiler = self._stop_profile(profiler)
+        timings.stop()
+        path = None
+        if profiler is not None:
+            path = await sync_to_async(self._save_profile, thread_sensitive=False)(
+                profiler, request, timings
+            )
+        return self._finish(request, response, timings, path)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timings = _timings.get()
+        if timings is not None:
+            timings.view_started = time.perf_counter()
+
+    def _profile_requested(self, request):
+        secret = self.options["PROFILE_SECRET"]
+        value = request.META.get(self.profile_header)
+        return bool(secret and value) and hmac.compare_digest(
+            value.encode(), secret.encode()
+        )
+
+    def _start_profile(self, request):
+        rate = self.options["PROFILE_SAMPLE_RATE"]
+        requested = self._profile_requested(request)
+        if not requested and not (rate and next(_sample) % rate == 0):
+            return None
+        if not _profile_lock.acquire(blocking=False):
+            return None  # 다른 요청을 프로파일하는 중
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # 다른 프로파일러(디버거, 커버리지 등)가 이미 켜져 있습니다.
+            _profile_lock.release()
+            return None
+        profiler.requested = requested
+        return profiler
+
+    def _stop_profile(self, profiler):
+        if profiler is not None:
+            profiler.disable()
+            _profile_lock.release()
+        return profiler
+
+    def _save_profile(self, profiler, request, timings):
+        if profiler is None:
+            return None
+        if profiler.requested:
+            # 헤더 요청은 인증 후 관리자인 경우만 저장합니다.
+            user = getattr(request, "user", None)
+            if user is None or not user.is_staff:
+                return None
+        elif timings.total * 1000 < self.options["PROFILE_SLOW_MS"]:
+            return None
+        return save_profile(profiler, request, timings, self.options)
+
+    def _finish(self, request, response, timings, profile_path):
+        if self.options["SERVER_TIMING"]:
+            response["Server-Timing"] = timings.server_timing()
+        if self.options["LOG"]:
+            record = {
+                "method": request.method,
+                "path": request.path_info,
+                "view": getattr(request.resolver_match, "view_name", None),
+                "status": response.status_code,
+                **timings.as_dict(),
+                "profile": str(profile_path) if profile_path else None,
+            }
+            logger.info(
+                json.dumps(record, ensure_ascii=False), extra={"timings": record}
+            )
+        return response
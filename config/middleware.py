@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+API 경로에서 건너뛰는 웹 전용 미들웨어
+
+/api/v1/ 엔드포인트는 JWT로만 인증하므로 세션, CSRF, 세션 인증, 메시지,
+클릭재킹 미들웨어가 하는 일이 필요 없습니다. 이 모듈의 미들웨어는 Django
+기본 미들웨어를 상속하고, settings.API_MIDDLEWARE["LEAN"]이 True면
+PATH_PREFIX 아래 요청에서 다음 미들웨어를 바로 호출합니다. (/admin/ 등
+나머지 경로는 기존과 같습니다)
+
+    MIDDLEWARE = [
+        "config.middleware.SecurityMiddleware",
+        "config.middleware.SessionMiddleware",
+        ...
+    ]
+
+기본 미들웨어의 하위 클래스이므로 admin의 미들웨어 시스템 검사도 그대로
+통과합니다.
+
+ASGI(비동기 체인)에서 Django는 동기 process_* 훅을 매번 sync_to_async로
+스레드에 넘깁니다. DB나 블로킹 I/O를 쓰지 않는 미들웨어는 LoopSafeMixin으로
+이벤트 루프에서 바로 실행해 요청당 스레드 전환을 줄입니다.
+"""
+
+from django.conf import settings
+from django.contrib.auth import middleware as auth
+from django.contrib.messages import middleware as messages
+from django.contrib.sessions import middleware as sessions
+from django.middleware import clickjacking, common, csrf, security
+
+
+def run_on_loop(method):
+    """동기 훅을 이벤트 루프에서 바로 실행하는 코루틴 함수로 감쌉니다."""
+
+    async def inner(*args, **kwargs):
+        return method(*args, **kwargs)
+
+    return inner
+
+
+class LoopSafeMixin:
+    """비동기 체인에서 process_* 훅을 sync_to_async 없이 실행합니다."""
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        # Django는 코루틴 함수인 process_view를 스레드로 감싸지 않습니다.
+        if self.async_mode and hasattr(self, "process_view"):
+            self.process_view = run_on_loop(self.process_view)
+
+    async def __acall__(self, request):
+        response = None
+        if hasattr(self, "process_request"):
+            response = self.process_request(request)
+        response = response or await self.get_response(request)
+        if hasattr(self, "process_response"):
+            response = self.process_response(request, response)
+        return response
+
+
+class WebOnlyMixin:
+    """API 경로 요청에서는 process_request/process_response를 건너뜁니다."""
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        options = settings.API_MIDDLEWARE
+        self.api_prefix = options["PATH_PREFIX"] if options["LEAN"] else None
+
+    def is_api_request(self, request):
+        return self.api_prefix is not None and request.path_info.startswith(
+            self.api_prefix
+        )
+
+    def __call__(self, request):
+        # 비동기 체인에서는 get_response가 코루틴을 반환하므로 그대로 넘깁니다.
+        if self.is_api_request(request):
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class SecurityMiddleware(LoopSafeMixin, security.SecurityMiddleware):
+    pass
+
+
+class CommonMiddleware(LoopSafeMixin, common.CommonMiddleware):
+    pass
+
+
+class SessionMiddleware(WebOnlyMixin, sessions.SessionMiddleware):
+    pass
+
+
+class CsrfViewMiddleware(LoopSafeMixin, WebOnlyMixin, csrf.CsrfViewMiddleware):
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if self.is_api_request(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class AuthenticationMiddleware(WebOnlyMixin, auth.AuthenticationMiddleware):
+    pass
+
+
+class MessageMiddleware(WebOnlyMixin, messages.MessageMiddleware):
+    pass
+
+
+class XFrameOptionsMiddleware(
+    LoopSafeMixin, WebOnlyMixin, clickjacking.XFrameOptionsMiddleware
+):
+    pass
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+SQL 쿼리 예산(query budget)
+
+뷰마다 허용 쿼리 수를 선언하고, 요청 처리 중 실행된 쿼리 수가 예산을 넘으면
+로그를 남기거나(운영) 예외를 발생시킵니다(개발/테스트).
+
+    @query_budget(GET=2, POST=3)
+    class AccountListCreateView(...): ...
+
+    with max_queries(2):
+        client.get(url)
+"""
+
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.signals import request_started
+from django.db import connections
+
+from config.middleware import run_on_loop
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """선언된 쿼리 예산을 초과한 경우"""
+
+
+# uncounted() 블록 안인지 여부
+_uncounted = ContextVar("query_budget_uncounted", default=False)
+
+
+@contextmanager
+def uncounted():
+    """블록 안의 쿼리를 예산에서 뺍니다. (캐시 미스 때만 실행되는 라우팅 조회용)"""
+    token = _uncounted.set(True)
+    try:
+        yield
+    finally:
+        _uncounted.reset(token)
+
+
+class QueryCounter:
+    """connection.execute_wrapper로 설치되어 실행된 쿼리 수와 시간을 기록합니다."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = []
+
+    def __call__(self, execute, sql, params, many, context):
+        if _uncounted.get():
+            return execute(sql, params, many, context)
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record(sql, time.perf_counter() - started)
+
+    def record(self, sql, duration):
+        self.count += 1
+        self.duration += duration
+        self.statements.append(sql)
+
+
+@contextmanager
+def count_queries():
+    """블록 안에서 모든 DB 연결로 실행된 쿼리를 세는 QueryCounter를 돌려줍니다."""
+    counter = QueryCounter()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        yield counter
+
+
+# 비동기 요청의 QueryCounter들 (sync_to_async 스레드로 컨텍스트가 복사됩니다)
+_request_counters = ContextVar("query_budget_counters", default=())
+
+
+def _count_for_request(execute, sql, params, many, context):
+    counters = _request_counters.get()
+    if not counters or _uncounted.get():
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - started
+        for counter in counters:
+            counter.record(sql, duration)
+
+
+def _install_request_counter(**kwargs):
+    # DB 연결은 스레드마다 따로 만들어집니다. request_started는 요청의 ORM
+    # 호출과 같은 스레드에서 실행되므로 여기서 그 스레드의 연결에 설치합니다.
+    for connection in connections.all():
+        if _count_for_request not in connection.execute_wrappers:
+            connection.execute_wrappers.append(_count_for_request)
+
+
+def enable_request_counting():
+    """비동기 체인에서 count_request_queries()를 쓰기 전에 한 번 호출합니다."""
+    request_started.connect(
+        _install_request_counter, dispatch_uid="query_budget_counter"
+    )
+
+
+@contextmanager
+def count_request_queries():
+    """
+    비동기 요청 처리 중 실행된 쿼리를 세는 QueryCounter를 돌려줍니다.
+
+    쿼리는 이벤트 루프가 아닌 스레드의 DB 연결로 실행되므로 count_queries()
+    대신 컨텍스트 변수로 요청의 카운터를 넘깁니다. (여러 카운터를 겹쳐 쓸 수 있음)
+    """
+    counter = QueryCounter()
+    token = _request_counters.set((*_request_counters.get(), counter))
+    try:
+        yield counter
+    finally:
+        _request_counters.reset(token)
+
+
+@contextmanager
+def max_queries(budget):
+    """테스트 헬퍼: 블록 안의 쿼리 수가 budget을 넘으면 QueryBudgetExceeded"""
+    with count_queries() as counter:
+        yield counter
+    if counter.count > budget:
+        raise QueryBudgetExceeded(_describe(counter, budget))
+
+
+def query_budget(default=None, **per_method):
+    """
+    뷰(클래스 또는 함수)에 HTTP 메서드별 쿼리 예산을 선언하는 데코레이터
+
+    default는 메서드별 값이 없을 때 사용됩니다.
+    """
+
+    def decorator(view):
+        view.query_budget = {"*": default, **per_method}
+        return view
+
+    return decorator
+
+
+def get_view_budget(view_func, method):
+    """URL 해석 결과(view_func)에서 선언된 예산을 찾습니다. 없으면 None"""
+    budget = getattr(view_func, "query_budget", None)
+    if budget is None:
+        view_class = getattr(view_func, "view_class", None) or getattr(
+            view_func, "cls", None
+        )
+        budget = getattr(view_class, "query_budget", None)
+    if budget is None:
+        return None
+    if isinstance(budget, int):
+        return budget
+    return budget.get(method, budget.get("*"))
+
+
+def _describe(counter, budget):
+    lines = [f"{counter.count} queries executed, budget is {budget}:"]
+    lines.extend(f"  {index}. {sql}" for index, sql in enumerate(counter.statements, 1))
+    return "\n".join(lines)
+
+
+class QueryBudgetMiddleware:
+    """
+    선언된 예산(없으면 QUERY_BUDGET["DEFAULT"])을 넘는 요청을 감지합니다.
+
+    QUERY_BUDGET = {"ENABLED": True, "RAISE": False, "DEFAULT": None,
+                    "PATH_PREFIX": "/api/v1/"}
+    """
+
+    # ASGI에서 비동기 뷰가 동기 미들웨어 때문에 스레드로 감싸이지 않도록 양쪽을 지원
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        config = getattr(settings, "QUERY_BUDGET", {})
+        if not config.get("ENABLED"):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+            # process_view는 DB를 쓰지 않으므로 스레드 전환 없이 실행합니다.
+            self.process_view = run_on_loop(self.process_view)
+            enable_request_counting()
+        self.raise_on_exceed = config.get("RAISE", False)
+        self.default = config.get("DEFAULT")
+        self.path_prefix = config.get("PATH_PREFIX", "/api/v1/")
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not request.path_info.startswith(self.path_prefix):
+            return self.get_response(request)
+
+        with count_queries() as counter:
+            response = self.get_response(request)
+        self._check(request, counter)
+        return response
+
+    async def __acall__(self, request):
+        if not request.path_info.startswith(self.path_prefix):
+            return await self.get_response(request)
+
+        with count_request_queries() as counter:
+            response = await self.get_response(request)
+        self._check(request, counter)
+        return response
+
+    def _check(self, request, counter):
+        budget = getattr(request, "_query_budget", self.default)
+        if budget is not None and counter.count > budget:
+            message = f"{request.method} {request.path}: {_describe(counter, budget)}"
+            if self.raise_on_exceed:
+                raise QueryBudgetExceeded(message)
+            logger.warning("Query budget exceeded. %s", message)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        budget = get_view_budget(view_func, request.method)
+        if budget is not None:
+            request._query_budget = budget
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+읽기 복제본 라우팅 (read-your-writes)
+
+accounts/users 뷰의 안전한 메서드(GET/HEAD/OPTIONS) 요청에서 실행되는 조회를
+읽기 복제본으로 보내고, 쓰기는 항상 기본(primary) DB로 보냅니다.
+
+    DATABASE_ROUTERS = ["config.replicas.ReplicaRouter"]
+    MIDDLEWARE = [..., "config.replicas.ReplicaRoutingMiddleware"]
+    READ_REPLICAS = {"ALIASES": ["replica1"], "APPS": ["accounts", "users"],
+                     "STICKY_SECONDS": 5}
+
+- 요청 하나의 조회는 무작위로 고른 복제본 하나에서 실행됩니다.
+- 인증(JWT 사용자 조회)은 request.user가 정해지기 전이라 기본 DB에서 읽습니다.
+  익명 요청, 기본 DB의 트랜잭션(atomic) 안의 조회도 기본 DB를 씁니다.
+- 요청 중에 쓰기가 있었으면 그 사용자를 STICKY_SECONDS초 동안 기본 DB에
+  고정합니다. 방금 등록한 거래가 복제 지연 때문에 목록에서 빠지지 않습니다.
+  고정 정보는 기본 캐시(settings.CACHES["default"])에 두므로 여러 워커/서버가
+  함께 쓰려면 Redis(REDIS_URL)가 필요합니다.
+- 요청 밖(관리 명령, 배치 작업)의 조회와 응답 스트리밍 중의 조회는 기본 DB를
+  씁니다. (거래 내보내기는 요청 중에 고른 DB를 QuerySet에 고정합니다.)
+"""
+
+import random
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from config.middleware import run_on_loop
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# 현재 요청의 라우팅 상태 (sync_to_async 스레드로 컨텍스트가 복사됩니다)
+_route = ContextVar("replica_route", default=None)
+
+
+def _pin_key(user_id):
+    return f"replicas:pinned:{user_id}"
+
+
+def pin_to_primary(user_id):
+    """user_id의 조회를 STICKY_SECONDS초 동안 기본 DB로 보냅니다."""
+    seconds = settings.READ_REPLICAS["STICKY_SECONDS"]
+    if seconds > 0:
+        cache.set(_pin_key(user_id), True, seconds)
+
+
+def is_pinned(user_id):
+    return cache.get(_pin_key(user_id)) is not None
+
+
+class RouteState:
+    """요청 하나의 복제본 선택과 쓰기 여부"""
+
+    def __init__(self, request):
+        self.request = request
+        self.eligible = False  # accounts/users 뷰의 안전한 메서드 요청
+        self.alias = None  # 결정 전이면 None, 기본 DB면 DEFAULT_DB_ALIAS
+        self.wrote = False
+
+    def read_alias(self):
+        if not self.eligible:
+            return None
+        if self.alias is not None:
+            return self.alias
+        user = getattr(self.request, "user", None)
+        if user is None or not user.is_authenticated:
+            # 인증 전(사용자 조회)에는 결정을 미룹니다.
+            return None
+        if is_pinned(user.pk):
+            self.alias = DEFAULT_DB_ALIAS
+        else:
+            self.alias = random.choice(settings.READ_REPLICAS["ALIASES"])
+        return self.alias
+
+
+class ReplicaRouter:
+    """요청 상태에 따라 조회는 복제본으로, 쓰기는 기본 DB로 보냅니다."""
+
+    def db_for_read(self, model, **hints):
+        state = _route.get()
+        if state is None:
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            # select_for_update 등 트랜잭션 안의 조회는 쓰기와 같은 DB에서 읽습니다.
+            return None
+        return state.read_alias()
+
+    def db_for_write(self, model, **hints):
+        state = _route.get()
+        if state is not None:
+            state.wrote = True
+        # 복제본에서 읽은 인스턴스(hints["instance"])도 기본 DB에 저장합니다.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 기본 DB와 같은 데이터이므로 서로 다른 별칭의 객체도 연결합니다.
+        databases = {DEFAULT_DB_ALIAS, *settings.READ_REPLICAS["ALIASES"]}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 복제본은 기본 DB의 스키마를 복제로 받습니다.
+        if db in settings.READ_REPLICAS["ALIASES"]:
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """요청마다 라우팅 상태를 만들고, 쓰기가 있었던 사용자를 기본 DB에 고정합니다."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.READ_REPLICAS["ALIASES"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+            # process_view는 DB를 쓰지 않으므로 스레드 전환 없이 실행합니다.
+            self.process_view = run_on_loop(self.process_view)
+        self.apps = set(settings.READ_REPLICAS["APPS"])
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        state = RouteState(request)
+        token = _route.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _route.reset(token)
+        self._pin_writer(state)
+        return response
+
+    async def __acall__(self, request):
+        state = RouteState(request)
+        token = _route.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _route.reset(token)
+        self._pin_writer(state)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        state = _route.get()
+        if state is not None and request.method in SAFE_METHODS:
+            state.eligible = view_func.__module__.partition(".")[0] in self.apps
+
+    def _pin_writer(self, state):
+        # DRF는 인증한 사용자를 Django 요청(request.user)에도 넣습니다.
+        user = getattr(state.request, "user", None)
+        if state.wrote and user is not None and user.is_authenticated:
+            pin_to_primary(user.pk)
@@ -46,16 +46,34 @@ INSTALLED_APPS = [
     "rest_framework_simplejwt.token_blacklist",
 ]
 
+# 세션/CSRF/인증/메시지/클릭재킹은 API 경로에서 건너뛰는 하위 클래스
+# (config/middleware.py, API_MIDDLEWARE 참고)
 MIDDLEWARE = [
-    "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
-    "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "config.instrumentation.InstrumentationMiddleware",
+    "config.middleware.SecurityMiddleware",
+    "config.middleware.SessionMiddleware",
+    "config.middleware.CommonMiddleware",
+    "config.middleware.CsrfViewMiddleware",
+    "config.middleware.AuthenticationMiddleware",
+    "config.middleware.MessageMiddleware",
+    "config.middleware.XFrameOptionsMiddleware",
+    "config.querybudget.QueryBudgetMiddleware",
+    "config.replicas.ReplicaRoutingMiddleware",
+    "accounts.sharding.ShardRoutingMiddleware",
 ]
 
+# LEAN=True면 PATH_PREFIX 아래 요청(JWT 전용 API)은 위의 웹 전용 미들웨어를 건너뜁니다.
+API_MIDDLEWARE = {
+    "LEAN": os.environ.get("API_LEAN_MIDDLEWARE", "True") == "True",
+    "PATH_PREFIX": "/api/v1/",
+}
+
+# 조회 API(계좌 목록/상세, 거래 목록)를 async 뷰로 디스패치 (config/asyncviews.py)
+# config/asgi.py가 기본값을 True로 설정하고, WSGI 배포는 기존 동기 뷰를 씁니다.
+ASYNC_API_VIEWS = os.environ.get("ASYNC_API_VIEWS", "False") == "True"
+# 워커 프로세스당 동시에 실행하는 async 조회 뷰 수 (요청마다 DB 연결을 하나 사용)
+ASYNC_VIEW_CONCURRENCY = int(os.environ.get("ASYNC_VIEW_CONCURRENCY", "16"))
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -90,6 +108,51 @@ DATABASES = {
     }
 }
 
+# 🌟 읽기 복제본 (config/replicas.py)
+# DB_REPLICA_HOSTS=host1,host2면 replica1, replica2 별칭을 만들고 accounts/users 뷰의
+# 조회(GET)를 복제본으로 보냅니다. 쓰기가 있었던 사용자는 STICKY_SECONDS초 동안
+# 기본 DB에서 읽습니다. (로컬에서는 DB_REPLICA_HOSTS=db로 같은 DB를 두 별칭으로 사용)
+for index, host in enumerate(
+    filter(None, os.environ.get("DB_REPLICA_HOSTS", "").split(",")), 1
+):
+    DATABASES[f"replica{index}"] = {
+        **DATABASES["default"],
+        "HOST": host.strip(),
+        "TEST": {"MIRROR": "default"},
+    }
+
+# 🌟 원장 샤드 (accounts/sharding.py)
+# DB_SHARD_HOSTS=host1,host2면 shard1, shard2 별칭을 만들고 사용자별 원장
+# (계좌/거래 등)을 나누어 저장합니다. "host/dbname"으로 DB 이름도 지정할 수 있습니다.
+# 샤드마다 python manage.py migrate --database shard1 을 실행해야 합니다.
+for index, host in enumerate(
+    filter(None, os.environ.get("DB_SHARD_HOSTS", "").split(",")), 1
+):
+    host, _, name = host.strip().partition("/")
+    DATABASES[f"shard{index}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "NAME": name or DATABASES["default"]["NAME"],
+    }
+
+LEDGER_SHARDS = {
+    "ALIASES": [
+        "default",
+        *[alias for alias in DATABASES if alias.startswith("shard")],
+    ],
+    "MAP_TTL": int(os.environ.get("DB_SHARD_MAP_TTL", "5")),
+}
+
+DATABASE_ROUTERS = [
+    "accounts.sharding.LedgerShardRouter",
+    "config.replicas.ReplicaRouter",
+]
+READ_REPLICAS = {
+    "ALIASES": [alias for alias in DATABASES if alias.startswith("replica")],
+    "APPS": ["accounts", "users"],
+    "STICKY_SECONDS": int(os.environ.get("DB_REPLICA_STICKY_SECONDS", "5")),
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -136,14 +199,120 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-    ),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("users.authentication.CachedJWTAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.AllowAny",  # 기본 인증 필요
     ),
 }
 
+# 캐시: REDIS_URL이 있으면 Redis(여러 프로세스가 공유), 없으면 프로세스 로컬 메모리
+CACHES = {
+    "default": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["REDIS_URL"],
+        }
+        if os.environ.get("REDIS_URL")
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "default",
+        }
+    ),
+    # 목록 응답 캐시: Redis는 maxmemory-policy(allkeys-lru)로, 로컬 메모리는
+    # MAX_ENTRIES를 넘으면 가장 오래 읽히지 않은 항목부터 밀어냅니다.
+    "responses": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["REDIS_URL"],
+            "KEY_PREFIX": "responses",
+        }
+        if os.environ.get("REDIS_URL")
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "responses",
+            "OPTIONS": {
+                "MAX_ENTRIES": int(os.environ.get("LIST_CACHE_MAX_ENTRIES", "10000"))
+            },
+        }
+    ),
+}
+
+# 기본 캐시를 모든 워커 프로세스가 함께 쓰는지 (Redis)
+# 로컬 메모리 캐시는 다른 워커의 무효화(버전 값)를 볼 수 없으므로, 공유하지 않으면
+# 인증 사용자 캐시, 토큰 블랙리스트 필터, 목록 응답 캐시를 쓰지 않고 요청마다 DB를
+# 확인합니다.
+SHARED_CACHE = bool(os.environ.get("REDIS_URL"))
+
+# 계좌/거래 목록 응답 캐시 + ETag (accounts/listcache.py, SHARED_CACHE일 때만 사용)
+# CACHE: 응답을 저장할 CACHES 별칭, TTL: 항목 보관 기간(초)
+LIST_CACHE = {
+    "ENABLED": os.environ.get("LIST_CACHE_ENABLED", "True") == "True",
+    "CACHE": "responses",
+    "TTL": int(os.environ.get("LIST_CACHE_TTL", "300")),
+}
+
+# POST 재시도 중복 방지 (Idempotency-Key 헤더, accounts/idempotency.py)
+# TTL: 키 보관 기간(초), CACHE_TTL: 응답 재생용 캐시 보관 기간(초)
+IDEMPOTENCY = {
+    "TTL": int(os.environ.get("IDEMPOTENCY_TTL", str(24 * 60 * 60))),
+    "CACHE_TTL": int(os.environ.get("IDEMPOTENCY_CACHE_TTL", str(10 * 60))),
+}
+
+# JWT 인증 사용자 캐시 (users/authentication.py, SHARED_CACHE일 때만 사용)
+# MAX_SIZE: 워커당 캐시할 사용자 수, TTL: 항목 보관 기간(초)
+AUTH_USER_CACHE = {
+    "MAX_SIZE": int(os.environ.get("AUTH_USER_CACHE_MAX_SIZE", "10000")),
+    "TTL": int(os.environ.get("AUTH_USER_CACHE_TTL", "300")),
+}
+
+# 비밀번호 해싱 프로세스 풀 (users/hashing.py)
+# WORKERS: 워커 프로세스당 해싱 프로세스 수 (0이면 스레드에서 해싱, 개발/테스트용)
+# QUEUE_SIZE: 처리 중인 작업 외에 기다릴 수 있는 작업 수 (넘으면 503)
+# RETRY_AFTER: 503 응답의 Retry-After(초)
+PASSWORD_HASHING = {
+    "WORKERS": int(os.environ.get("PASSWORD_HASHING_WORKERS", "2")),
+    "QUEUE_SIZE": int(os.environ.get("PASSWORD_HASHING_QUEUE_SIZE", "32")),
+    "RETRY_AFTER": int(os.environ.get("PASSWORD_HASHING_RETRY_AFTER", "1")),
+}
+
+# 뷰별 SQL 쿼리 예산(@query_budget) 검사 (config/querybudget.py)
+# RAISE=True면 예산 초과 시 예외, False면 경고 로그만 남깁니다.
+QUERY_BUDGET = {
+    "ENABLED": os.environ.get("QUERY_BUDGET_ENABLED", "True") == "True",
+    "RAISE": False,
+    "DEFAULT": None,  # 예산을 선언하지 않은 /api/v1/ 뷰의 기본값 (None: 검사 안 함)
+    "PATH_PREFIX": "/api/v1/",
+}
+
+# 요청별 DB/직렬화/뷰 시간 계측 (config/instrumentation.py)
+# Server-Timing 헤더와 JSON 로그를 남기고, 느린 요청의 cProfile을 PROFILE_DIR에
+# 저장합니다.
+INSTRUMENTATION = {
+    "ENABLED": os.environ.get("INSTRUMENTATION_ENABLED", "True") == "True",
+    "PATH_PREFIX": "/api/v1/",
+    "SERVER_TIMING": os.environ.get("SERVER_TIMING_ENABLED", "True") == "True",
+    "LOG": True,
+    "PROFILE_SAMPLE_RATE": int(os.environ.get("PROFILE_SAMPLE_RATE", "0")),  # 0: 끔
+    # 헤더 값이 PROFILE_SECRET과 같을 때만 프로파일을 켭니다. (비어 있으면 헤더 무시)
+    "PROFILE_HEADER": "X-Profile",
+    "PROFILE_SECRET": os.environ.get("PROFILE_SECRET", ""),
+    "PROFILE_SLOW_MS": int(os.environ.get("PROFILE_SLOW_MS", "500")),
+    "PROFILE_DIR": os.environ.get("PROFILE_DIR", str(BASE_DIR / "profiles")),
+    "PROFILE_KEEP": 50,
+}
+
+# transaction_history 월별 범위 파티셔닝 (accounts/partitioning.py)
+# ENABLED=True면 마이그레이션이 테이블을 파티션 테이블로 변환합니다. (점검 시간에 적용)
+# 이후 `manage.py partition_transactions`를 주기 실행해 앞으로 쓸 파티션을 만듭니다.
+TRANSACTION_PARTITIONING = {
+    "ENABLED": os.environ.get("TRANSACTION_PARTITIONING_ENABLED", "False") == "True",
+    "MONTHS_AHEAD": int(os.environ.get("TRANSACTION_PARTITION_MONTHS_AHEAD", "3")),
+}
+
+# 목록 API 키셋 페이지네이션: 기본 페이지 크기와 ?page_size= 최대값
+API_PAGE_SIZE = int(os.environ.get("API_PAGE_SIZE", "20"))
+API_MAX_PAGE_SIZE = int(os.environ.get("API_MAX_PAGE_SIZE", "100"))
+
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=30),
@@ -159,4 +328,19 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_COOKIE_HTTPONLY": True,
     "REFRESH_TOKEN_COOKIE_SECURE": False,
     "REFRESH_TOKEN_COOKIE_SAMESITE": "Lax",
+    # 블랙리스트 확인을 Bloom 필터로 거르는 RefreshToken 사용 (users/tokens.py)
+    "TOKEN_REFRESH_SERIALIZER": "users.serializers.TokenRefreshSerializer",
+}
+
+# Refresh 토큰 블랙리스트 Bloom 필터 (users/revocation.py, SHARED_CACHE일 때만 사용)
+# CAPACITY/ERROR_RATE: 필터 크기 (재구성 때 블랙리스트 수의 2배보다 작으면 키웁니다)
+# REBUILD_INTERVAL: 만료된 jti를 비우는 재구성 주기(초)
+# GAP_TIMEOUT: 늦게 커밋될 수 있는 건너뛴 pk를 다시 조회하는 시간(초)
+TOKEN_REVOCATION = {
+    "CAPACITY": int(os.environ.get("TOKEN_REVOCATION_CAPACITY", "100000")),
+    "ERROR_RATE": float(os.environ.get("TOKEN_REVOCATION_ERROR_RATE", "0.001")),
+    "REBUILD_INTERVAL": int(
+        os.environ.get("TOKEN_REVOCATION_REBUILD_INTERVAL", "3600")
+    ),
+    "GAP_TIMEOUT": int(os.environ.get("TOKEN_REVOCATION_GAP_TIMEOUT", "60")),
 }
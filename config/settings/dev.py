@@ -1,7 +1,26 @@
 # -*- coding: utf-8 -*-
 # base.py에 정의된 모든 설정 상속
 from .base import *
+from .base import DATABASES, QUERY_BUDGET
 
 # 개발 환경 설정 덮어쓰기
 DEBUG = True
 ALLOWED_HOSTS = ["*"]  # 개발 편의를 위해 모든 호스트 허용
+
+# 개발/테스트에서는 쿼리 예산 초과를 즉시 실패로 처리
+QUERY_BUDGET = {**QUERY_BUDGET, "ENABLED": True, "RAISE": True}
+
+# 복제본 라우팅 테스트용 별칭: 기본 DB를 가리키며(테스트에서는 default의 미러)
+# READ_REPLICAS["ALIASES"]에 넣지 않으므로 평소에는 쓰이지 않습니다.
+# (settings 패키지가 dev를 먼저 불러오므로 base의 DATABASES를 바꾸지 않고 새로 만듭니다)
+DATABASES = {
+    **DATABASES,
+    "replica": {**DATABASES["default"], "TEST": {"MIRROR": "default"}},
+}
+
+# 원장 샤드 테스트용 별칭: 테스트에서만 별도 DB이며 LEDGER_SHARDS["ALIASES"]에
+# 넣지 않으므로 평소에는 쓰이지 않습니다. (accounts/tests/test_sharding.py)
+DATABASES["shard1"] = {
+    **DATABASES["default"],
+    "TEST": {"NAME": f"test_{DATABASES['default']['NAME']}_shard1"},
+}
@@ -1,9 +1,37 @@
 # -*- coding: utf-8 -*-
 # config/settings/prod.py (예시)
 
+import os
+
 from .base import *
+from .base import DATABASES
 
 # ... (다른 prod 설정) ...
 
 # 배포 환경에서는 HTTPS를 사용하므로 True로 설정
 REFRESH_TOKEN_COOKIE_SECURE = True
+
+# 🌟 DB 연결 재사용 (연결 지표: config/dbmetrics.py)
+# DB_POOL=True(기본): psycopg 3 연결 풀 (Django 5.1+, pip install ".[prod]")
+#   워커 프로세스마다 MIN_SIZE~MAX_SIZE개의 연결을 열어 두고 요청마다 빌려 씁니다.
+#   ASGI에서도 재사용되며, 워커 수 × MAX_SIZE가 PostgreSQL max_connections보다
+#   작아야 합니다. 풀이 가득 차면 TIMEOUT초까지 기다린 뒤 오류가 납니다.
+# DB_POOL=False: 스레드별 지속 연결 (CONN_MAX_AGE초, 0이면 요청마다 새 연결)
+#   ASGI는 요청마다 스레드가 달라 지속 연결이 재사용되지 않습니다.
+# 읽기 복제본(DB_REPLICA_HOSTS) 별칭도 같은 방식으로 연결합니다.
+for database in DATABASES.values():
+    if os.environ.get("DB_POOL", "True") == "True":
+        database["OPTIONS"] = {
+            "pool": {
+                "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", "2")),
+                "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", "16")),
+                "timeout": float(os.environ.get("DB_POOL_TIMEOUT", "10")),
+                # 유휴 연결 정리(초)와 연결 최대 수명(초, 서버 쪽 메모리 누적 방지)
+                "max_idle": float(os.environ.get("DB_POOL_MAX_IDLE", "600")),
+                "max_lifetime": float(os.environ.get("DB_POOL_MAX_LIFETIME", "3600")),
+            },
+        }
+    else:
+        database["CONN_MAX_AGE"] = int(os.environ.get("DB_CONN_MAX_AGE", "60"))
+    # 빌려줄 때(풀) 또는 요청을 시작할 때 연결 상태를 확인하고 끊긴 연결은 새로 엽니다.
+    database["CONN_HEALTH_CHECKS"] = True
@@ -12,6 +12,11 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
+from config import dbmetrics
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
 
 application = get_wsgi_application()
+
+# 🌟 DB 연결 재사용 지표 수집 (/api/v1/users/db/metrics/)
+dbmetrics.install()
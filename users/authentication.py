@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+JWT 인증 + 프로세스 내 사용자 캐시
+
+simplejwt의 JWTAuthentication은 요청마다 users 테이블을 조회해 request.user를
+만듭니다. CachedJWTAuthentication은 조회한 User를 사용자 ID별로 크기 제한 LRU
+(settings.AUTH_USER_CACHE의 MAX_SIZE, TTL)에 담아 두고 다시 씁니다.
+
+여러 워커의 캐시는 캐시 백엔드(settings.CACHES)의 사용자별 버전 값으로
+무효화합니다. 프로필 수정, 비밀번호 변경, 탈퇴가 커밋되면
+invalidate_cached_user()가 버전을 올리고, 각 워커는 요청마다 버전을 한 번
+읽어 캐시 항목의 버전과 다르면 DB에서 다시 읽습니다. 버전 키가 캐시에서
+밀려나도 항목은 TTL이 지나면 사라지므로 오래된 값이 남는 시간은 TTL 이하입니다.
+버전 값을 워커끼리 볼 수 있어야 하므로 캐시 백엔드가 공유 캐시(Redis,
+settings.SHARED_CACHE)가 아니면 캐시하지 않고 요청마다 DB에서 읽습니다.
+
+aauthenticate()는 비동기 뷰(config/asyncviews.py)용 인증 경로이고,
+authenticate_credentials()는 로그인용 비동기 자격 증명 확인입니다.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from . import hashing
+
+
+def _version_key(user_id):
+    return f"auth:user-version:{user_id}"
+
+
+class _UserCache:
+    """스레드 안전한 크기 제한 LRU: user_id → (User, 버전, 만료 시각)"""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id, version):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            user, stamp, expires = entry
+            if stamp != version or expires <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return user
+
+    def put(self, user_id, version, user):
+        options = settings.AUTH_USER_CACHE
+        with self._lock:
+            self._entries[user_id] = (user, version, time.monotonic() + options["TTL"])
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > options["MAX_SIZE"]:
+                self._entries.popitem(last=False)
+
+    def discard(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+user_cache = _UserCache()
+
+
+def invalidate_cached_user(user_id):
+    """모든 워커에서 user_id의 캐시 항목이 다음 요청에 DB에서 다시 읽히게 합니다."""
+    key = _version_key(user_id)
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:  # add와 incr 사이에 키가 밀려난 경우
+        cache.set(key, 1, timeout=None)
+    user_cache.discard(str(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """User 조회 결과를 프로세스 내 LRU에 캐시하는 JWTAuthentication"""
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None or not settings.SHARED_CACHE:
+            return super().get_user(validated_token)
+
+        version = cache.get(_version_key(user_id), 0)
+        user = user_cache.get(str(user_id), version)
+        if user is None:
+            # 활성 여부/토큰 폐기 검사까지 마친 사용자만 캐시에 넣습니다.
+            user = super().get_user(validated_token)
+            user_cache.put(str(user_id), version, user)
+        else:
+            self._check_revoked(user, validated_token)
+        # 뷰가 request.user를 수정해도 캐시된 객체는 바뀌지 않도록 복사본을 넘깁니다.
+        return copy.copy(user)
+
+    async def aauthenticate(self, request):
+        """
+        authenticate()의 비동기 버전 (config.asyncviews의 비동기 디스패치용)
+
+        토큰 검증은 이벤트 루프에서 바로 하고 버전 값은 비동기 캐시 API로
+        읽습니다. 캐시 미스일 때만 sync_to_async로 get_user()를 실행해 DB에서
+        읽고 캐시에 넣습니다.
+        """
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is not None and settings.SHARED_CACHE:
+            version = await cache.aget(_version_key(user_id), 0)
+            user = user_cache.get(str(user_id), version)
+            if user is not None:
+                self._check_revoked(user, validated_token)
+                return copy.copy(user), validated_token
+        return await sync_to_async(self.get_user)(validated_token), validated_token
+
+    def _check_revoked(self, user, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                "The user's password has been changed.", code="password_changed"
+            )
+
+
+async def authenticate_credentials(email, password):
+    """
+    이메일/비밀번호가 맞는 활성 사용자를 반환합니다. (아니면 None)
+
+    ModelBackend.authenticate()와 같은 규칙이지만 해싱은 해싱 풀에서 실행하고,
+    해셔 설정이 바뀐 비밀번호는 같은 풀에서 다시 해싱해 저장합니다.
+    """
+    User = get_user_model()
+    user = await User._default_manager.filter(**{User.USERNAME_FIELD: email}).afirst()
+    # 사용자가 없어도 해셔를 한 번 실행해 응답 시간을 맞춥니다.
+    valid, must_update = await hashing.verify_password(
+        password, user.password if user is not None else ""
+    )
+    if user is None or not valid or not user.is_active:
+        return None
+    if must_update:
+        user.password = await hashing.make_password(password)
+        await user.asave(update_fields=["password"])
+        invalidate_cached_user(user.pk)
+    return user
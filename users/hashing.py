@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+비밀번호 해싱 프로세스 풀 (회원가입, 로그인, 비밀번호 변경)
+
+PBKDF2 해싱은 한 번에 수백 ms의 CPU를 씁니다. 요청 워커에서 직접 실행하면
+로그인이 몰릴 때 다른 API까지 CPU를 빼앗기므로, 워커마다 크기가 고정된
+프로세스 풀(settings.PASSWORD_HASHING["WORKERS"])에서 실행하고 비동기 뷰가
+결과를 await합니다.
+
+처리 중 + 대기 중인 작업이 WORKERS + QUEUE_SIZE에 닿으면 기다리지 않고
+HashingBusy(503, Retry-After)를 발생시킵니다. 큐 깊이, 거절 수, 지연 시간
+(대기 + 계산, 최근 LATENCY_WINDOW건)은 metrics()로 확인합니다.
+WORKERS가 0이면 프로세스 풀 대신 스레드에서 해싱합니다. (개발/테스트용)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import django
+from django.conf import settings
+from django.contrib.auth import hashers
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+logger = logging.getLogger(__name__)
+
+LATENCY_WINDOW = 1000
+
+
+class HashingBusy(APIException):
+    """해싱 대기열이 가득 찬 경우 (Retry-After 헤더와 함께 503)"""
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요."
+    default_code = "hashing_busy"
+
+    def __init__(self, wait):
+        super().__init__()
+        # DRF 예외 처리기가 wait 값으로 Retry-After 헤더를 붙입니다.
+        self.wait = wait
+
+
+# 🌟 풀 프로세스에서 실행되는 함수: (결과, 계산 시간)을 반환
+def _make_password(raw):
+    started = time.perf_counter()
+    return hashers.make_password(raw), time.perf_counter() - started
+
+
+def _verify_password(raw, encoded):
+    started = time.perf_counter()
+    return hashers.verify_password(raw, encoded), time.perf_counter() - started
+
+
+class _HashingPool:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self._samples = deque(maxlen=LATENCY_WINDOW)  # (전체 지연, 대기 시간)
+
+    def _get_executor(self, workers):
+        # gunicorn 등이 워커를 fork한 뒤에는 워커마다 자기 풀을 새로 만듭니다.
+        if self._executor is None or self._pid != os.getpid():
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context(
+                "forkserver" if "forkserver" in methods else "spawn"
+            )
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=context, initializer=django.setup
+            )
+            self._pid = os.getpid()
+        return self._executor
+
+    async def run(self, func, *args):
+        options = settings.PASSWORD_HASHING
+        workers = options["WORKERS"]
+        with self._lock:
+            if self.in_flight >= max(workers, 1) + options["QUEUE_SIZE"]:
+                self.rejected += 1
+                logger.warning("Password hashing queue full (%d).", self.in_flight)
+                raise HashingBusy(options["RETRY_AFTER"])
+            self.in_flight += 1
+            executor = self._get_executor(workers) if workers else None
+
+        started = time.perf_counter()
+        try:
+            if executor is None:
+                result, computed = await asyncio.to_thread(func, *args)
+            else:
+                result, computed = await asyncio.wrap_future(
+                    executor.submit(func, *args)
+                )
+        except BrokenProcessPool:
+            with self._lock:
+                self._executor = None  # 죽은 풀은 다음 요청에서 다시 만듭니다.
+            raise
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.completed += 1
+            self._samples.append((elapsed, max(elapsed - computed, 0.0)))
+        return result
+
+    def metrics(self):
+        options = settings.PASSWORD_HASHING
+        with self._lock:
+            samples = list(self._samples)
+            snapshot = {
+                "workers": options["WORKERS"],
+                "queue_limit": max(options["WORKERS"], 1) + options["QUEUE_SIZE"],
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+        for name, index in [("latency_ms", 0), ("queue_wait_ms", 1)]:
+            values = sorted(sample[index] * 1000 for sample in samples)
+            snapshot[name] = {
+                "p50": _percentile(values, 0.50),
+                "p95": _percentile(values, 0.95),
+                "max": values[-1] if values else None,
+            }
+        return snapshot
+
+
+def _percentile(values, fraction):
+    if not values:
+        return None
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+pool = _HashingPool()
+
+
+async def make_password(raw):
+    """raw를 settings.PASSWORD_HASHERS 기본 해셔로 해싱한 문자열을 반환합니다."""
+    return await pool.run(_make_password, raw)
+
+
+async def verify_password(raw, encoded):
+    """
+    (일치 여부, 재해싱 필요 여부)를 반환합니다.
+
+    encoded가 빈 문자열(존재하지 않는 사용자)이어도 해셔를 한 번 실행해
+    응답 시간으로 계정 존재 여부가 드러나지 않게 합니다.
+    """
+    return await pool.run(_verify_password, raw, encoded)
+
+
+def metrics():
+    return pool.metrics()
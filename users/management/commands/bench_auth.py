@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+JWT 인증 요청당 비용 벤치마크 (사용자 캐시 사용/미사용)
+
+    python manage.py bench_auth --requests 2000
+
+같은 Access 토큰으로 simplejwt의 JWTAuthentication과
+users.authentication.CachedJWTAuthentication을 번갈아 authenticate()하여
+요청당 소요 시간과 DB 쿼리 수를 비교합니다. (토큰 서명 검증 비용 포함)
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.management.commands._seed import create_bench_user
+from config.querybudget import count_queries
+from users.authentication import CachedJWTAuthentication, user_cache
+
+
+class Command(BaseCommand):
+    help = "JWT 인증의 요청당 비용을 사용자 캐시 사용/미사용으로 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000)
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        user = create_bench_user("auth")
+        try:
+            token = RefreshToken.for_user(user).access_token
+            request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+            user_cache.clear()
+            results = {}
+            for label, authenticator in [
+                ("JWTAuthentication", JWTAuthentication()),
+                ("CachedJWTAuthentication", CachedJWTAuthentication()),
+            ]:
+                authenticator.authenticate(request)  # 캐시 예열
+                results[label] = self._best(authenticator, request, options)
+        finally:
+            user.delete()
+
+        requests = options["requests"]
+        for label, (elapsed, queries) in results.items():
+            self.stdout.write(
+                f"{label:<24} requests={requests}"
+                f" per_request={elapsed / requests * 1e6:.1f}us"
+                f" queries/request={queries / requests:.2f}"
+            )
+        before, after = (elapsed for elapsed, _ in results.values())
+        self.stdout.write(f"saved/request={(before - after) / requests * 1e6:.1f}us")
+
+    def _best(self, authenticator, request, options):
+        best, queries = float("inf"), 0
+        for _ in range(options["repeat"]):
+            with count_queries() as counter:
+                started = time.perf_counter()
+                for _ in range(options["requests"]):
+                    authenticator.authenticate(request)
+                elapsed = time.perf_counter() - started
+            best, queries = min(best, elapsed), counter.count
+        return best, queries
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+만료된 Refresh 토큰(OutstandingToken/BlacklistedToken) 정리 (주기 실행용)
+
+    python manage.py purge_expired_tokens --batch-size 1000 --pause 0.05
+
+simplejwt의 flushexpiredtokens는 만료된 행을 한 번의 DELETE로 지워 큰 테이블에서
+긴 잠금을 잡습니다. 이 명령은 짧은 트랜잭션으로 나눠 지웁니다.
+(users.tokens.purge_expired_tokens)
+
+토큰 테이블은 원장 샤드에 나누지 않고 기본 DB에만 있으므로 샤드를 돌지 않습니다.
+"""
+
+from django.core.management.base import BaseCommand
+
+from users.tokens import purge_expired_tokens
+
+
+class Command(BaseCommand):
+    help = "만료된 OutstandingToken/BlacklistedToken 행을 나눠서 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--pause", type=float, default=0.0, help="배치 사이에 쉬는 시간(초)"
+        )
+
+    def handle(self, *args, **options):
+        outstanding, blacklisted = purge_expired_tokens(
+            batch_size=options["batch_size"], pause=options["pause"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"만료된 토큰 {outstanding}건 삭제 (블랙리스트 {blacklisted}건 포함)"
+            )
+        )
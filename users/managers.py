@@ -5,15 +5,21 @@ from django.contrib.auth.base_user import BaseUserManager
 class UserManager(BaseUserManager):
     use_in_migrations = True
 
-    def create_user(self, email, password=None, **extra_fields):
+    def create_user(self, email, password=None, password_hash=None, **extra_fields):
         """
         일반 유저 생성
+
+        password_hash: 해싱 풀(users/hashing.py)에서 미리 해싱한 비밀번호.
+        주어지면 password 대신 그대로 저장합니다.
         """
         if not email:
             raise ValueError("이메일은 필수 항목입니다.")
         email = self.normalize_email(email)
         user = self.model(email=email, **extra_fields)
-        user.set_password(password)
+        if password_hash is None:
+            user.set_password(password)
+        else:
+            user.password = password_hash
         user.save(using=self._db)
         return user
 
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+Refresh 토큰 폐기(블랙리스트) 확인용 Bloom 필터
+
+ROTATE_REFRESH_TOKENS + BLACKLIST_AFTER_ROTATION 설정에서는 토큰 재발급마다
+BlacklistedToken 행이 늘어나고, simplejwt는 재발급/로그아웃 때마다 블랙리스트를
+DB에서 조회합니다. 워커 프로세스마다 만료되지 않은 블랙리스트 jti의 Bloom 필터를
+두고, 필터에 없는 jti(= 폐기되지 않은 것이 확실한 토큰)는 DB를 조회하지 않습니다.
+필터에 있으면(오탐 가능) DB에서 확인합니다.
+
+필터 갱신 (설정: settings.TOKEN_REVOCATION)
+- 재구성: 처음 사용할 때와 REBUILD_INTERVAL초마다 백그라운드 스레드에서 만료되지
+  않은 블랙리스트 전체로 다시 만들어 만료된 jti를 비우고 크기를 다시 잡습니다.
+  처음 만들어지기 전에는 simplejwt와 같이 DB를 조회합니다.
+- 증분 동기화: 블랙리스트 추가가 커밋되면 revoked()가 캐시 백엔드의 버전 값을
+  올립니다. 각 워커는 확인할 때마다 버전을 한 번 읽고, 바뀌었으면 마지막으로 읽은
+  pk 이후의 행만 가져와 필터에 더합니다.
+- pk 순서와 커밋 순서는 다를 수 있으므로(먼저 번호를 받은 트랜잭션이 늦게 커밋),
+  동기화에서 건너뛴 pk는 GAP_TIMEOUT초 동안 다음 동기화 때 다시 조회합니다.
+
+버전 값으로 다른 워커의 추가를 알아야 하므로 기본 캐시가 워커 간 공유 캐시
+(Redis, settings.SHARED_CACHE)가 아니면 필터를 쓰지 않고 매번 DB를 조회합니다.
+"""
+
+import hashlib
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "auth:blacklist-version"
+
+# 재구성 시점에 아직 커밋되지 않았을 수 있다고 보는 최근 pk 개수
+REBUILD_GAP_WINDOW = 1000
+
+
+class BloomFilter:
+    """capacity개를 넣었을 때 오탐률이 error_rate가 되도록 크기를 잡은 Bloom 필터"""
+
+    def __init__(self, capacity, error_rate):
+        capacity = max(capacity, 1)
+        self.size = max(
+            math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2), 64
+        )
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self.added = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        # 🌟 128비트 해시 하나를 둘로 나눠 위치 k개를 만듭니다. (double hashing)
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, item):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.added += 1
+
+    def __contains__(self, item):
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+
+def _current_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # 키가 없거나 밀려난 경우 이전 값과 겹치지 않는 값에서 다시 시작합니다.
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+class _RevocationFilter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+        self._bloom = None
+        self._next_rebuild = 0.0  # 다음 재구성 시각(monotonic)
+        self._rebuilding = False
+        self._pending = None  # 재구성 중에 추가된 jti (새 필터에 옮겨 담습니다)
+        self._last_pk = 0
+        self._gaps = {}  # 건너뛴 pk → 다시 조회를 그만둘 시각(monotonic)
+        self._version = None
+        self.checks = 0
+        self.db_checks = 0
+        self.false_positives = 0
+
+    def is_revoked(self, jti):
+        if not settings.SHARED_CACHE:
+            # 🌟 워커별 로컬 캐시로는 다른 워커가 폐기한 토큰을 알 수 없습니다.
+            with self._lock:
+                self.checks += 1
+                self.db_checks += 1
+            return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+        self._refresh()
+        with self._lock:
+            self.checks += 1
+            filtered = self._bloom is not None
+            if filtered and jti not in self._bloom:
+                return False
+            self.db_checks += 1
+
+        revoked = BlacklistedToken.objects.filter(token__jti=jti).exists()
+        if filtered and not revoked:
+            with self._lock:
+                self.false_positives += 1
+        return revoked
+
+    def add(self, jti):
+        with self._lock:
+            self._add(jti)
+
+    def advance(self, version):
+        # 버전을 올린 것이 이 워커뿐이면 다음 확인 때 동기화하지 않아도 됩니다.
+        with self._lock:
+            if self._version is not None and version == self._version + 1:
+                self._version = version
+
+    def _add(self, jti):
+        if self._bloom is not None:
+            self._bloom.add(jti)
+        if self._pending is not None:
+            self._pending.append(jti)
+
+    def _refresh(self):
+        options = settings.TOKEN_REVOCATION
+        with self._lock:
+            start = time.monotonic() >= self._next_rebuild and not self._rebuilding
+            if start:
+                self._rebuilding = True
+            filtered = self._bloom is not None
+        if start:
+            # 🌟 재구성은 요청 밖(백그라운드 스레드)에서 합니다. 끝날 때까지는
+            # 이전 필터를, 처음 만드는 중이면 DB를 조회합니다.
+            threading.Thread(
+                target=self._rebuild_in_background,
+                name="token-revocation-rebuild",
+                daemon=True,
+            ).start()
+        if filtered:
+            version = _current_version()
+            if version != self._version:
+                self._sync(version, options)
+
+    def _rebuild_in_background(self):
+        try:
+            self.rebuild()
+        except Exception:
+            logger.exception("Token revocation filter rebuild failed.")
+        finally:
+            connections.close_all()  # 이 스레드의 연결만 닫힙니다.
+
+    def rebuild(self):
+        """만료되지 않은 블랙리스트 전체로 필터를 다시 만듭니다."""
+        options = settings.TOKEN_REVOCATION
+        with self._rebuild_lock:
+            try:
+                self._rebuild(options)
+            except Exception:
+                with self._lock:
+                    self._next_rebuild = time.monotonic() + options["GAP_TIMEOUT"]
+                raise
+            finally:
+                with self._lock:
+                    self._pending = None
+                    self._rebuilding = False
+
+    def _rebuild(self, options):
+        version = _current_version()
+        with self._lock:
+            self._pending = []
+        top = BlacklistedToken.objects.aggregate(top=Max("pk"))["top"] or 0
+        recent = set(
+            BlacklistedToken.objects.filter(
+                pk__gt=top - REBUILD_GAP_WINDOW
+            ).values_list("pk", flat=True)
+        )
+        queryset = BlacklistedToken.objects.filter(
+            pk__lte=top, token__expires_at__gt=timezone.now()
+        )
+        bloom = BloomFilter(
+            max(options["CAPACITY"], queryset.count() * 2), options["ERROR_RATE"]
+        )
+        for jti in queryset.values_list("token__jti", flat=True).iterator(
+            chunk_size=10_000
+        ):
+            bloom.add(jti)
+
+        now = time.monotonic()
+        deadline = now + options["GAP_TIMEOUT"]
+        with self._lock:
+            for jti in self._pending:
+                bloom.add(jti)
+            for pk in range(max(top - REBUILD_GAP_WINDOW, 0) + 1, top + 1):
+                if pk not in recent:
+                    self._gaps.setdefault(pk, deadline)
+            self._bloom = bloom
+            self._next_rebuild = now + options["REBUILD_INTERVAL"]
+            self._last_pk = max(self._last_pk, top)
+            self._version = version
+
+    def _sync(self, version, options):
+        with self._lock:
+            if self._bloom is None:
+                return
+            last_pk, gaps = self._last_pk, list(self._gaps)
+        rows = list(
+            BlacklistedToken.objects.filter(
+                Q(pk__gt=last_pk) | Q(pk__in=gaps)
+            ).values_list("pk", "token__jti")
+        )
+
+        now = time.monotonic()
+        deadline = now + options["GAP_TIMEOUT"]
+        with self._lock:
+            seen = set()
+            for pk, jti in rows:
+                self._add(jti)
+                seen.add(pk)
+                self._gaps.pop(pk, None)
+            top = max(seen, default=0)
+            for pk in range(self._last_pk + 1, top):
+                if pk not in seen:
+                    self._gaps[pk] = deadline
+            self._gaps = {pk: until for pk, until in self._gaps.items() if until > now}
+            self._last_pk = max(self._last_pk, top)
+            self._version = version
+
+    def metrics(self):
+        with self._lock:
+            bloom = self._bloom
+            return {
+                "checks": self.checks,
+                "db_checks": self.db_checks,
+                "false_positives": self.false_positives,
+                "size_bits": bloom.size if bloom else 0,
+                "hashes": bloom.hashes if bloom else 0,
+                "items": bloom.added if bloom else 0,
+                "last_pk": self._last_pk,
+                "gaps": len(self._gaps),
+            }
+
+
+revocation_filter = _RevocationFilter()
+
+
+def is_revoked(jti):
+    """jti가 블랙리스트에 있으면 True (필터에 없는 jti는 DB를 조회하지 않습니다)"""
+    return revocation_filter.is_revoked(jti)
+
+
+def revoked(jti):
+    """
+    jti를 블랙리스트에 추가할 때 호출합니다.
+
+    이 워커의 필터에는 바로 넣고(롤백되어도 오탐만 늘어납니다), 커밋되면 버전
+    값을 올려 다른 워커가 다음 확인 때 동기화하게 합니다.
+    """
+    revocation_filter.add(jti)
+    transaction.on_commit(_bump_version)
+
+
+def _bump_version():
+    try:
+        version = cache.incr(VERSION_KEY)
+    except ValueError:  # 키가 없거나 밀려난 경우
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        return
+    revocation_filter.advance(version)
+
+
+def rebuild():
+    """필터를 호출한 스레드에서 바로 다시 만듭니다. (관리 명령/테스트용)"""
+    revocation_filter.rebuild()
+
+
+def metrics():
+    return revocation_filter.metrics()
@@ -2,6 +2,9 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
+from rest_framework_simplejwt import serializers as jwt_serializers
+
+from .tokens import RefreshToken
 
 User = get_user_model()
 
@@ -38,9 +41,11 @@ class RegistrationSerializer(serializers.ModelSerializer):
         validated_data.pop("password2", None)
 
         # create_user를 사용하여 비밀번호를 안전하게 해싱하여 저장
+        # (RegisterView는 save(password_hash=...)로 해싱 풀의 결과를 넘깁니다)
         user = User.objects.create_user(
             email=validated_data["email"],
             password=password,
+            password_hash=validated_data.get("password_hash"),
             name=validated_data["name"],
             nickname=validated_data.get("nickname"),
             phone_number=validated_data.get("phone_number"),
@@ -64,7 +69,12 @@ class UserSerializer(serializers.ModelSerializer):
 # 3. 비밀번호 변경 Serializer
 # ====================================================================
 class PasswordChangeSerializer(serializers.Serializer):
-    """비밀번호 변경 시 현재 비밀번호와 새 비밀번호를 검증하는 serializer"""
+    """
+    비밀번호 변경 입력을 검증하는 serializer
+
+    현재 비밀번호 확인과 새 비밀번호 해싱은 CPU를 많이 쓰므로
+    PasswordChangeView가 해싱 풀(users/hashing.py)에서 처리합니다.
+    """
 
     current_password = serializers.CharField(write_only=True, required=True)
     new_password = serializers.CharField(
@@ -73,20 +83,21 @@ class PasswordChangeSerializer(serializers.Serializer):
         validators=[validate_password],  # 새 비밀번호도 유효성 검사
     )
 
-    def validate_current_password(self, value):
-        # context에서 현재 요청의 User 객체를 가져옴
-        user = self.context["request"].user
 
-        # 현재 비밀번호 일치 여부 확인
-        if not user.check_password(value):
-            raise serializers.ValidationError("현재 비밀번호가 일치하지 않습니다.")
-        return value
+# ====================================================================
+# 4. 로그인 Serializer
+# ====================================================================
+class LoginSerializer(serializers.Serializer):
+    """로그인 입력 검증 (비밀번호 확인은 뷰가 해싱 풀에서 처리)"""
 
-    def save(self, **kwargs):
-        # User 객체는 validate_current_password를 통해 이미 검증됨
-        user = self.context["request"].user
+    email = serializers.CharField(write_only=True)
+    password = serializers.CharField(write_only=True, style={"input_type": "password"})
 
-        # 새 비밀번호를 해싱하여 저장
-        user.set_password(self.validated_data["new_password"])
-        user.save()
-        return user
+
+# ====================================================================
+# 5. 토큰 재발급 Serializer
+# ====================================================================
+class TokenRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    """블랙리스트 확인을 Bloom 필터로 거르는 RefreshToken을 쓰는 재발급 serializer"""
+
+    token_class = RefreshToken
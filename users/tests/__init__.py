@@ -1,2 +1,9 @@
 # -*- coding: utf-8 -*-
-from . import test_registration_jwt, test_registration_serializer
+from . import (
+    test_authentication,
+    test_db_metrics,
+    test_hashing,
+    test_registration_jwt,
+    test_registration_serializer,
+    test_token_revocation,
+)
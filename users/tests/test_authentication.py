@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# users/tests/test_authentication.py
+
+import asyncio
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.authentication import CachedJWTAuthentication, user_cache
+
+User = get_user_model()
+
+
+def _off_loop(method):
+    """이벤트 루프 스레드에서 호출되면 실패하는 캐시 메서드"""
+
+    def inner(*args, **kwargs):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return method(*args, **kwargs)
+        raise AssertionError("이벤트 루프에서 동기 캐시 API를 호출했습니다.")
+
+    return inner
+
+
+@override_settings(SHARED_CACHE=True)
+class CachedJWTAuthenticationTest(APITestCase):
+    """요청 간 사용자 캐시 재사용과 프로필 변경 시 무효화 확인"""
+
+    def setUp(self):
+        user_cache.clear()
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="cached@user.com", password="CachedPassword1!", nickname="cached"
+        )
+        self.token = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+
+    def _authenticate(self):
+        request = APIRequestFactory().get(
+            "/", HTTP_AUTHORIZATION=f"Bearer {self.token}"
+        )
+        user, _ = CachedJWTAuthentication().authenticate(request)
+        return user
+
+    def test_second_request_reuses_cached_user(self):
+        with self.assertNumQueries(1):
+            first = self._authenticate()
+        with self.assertNumQueries(0):
+            second = self._authenticate()
+
+        self.assertEqual(second.pk, self.user.pk)
+        # 요청마다 별도 객체라 뷰가 request.user를 바꿔도 캐시에 남지 않습니다.
+        self.assertIsNot(first, second)
+
+    async def test_async_authentication_reads_cache_off_the_event_loop(self):
+        await sync_to_async(self._authenticate)()
+        request = APIRequestFactory().get(
+            "/", HTTP_AUTHORIZATION=f"Bearer {self.token}"
+        )
+        with mock.patch.object(LocMemCache, "get", _off_loop(LocMemCache.get)):
+            user, _ = await CachedJWTAuthentication().aauthenticate(request)
+        self.assertEqual(user.pk, self.user.pk)
+
+    @override_settings(SHARED_CACHE=False)
+    def test_local_cache_is_not_used_across_workers(self):
+        # 워커별 로컬 캐시로는 다른 워커의 무효화를 볼 수 없어 매번 DB를 읽습니다.
+        for _ in range(2):
+            with self.assertNumQueries(1):
+                self._authenticate()
+        self.assertNotIn(str(self.user.pk), user_cache._entries)
+
+    def test_profile_update_invalidates_cached_user(self):
+        self._authenticate()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                reverse("users:user-profile"), {"nickname": "renamed"}, format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self._authenticate().nickname, "renamed")
+
+    def test_deleted_user_is_rejected_with_same_token(self):
+        self._authenticate()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(reverse("users:account-delete"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse("users:user-profile"))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_cache_is_bounded_and_expires(self):
+        with override_settings(AUTH_USER_CACHE={"MAX_SIZE": 2, "TTL": 300}):
+            for user_id in ("1", "2", "3"):
+                user_cache.put(user_id, 0, self.user)
+            self.assertIsNone(user_cache.get("1", 0))
+            self.assertIs(user_cache.get("3", 0), self.user)
+            self.assertIsNone(user_cache.get("3", 1))  # 다른 워커가 버전을 올린 경우
+
+        with override_settings(AUTH_USER_CACHE={"MAX_SIZE": 2, "TTL": 0}):
+            user_cache.put("4", 0, self.user)
+            self.assertIsNone(user_cache.get("4", 0))
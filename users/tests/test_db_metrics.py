@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# users/tests/test_db_metrics.py
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from config import dbmetrics
+
+User = get_user_model()
+
+
+class DatabaseMetricsTest(APITestCase):
+    """요청/연결 수로 계산한 재사용률과 연결 풀 통계, 관리자 전용 조회"""
+
+    def setUp(self):
+        dbmetrics.install()
+        dbmetrics.reset()
+        self.user = User.objects.create_user(
+            email="db@user.com", password="DbPassword1!", nickname="dba"
+        )
+        self.url = reverse("users:db-metrics")
+
+    def test_reuse_ratio_without_pool(self):
+        for _ in range(4):
+            self.client.get(self.url)
+        # 요청 4건 중 1건만 새 연결을 열었다고 가정합니다.
+        wrapper = connections["default"]
+        connection_created.send(sender=type(wrapper), connection=wrapper)
+        metrics = dbmetrics.metrics()
+        self.assertEqual(metrics["requests"], 4)
+        self.assertEqual(metrics["connections"], 1)
+        self.assertEqual(metrics["reuse_ratio"], 0.75)
+        self.assertEqual(metrics["pools"], {})
+
+    def test_reuse_ratio_from_pool_stats(self):
+        pool = mock.Mock()
+        pool.get_stats.return_value = {
+            "pool_size": 4,
+            "pool_available": 3,
+            "requests_waiting": 0,
+            "requests_num": 200,
+            "connections_num": 4,
+            "requests_wait_ms": 12,
+        }
+        with mock.patch.object(
+            type(connections["default"]),
+            "pool",
+            new_callable=mock.PropertyMock,
+            return_value=pool,
+        ):
+            metrics = dbmetrics.metrics()
+        self.assertEqual(metrics["reuse_ratio"], 0.98)
+        self.assertEqual(
+            metrics["pools"]["default"],
+            {
+                "checkouts": 200,
+                "opened": 4,
+                "reuse_ratio": 0.98,
+                "pool_size": 4,
+                "pool_available": 3,
+                "requests_waiting": 0,
+                "wait_ms": 12,
+                "errors": 0,
+            },
+        )
+
+    def test_metrics_are_admin_only(self):
+        self.client.force_authenticate(self.user)
+        self.assertEqual(
+            self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN
+        )
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(response.data), {"requests", "connections", "reuse_ratio", "pools"}
+        )
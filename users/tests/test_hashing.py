@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# users/tests/test_hashing.py
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from users import hashing
+
+User = get_user_model()
+
+
+class PasswordHashingPoolTest(APITestCase):
+    """로그인/비밀번호 변경의 해싱 풀 경로, 대기열 포화 시 503, 지표 확인"""
+
+    def setUp(self):
+        self.LOGIN_URL = reverse("users:token_obtain_pair")
+        self.user = User.objects.create_user(
+            email="hash@user.com", password="HashPassword1!", nickname="hasher"
+        )
+
+    def _login(self, email="hash@user.com", password="HashPassword1!"):
+        return self.client.post(
+            self.LOGIN_URL, {"email": email, "password": password}, format="json"
+        )
+
+    def test_login_rejects_wrong_or_unknown_credentials(self):
+        completed = hashing.metrics()["completed"]
+        for email, password in [
+            ("hash@user.com", "WrongPassword1!"),
+            ("nobody@user.com", "HashPassword1!"),
+        ]:
+            with self.subTest(email=email):
+                response = self._login(email, password)
+                self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+                self.assertEqual(response.data["detail"].code, "no_active_account")
+        # 없는 사용자도 해셔를 한 번 실행합니다.
+        self.assertEqual(hashing.metrics()["completed"], completed + 2)
+
+    async def test_login_under_asgi_handler(self):
+        # AsyncClient는 ASGI 핸들러와 비동기 미들웨어 체인으로 요청을 보냅니다.
+        response = await self.async_client.post(
+            self.LOGIN_URL,
+            {"email": "hash@user.com", "password": "HashPassword1!"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.json())
+
+    @override_settings(
+        PASSWORD_HASHING={"WORKERS": 0, "QUEUE_SIZE": 0, "RETRY_AFTER": 3}
+    )
+    def test_full_queue_returns_503_with_retry_after(self):
+        rejected = hashing.metrics()["rejected"]
+        with (
+            mock.patch.object(hashing.pool, "in_flight", 1),
+            self.assertLogs("users.hashing", "WARNING"),
+        ):
+            response = self._login()
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response["Retry-After"], "3")
+        self.assertEqual(hashing.metrics()["rejected"], rejected + 1)
+
+    def test_password_change_verifies_and_hashes_in_pool(self):
+        access = self._login().data["access"]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        url = reverse("users:password-change")
+
+        response = self.client.post(
+            url,
+            {"current_password": "WrongPassword1!", "new_password": "NewHashPass2@"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("current_password", response.data)
+
+        response = self.client.post(
+            url,
+            {"current_password": "HashPassword1!", "new_password": "NewHashPass2@"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("NewHashPass2@"))
+
+    def test_metrics_are_admin_only(self):
+        url = reverse("users:hashing-metrics")
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(response.data),
+            {
+                "workers",
+                "queue_limit",
+                "in_flight",
+                "completed",
+                "rejected",
+                "latency_ms",
+                "queue_wait_ms",
+            },
+        )
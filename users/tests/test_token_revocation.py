@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# users/tests/test_token_revocation.py
+
+import io
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from users import revocation
+from users.tokens import RefreshToken, purge_expired_tokens
+
+User = get_user_model()
+
+
+class BloomFilterTest(APITestCase):
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        bloom = revocation.BloomFilter(1000, 0.01)
+        added = [uuid.uuid4().hex for _ in range(1000)]
+        for jti in added:
+            bloom.add(jti)
+        self.assertTrue(all(jti in bloom for jti in added))
+        false_positives = sum(uuid.uuid4().hex in bloom for _ in range(2000))
+        self.assertLess(false_positives, 60)
+
+
+@override_settings(SHARED_CACHE=True)
+class TokenRevocationTest(APITestCase):
+    """블랙리스트 확인의 필터 경로, 다른 워커의 추가 반영, 만료 토큰 정리"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="revoke@user.com", password="RevokePassword1!", nickname="revoke"
+        )
+        revocation.rebuild()
+
+    def _blacklist_elsewhere(self, expires_in=timedelta(days=1)):
+        # 다른 워커가 블랙리스트에 추가한 것처럼 행만 만들고 필터엔 넣지 않습니다.
+        token = OutstandingToken.objects.create(
+            user=self.user,
+            jti=uuid.uuid4().hex,
+            token="",
+            expires_at=timezone.now() + expires_in,
+        )
+        return BlacklistedToken.objects.create(token=token)
+
+    def test_rotated_token_is_rejected_without_db_lookup_for_fresh_tokens(self):
+        refresh = str(RefreshToken.for_user(self.user))
+        url = reverse("token_refresh")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, {"refresh": refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rotated = RefreshToken(response.data["refresh"])
+
+        # 재발급으로 블랙리스트에 들어간 토큰은 다시 쓸 수 없습니다.
+        response = self.client.post(url, {"refresh": refresh}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        # 새로 발급된 토큰은 필터에 없으므로 DB를 조회하지 않습니다.
+        with self.assertNumQueries(0):
+            self.assertFalse(revocation.is_revoked(rotated["jti"]))
+
+    def test_other_workers_blacklist_is_synced_by_version(self):
+        blacklisted = self._blacklist_elsewhere()
+        jti = blacklisted.token.jti
+        # 버전이 그대로면 이 워커는 아직 모릅니다.
+        self.assertFalse(revocation.is_revoked(jti))
+
+        cache.incr(revocation.VERSION_KEY)
+        self.assertTrue(revocation.is_revoked(jti))
+
+    @override_settings(SHARED_CACHE=False)
+    def test_local_cache_checks_database_every_time(self):
+        # 버전 값을 워커끼리 볼 수 없으면 다른 워커의 추가도 바로 DB에서 확인합니다.
+        jti = self._blacklist_elsewhere().token.jti
+        with self.assertNumQueries(1):
+            self.assertTrue(revocation.is_revoked(jti))
+        with self.assertNumQueries(1):
+            self.assertFalse(revocation.is_revoked(uuid.uuid4().hex))
+
+    def test_late_commit_below_watermark_is_picked_up(self):
+        _, late, last = (self._blacklist_elsewhere() for _ in range(3))
+        late_pk, late_token = late.pk, late.token
+        late.delete()  # 아직 커밋되지 않은 행 흉내
+        cache.incr(revocation.VERSION_KEY)
+        self.assertTrue(revocation.is_revoked(last.token.jti))
+
+        BlacklistedToken.objects.create(pk=late_pk, token=late_token)
+        cache.incr(revocation.VERSION_KEY)
+        self.assertTrue(revocation.is_revoked(late_token.jti))
+
+    def test_purge_deletes_expired_rows_in_batches(self):
+        for _ in range(3):
+            self._blacklist_elsewhere(expires_in=timedelta(days=-1))
+        live = self._blacklist_elsewhere()
+        OutstandingToken.objects.create(
+            jti=uuid.uuid4().hex, token="", expires_at=timezone.now() - timedelta(1)
+        )
+
+        self.assertEqual(purge_expired_tokens(batch_size=2), (4, 3))
+        self.assertEqual(list(OutstandingToken.objects.all()), [live.token])
+        self.assertTrue(BlacklistedToken.objects.filter(pk=live.pk).exists())
+
+        call_command("purge_expired_tokens", stdout=io.StringIO())
+        self.assertEqual(OutstandingToken.objects.count(), 1)
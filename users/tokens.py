@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+블랙리스트 확인을 Bloom 필터(users/revocation.py)로 거르는 RefreshToken과
+만료된 토큰 행 정리
+"""
+
+import time
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from . import revocation
+
+
+class RefreshToken(tokens.RefreshToken):
+    """simplejwt RefreshToken과 같고, 블랙리스트 조회만 필터를 먼저 거칩니다."""
+
+    def check_blacklist(self):
+        if revocation.is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        result = super().blacklist()
+        revocation.revoked(self.payload[api_settings.JTI_CLAIM])
+        return result
+
+
+def purge_expired_tokens(batch_size=1000, pause=0.0):
+    """
+    만료된 OutstandingToken과 연결된 BlacklistedToken을 batch_size개씩 지우고
+    지운 (OutstandingToken, BlacklistedToken) 개수를 반환합니다.
+
+    배치마다 짧은 트랜잭션에서 pk 순서로 SKIP LOCKED 잠금을 잡고 지우므로,
+    로그아웃/재발급 요청이 잡고 있는 행은 건너뛰고 요청도 정리를 기다리지
+    않습니다. pause초씩 쉬어 I/O와 복제 부하를 나눕니다.
+    """
+    expired_before = timezone.now()
+    outstanding = blacklisted = 0
+    cursor = 0
+    while True:
+        with transaction.atomic():
+            ids = list(
+                OutstandingToken.objects.filter(
+                    pk__gt=cursor, expires_at__lte=expired_before
+                )
+                .order_by("pk")
+                .select_for_update(skip_locked=True)
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                return outstanding, blacklisted
+            # 연결된 BlacklistedToken은 CASCADE로 같은 트랜잭션에서 지워집니다.
+            _, counts = OutstandingToken.objects.filter(pk__in=ids).delete()
+        outstanding += counts.get(OutstandingToken._meta.label, 0)
+        blacklisted += counts.get(BlacklistedToken._meta.label, 0)
+        cursor = ids[-1]
+        if pause:
+            time.sleep(pause)
@@ -3,7 +3,9 @@ from django.urls import path
 
 from .views import (
     CookieTokenObtainPairView,
+    DatabaseMetricsView,
     DeleteAccountView,
+    HashingMetricsView,
     LogoutView,
     MyProfileView,
     PasswordChangeView,
@@ -23,4 +25,7 @@ urlpatterns = [
     path("me/", MyProfileView.as_view(), name="user-profile"),
     path("me/password/", PasswordChangeView.as_view(), name="password-change"),
     path("me/delete/", DeleteAccountView.as_view(), name="account-delete"),
+    # 운영 지표 (관리자 전용)
+    path("hashing/metrics/", HashingMetricsView.as_view(), name="hashing-metrics"),
+    path("db/metrics/", DatabaseMetricsView.as_view(), name="db-metrics"),
 ]
@@ -1,20 +1,38 @@
 # -*- coding: utf-8 -*-
 # users/views.py
 
+from functools import partial
+
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from rest_framework import generics, status
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from django.contrib.auth.models import update_last_login
+from django.db import transaction
+from rest_framework import generics, serializers, status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework_simplejwt.views import TokenObtainPairView
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenObtainSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from config import dbmetrics
+from config.asyncviews import AsyncAPIView
+from config.querybudget import query_budget
+
+from . import hashing
+from .authentication import authenticate_credentials, invalidate_cached_user
 
 # users/serializers.py에서 정의한 시리얼라이저를 임포트
 from .serializers import (
+    LoginSerializer,
     PasswordChangeSerializer,
     RegistrationSerializer,
     UserSerializer,
 )
+from .tokens import RefreshToken
 
 # 🌟 설정 변수 참조를 SIMPLE_JWT 딕셔너리 내부로 변경
 REFRESH_TOKEN_COOKIE_NAME = settings.SIMPLE_JWT["REFRESH_TOKEN_COOKIE_NAME"]
@@ -29,19 +47,28 @@ REFRESH_TOKEN_COOKIE_SAMESITE = settings.SIMPLE_JWT["REFRESH_TOKEN_COOKIE_SAMESI
 
 
 # 1-1. 회원가입: 사용자 생성 및 Refresh 토큰을 HttpOnly 쿠키에 설정
-class RegisterView(generics.CreateAPIView):
+@query_budget(POST=6)  # +2: 원장 샤드 배치 (accounts/sharding.py)
+class RegisterView(AsyncAPIView):
     """
     회원가입 API: 사용자 생성 후 Refresh 토큰을 HttpOnly 쿠키에 설정
+    (비밀번호 해싱은 해싱 프로세스 풀에서 실행하고 await)
     """
 
     serializer_class = RegistrationSerializer
     permission_classes = [AllowAny]
     authentication_classes = []
 
-    def create(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        user = serializer.save()
+    async def post(self, request):
+        serializer = self.serializer_class(data=request.data)
+        # 이메일/닉네임 중복 검사가 DB를 조회하므로 스레드에서 검증
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        password_hash = await hashing.make_password(
+            serializer.validated_data["password"]
+        )
+        return await sync_to_async(self._create)(serializer, password_hash)
+
+    def _create(self, serializer, password_hash):
+        user = serializer.save(password_hash=password_hash)
 
         # 1. JWT 토큰 발급
         refresh = RefreshToken.for_user(user)
@@ -78,39 +105,60 @@ class RegisterView(generics.CreateAPIView):
         return response
 
 
-# 1-2. 로그인: SimpleJWT의 기본 뷰를 상속받아 Refresh 토큰을 HttpOnly 쿠키에 설정
-class CookieTokenObtainPairView(TokenObtainPairView):
+# 1-2. 로그인: SimpleJWT와 같은 토큰을 발급하고 Refresh 토큰을 HttpOnly 쿠키에 설정
+@query_budget(POST=2)
+class CookieTokenObtainPairView(AsyncAPIView):
     """
     로그인 API: 인증 성공 시 access/refresh 토큰 발급.
     Refresh 토큰은 HttpOnly 쿠키에 저장.
+    비밀번호 확인은 해싱 프로세스 풀에서 실행하고 await합니다.
     """
 
+    serializer_class = LoginSerializer
     permission_classes = [AllowAny]
+    authentication_classes = []
+    www_authenticate_realm = "api"
+
+    def get_authenticate_header(self, request):
+        # 인증 클래스가 없어도 로그인 실패는 401 (SimpleJWT TokenViewBase와 동일)
+        header_type = jwt_settings.AUTH_HEADER_TYPES[0]
+        return f'{header_type} realm="{self.www_authenticate_realm}"'
 
-    def post(self, request, *args, **kwargs):
-        # 부모 클래스의 post 메서드를 실행하여 access/refresh 토큰을 얻음
-        resp = super().post(request, *args, **kwargs)
-
-        if resp.status_code == 200:
-            refresh = resp.data.get("refresh")
-            if refresh:
-                # Refresh 토큰을 HttpOnly 쿠키에 설정
-                resp.set_cookie(
-                    REFRESH_TOKEN_COOKIE_NAME,  # 👈 수정된 변수 사용
-                    refresh,
-                    httponly=REFRESH_TOKEN_COOKIE_HTTPONLY,  # 👈 수정된 변수 사용
-                    secure=REFRESH_TOKEN_COOKIE_SECURE,  # 👈 수정된 변수 사용
-                    samesite=REFRESH_TOKEN_COOKIE_SAMESITE,  # 👈 수정된 변수 사용
-                    max_age=int(
-                        settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"].total_seconds()
-                    ),
-                )
-                # 바디에서 refresh 토큰을 제거하여 클라이언트 노출 방지
-                resp.data.pop("refresh", None)
+    async def post(self, request):
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = await authenticate_credentials(**serializer.validated_data)
+        if user is None:
+            # SimpleJWT TokenObtainPairView와 같은 401 응답
+            raise AuthenticationFailed(
+                TokenObtainSerializer.default_error_messages["no_active_account"],
+                "no_active_account",
+            )
+        return await sync_to_async(self._issue_tokens)(user)
+
+    def _issue_tokens(self, user):
+        refresh = TokenObtainPairSerializer.get_token(user)
+        if jwt_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, user)
+
+        # 바디에는 access 토큰만 담아 refresh 토큰의 클라이언트 노출 방지
+        resp = Response(
+            {"access": str(refresh.access_token)}, status=status.HTTP_200_OK
+        )
+        # Refresh 토큰을 HttpOnly 쿠키에 설정
+        resp.set_cookie(
+            REFRESH_TOKEN_COOKIE_NAME,  # 👈 수정된 변수 사용
+            str(refresh),
+            httponly=REFRESH_TOKEN_COOKIE_HTTPONLY,  # 👈 수정된 변수 사용
+            secure=REFRESH_TOKEN_COOKIE_SECURE,  # 👈 수정된 변수 사용
+            samesite=REFRESH_TOKEN_COOKIE_SAMESITE,  # 👈 수정된 변수 사용
+            max_age=int(settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"].total_seconds()),
+        )
         return resp
 
 
 # 1-3. 로그아웃: Refresh 토큰 블랙리스트 추가 및 쿠키 삭제
+@query_budget(POST=8)
 class LogoutView(APIView):
     """
     로그아웃 API: HttpOnly 쿠키의 Refresh 토큰을 블랙리스트에 추가하고 쿠키 삭제.
@@ -149,6 +197,7 @@ class LogoutView(APIView):
 
 
 # 2-1. 프로필 조회 및 수정
+@query_budget(GET=1, PUT=3, PATCH=3)
 class MyProfileView(generics.RetrieveUpdateAPIView):
     """
     현재 인증된 사용자의 정보를 조회(GET) 및 수정(PUT/PATCH)
@@ -161,36 +210,61 @@ class MyProfileView(generics.RetrieveUpdateAPIView):
         # 요청한 사용자 본인의 정보를 반환
         return self.request.user
 
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        # 🌟 커밋 후 모든 워커의 인증 사용자 캐시를 무효화
+        transaction.on_commit(partial(invalidate_cached_user, serializer.instance.pk))
+
 
 # 2-2. 비밀번호 변경
-class PasswordChangeView(APIView):
+@query_budget(POST=9)
+class PasswordChangeView(AsyncAPIView):
     """
     비밀번호 변경 API: 현재 비밀번호 확인 후 새 비밀번호로 변경
+    (확인과 해싱은 해싱 프로세스 풀에서 실행하고 await)
     """
 
     permission_classes = [IsAuthenticated]
     serializer_class = PasswordChangeSerializer
 
-    def post(self, request):
+    async def post(self, request):
         serializer = self.serializer_class(
             data=request.data, context={"request": request}
         )
         serializer.is_valid(raise_exception=True)
 
-        # 시리얼라이저의 save() 메서드에서 set_password 처리
-        serializer.save()
+        # 현재 비밀번호 일치 여부 확인
+        valid, _ = await hashing.verify_password(
+            serializer.validated_data["current_password"], request.user.password
+        )
+        if not valid:
+            raise serializers.ValidationError({
+                "current_password": ["현재 비밀번호가 일치하지 않습니다."]
+            })
 
-        # 비밀번호 변경 후 강제 로그아웃 (선택 사항이지만 보안상 권장)
-        # 로그아웃 뷰의 로직을 재사용하여 토큰 블랙리스트 처리 및 쿠키 삭제
-        LogoutView().post(request)
+        password_hash = await hashing.make_password(
+            serializer.validated_data["new_password"]
+        )
+        await sync_to_async(self._change_password)(request, password_hash)
 
         return Response(
             {"detail": "Password changed successfully. Please log in again."},
             status=status.HTTP_200_OK,
         )
 
+    def _change_password(self, request, password_hash):
+        user = request.user
+        user.password = password_hash
+        user.save()
+        transaction.on_commit(partial(invalidate_cached_user, user.pk))
+
+        # 비밀번호 변경 후 강제 로그아웃 (선택 사항이지만 보안상 권장)
+        # 로그아웃 뷰의 로직을 재사용하여 토큰 블랙리스트 처리 및 쿠키 삭제
+        LogoutView().post(request)
+
 
 # 2-3. 회원 탈퇴 (Soft Delete)
+@query_budget(DELETE=9)
 class DeleteAccountView(APIView):
     """
     회원 탈퇴 API: 사용자 계정을 비활성화 (Soft Delete) 처리
@@ -204,6 +278,7 @@ class DeleteAccountView(APIView):
         # 1. Soft Delete: is_active 필드를 False로 변경
         user.is_active = False
         user.save()
+        transaction.on_commit(partial(invalidate_cached_user, user.pk))
 
         # 2. 토큰 블랙리스트 처리 및 쿠키 삭제 (로그아웃 처리)
         refresh_token = request.COOKIES.get(
@@ -220,3 +295,34 @@ class DeleteAccountView(APIView):
         )
         resp.delete_cookie(REFRESH_TOKEN_COOKIE_NAME)  # 👈 수정된 변수 사용
         return resp
+
+
+# ====================================================================
+# 3. 운영 지표
+# ====================================================================
+
+
+# 3-1. 비밀번호 해싱 풀 지표 (요청을 받은 워커 프로세스 기준)
+@query_budget(GET=1)
+class HashingMetricsView(APIView):
+    """
+    관리자 전용: 해싱 대기열 깊이, 거절 수, 지연 시간(p50/p95/max)
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(hashing.metrics())
+
+
+# 3-2. DB 연결 재사용 지표 (요청을 받은 워커 프로세스 기준, config/dbmetrics.py)
+@query_budget(GET=1)
+class DatabaseMetricsView(APIView):
+    """
+    관리자 전용: 요청 수, DB 연결 수, 연결 재사용률, 연결 풀 상태
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(dbmetrics.metrics())